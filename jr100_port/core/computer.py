@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import time
-from typing import List, Optional, Protocol
+from typing import Callable, List, Optional, Protocol, Tuple
 
 from .event_queue import EventQueue, PauseEvent, PowerOffEvent, ResetEvent, ResumeEvent
 from .hardware import Hardware
@@ -52,6 +52,11 @@ class Computer:
         self._cpu: Optional[CpuLike] = None
         self._hardware = Hardware()
         self._devices: List[DeviceLike] = []
+        # Bound per-device hooks resolved once in addDevice.  Kept as tuples
+        # (rebuilt on the rare addDevice) for the cheapest per-slice iteration.
+        self._device_execute: Tuple[Callable[[], None], ...] = ()
+        self._device_save: Tuple[Callable[[object], None], ...] = ()
+        self._device_load: Tuple[Callable[[object], None], ...] = ()
         self._event_queue = EventQueue()
         self._time_manager = TimeManager()
         self._running_status = self.STATUS_STOPPED
@@ -84,6 +89,15 @@ class Computer:
 
     def addDevice(self, device: DeviceLike) -> None:  # noqa: N802
         self._devices.append(device)
+        execute = getattr(device, "execute", None)
+        if execute is not None:
+            self._device_execute += (execute,)
+        save = getattr(device, "saveState", None)
+        if save is not None:
+            self._device_save += (save,)
+        load = getattr(device, "loadState", None)
+        if load is not None:
+            self._device_load += (load,)
 
     def getEventQueue(self) -> EventQueue:  # noqa: N802
         return self._event_queue
@@ -119,6 +133,9 @@ class Computer:
         self.clockCount = 0
         self._clock_adjustment = 0
         self._base_time_ns = time.perf_counter_ns()
+        # Events left over from the previous session (e.g. a reset queued
+        # behind a power-off) must not outlive it.
+        self._event_queue.clear()
         self._event_queue.add(ResetEvent(self.clockCount))
 
     def powerOff(self) -> None:  # noqa: N802
@@ -140,38 +157,50 @@ class Computer:
     # Execution helpers
 
     def runFrame(self) -> None:  # noqa: N802
-        if self._running_status == self.STATUS_STOPPED:
+        self._time_manager.dispatcher()
+        status = self._running_status
+        if status == self.STATUS_STOPPED:
             return
-        interval = self._interval_clocks if self._running_status == self.STATUS_RUNNING else 0
+        # clockCount stays absolute: VIA timers, the beeper and queued events
+        # all hold clock values on the same timeline.
+        interval = self._interval_clocks if status == self.STATUS_RUNNING else 0
         end_clock = self.clockCount + interval - self._clock_adjustment
         self._process_events(end_clock)
         if self._running_status == self.STATUS_RUNNING:
             self._clock_adjustment = self._execute_if_possible(end_clock - self.clockCount)
-        display = self._hardware.getDisplay()
-        if display is not None and hasattr(display, "refresh"):
-            display.refresh()
+        refresh = self._hardware.getDisplayRefresh()
+        if refresh is not None:
+            refresh()
 
     def _process_events(self, end_clock: int) -> None:
-        while not self._event_queue.isEmpty() and self._event_queue.first().clock <= end_clock:
-            event = self._event_queue.pop_first()
-            delta = max(0, event.clock - self.clockCount)
-            self._clock_adjustment = self._execute_if_possible(delta)
+        queue = self._event_queue
+        entries = queue._entries  # heap head is always live; see EventQueue
+        pop_first = queue.pop_first
+        execute_if_possible = self._execute_if_possible
+        running = self.STATUS_RUNNING
+        while entries and entries[0].clock <= end_clock:
+            event = pop_first()
+            delta = event.clock - self.clockCount
+            self._clock_adjustment = execute_if_possible(delta) if delta > 0 else 0
             event.dispatch(self)
-            if self._running_status != self.STATUS_RUNNING:
+            if self._running_status != running:
                 break
 
     def _execute_if_possible(self, clocks: int) -> int:
         if clocks <= 0 or self._running_status != self.STATUS_RUNNING:
             return 0
-        if self._cpu is None:
+        cpu = self._cpu
+        if cpu is None:
             raise RuntimeError("CPU not attached")
-        leftover = self._cpu.execute(clocks)
+        leftover = cpu.execute(clocks)
         consumed = clocks - leftover
         if consumed < 0:
             raise ValueError("execute returned more than requested")
+        # Devices read the clock through getClockCount(), so it is published
+        # before they run rather than kept in a local.
         self.clockCount += consumed
-        for device in self._devices:
-            device.execute()
+        for execute in self._device_execute:
+            execute()
         return leftover
 
     # ------------------------------------------------------------------
@@ -181,17 +210,15 @@ class Computer:
         if self._cpu is not None:
             self._cpu.saveState(state_set)
         self._hardware.saveState(state_set)
-        for device in self._devices:
-            if hasattr(device, "saveState"):
-                device.saveState(state_set)
+        for save in self._device_save:
+            save(state_set)
 
     def loadState(self, state_set) -> None:  # noqa: N802
         if self._cpu is not None:
             self._cpu.loadState(state_set)
         self._hardware.loadState(state_set)
-        for device in self._devices:
-            if hasattr(device, "loadState"):
-                device.loadState(state_set)
+        for load in self._device_load:
+            load(state_set)
 
 
 __all__ = ["Computer", "CpuLike", "DeviceLike"]
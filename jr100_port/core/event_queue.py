@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import itertools
-from bisect import insort
 from dataclasses import dataclass, field
-from typing import Iterator, List, Optional, Protocol, Tuple, TYPE_CHECKING
+from heapq import heappop, heappush
+from typing import ClassVar, Dict, Iterator, List, Optional, Protocol, Set, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .computer import Computer
@@ -22,25 +22,40 @@ class EmulatorEvent(Protocol):
 
 @dataclass(order=True)
 class _QueueEntry:
-    sort_key: Tuple[int, int] = field(init=False, repr=False)
     clock: int
     sequence: int
-    event: EmulatorEvent
-
-    def __post_init__(self) -> None:
-        self.sort_key = (self.clock, self.sequence)
+    event: Optional[EmulatorEvent] = field(compare=False)
 
 
 class EventQueue:
-    """Sorted event queue equivalent to the Java TreeSet variant."""
+    """Sorted event queue equivalent to the Java TreeSet variant.
+
+    Entries live in a binary heap ordered by ``(clock, sequence)``.  Removed
+    events are tombstoned (``entry.event = None``) and discarded lazily; the
+    head of the heap is always kept live so ``first`` stays O(1).  Live
+    entries are indexed by ``id(event)`` so ``remove`` does not scan.
+
+    Events with a ``dedupe_key`` are dropped while another event with the
+    same key is still pending for the same clock.
+    """
 
     def __init__(self) -> None:
         self._entries: List[_QueueEntry] = []
+        self._live: Dict[int, List[_QueueEntry]] = {}
+        self._pending_kinds: Set[Tuple[str, int]] = set()
         self._sequence = itertools.count()
 
     def add(self, event: EmulatorEvent) -> None:
-        entry = _QueueEntry(clock=max(0, int(event.clock)), sequence=next(self._sequence), event=event)
-        insort(self._entries, entry)
+        clock = max(0, int(event.clock))
+        kind = getattr(event, "dedupe_key", None)
+        if kind is not None:
+            pending = (kind, clock)
+            if pending in self._pending_kinds:
+                return
+            self._pending_kinds.add(pending)
+        entry = _QueueEntry(clock=clock, sequence=next(self._sequence), event=event)
+        heappush(self._entries, entry)
+        self._live.setdefault(id(event), []).append(entry)
 
     def first(self) -> EmulatorEvent:
         if not self._entries:
@@ -50,21 +65,47 @@ class EventQueue:
     def pop_first(self) -> EmulatorEvent:
         if not self._entries:
             raise IndexError("event queue is empty")
-        entry = self._entries.pop(0)
-        return entry.event
+        entry = heappop(self._entries)
+        event = entry.event
+        self._forget(event, entry)
+        self._discard_removed()
+        return event
 
     def remove(self, event: EmulatorEvent) -> None:
-        for index, entry in enumerate(self._entries):
-            if entry.event is event:
-                del self._entries[index]
-                return
-        raise ValueError("event not found")
+        candidates = self._live.get(id(event))
+        if not candidates:
+            raise ValueError("event not found")
+        entry = min(candidates)
+        self._forget(event, entry)
+        entry.event = None
+        self._discard_removed()
 
     def isEmpty(self) -> bool:  # noqa: N802 - Java互換API
         return not self._entries
 
+    def clear(self) -> None:
+        self._entries.clear()
+        self._live.clear()
+        self._pending_kinds.clear()
+
     def __iter__(self) -> Iterator[EmulatorEvent]:
-        return (entry.event for entry in list(self._entries))
+        return (entry.event for entry in sorted(self._entries) if entry.event is not None)
+
+    def _forget(self, event: EmulatorEvent, entry: _QueueEntry) -> None:
+        kind = getattr(event, "dedupe_key", None)
+        if kind is not None:
+            self._pending_kinds.discard((kind, entry.clock))
+        key = id(event)
+        candidates = self._live[key]
+        if len(candidates) == 1:
+            del self._live[key]
+        else:
+            candidates.remove(entry)
+
+    def _discard_removed(self) -> None:
+        entries = self._entries
+        while entries and entries[0].event is None:
+            heappop(entries)
 
 
 @dataclass
@@ -73,11 +114,17 @@ class BaseEvent:
 
     clock: int
 
+    # Events sharing a non-None key and a clock are coalesced while one is
+    # pending.
+    dedupe_key: ClassVar[Optional[str]] = None
+
     def dispatch(self, computer: "Computer") -> None:  # pragma: no cover - overridden
         raise NotImplementedError
 
 
 class ResetEvent(BaseEvent):
+    dedupe_key = "reset"
+
     def dispatch(self, computer: "Computer") -> None:
         cpu = computer.getCPU()
         if cpu is not None:
@@ -88,16 +135,22 @@ class ResetEvent(BaseEvent):
 
 
 class PauseEvent(BaseEvent):
+    dedupe_key = "pause"
+
     def dispatch(self, computer: "Computer") -> None:
         computer.setRunningStatus(computer.STATUS_PAUSED)
 
 
 class ResumeEvent(BaseEvent):
+    dedupe_key = "resume"
+
     def dispatch(self, computer: "Computer") -> None:
         computer.setRunningStatus(computer.STATUS_RUNNING)
 
 
 class PowerOffEvent(BaseEvent):
+    dedupe_key = "power_off"
+
     def dispatch(self, computer: "Computer") -> None:
         computer.setRunningStatus(computer.STATUS_STOPPED)
 
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable, Optional
 
 from .memory import MemorySystem
 
@@ -13,28 +13,39 @@ class Hardware:
     def __init__(self) -> None:
         self._memory = MemorySystem()
         self._display: Any = None
+        self._display_refresh: Optional[Callable[[], None]] = None
         self._sound_processor: Any = None
         self._keyboard: Any = None
         self._gamepad: Any = None
         self._application: Any = None
+        self._state_savers: tuple[Callable[[Any], None], ...] = ()
+        self._state_loaders: tuple[Callable[[Any], None], ...] = ()
 
     def getMemory(self) -> MemorySystem:  # noqa: N802
         return self._memory
 
     def setDisplay(self, display: Any) -> None:  # noqa: N802
         self._display = display
+        self._refresh_stateful_components()
+        self._display_refresh = getattr(display, "refresh", None)
 
     def getDisplay(self) -> Any:  # noqa: N802
         return self._display
 
+    def getDisplayRefresh(self) -> Optional[Callable[[], None]]:  # noqa: N802
+        """Bound ``display.refresh`` resolved at ``setDisplay`` time, if any."""
+        return self._display_refresh
+
     def setSoundProcessor(self, sound: Any) -> None:  # noqa: N802
         self._sound_processor = sound
+        self._refresh_stateful_components()
 
     def getSoundProcessor(self) -> Any:  # noqa: N802
         return self._sound_processor
 
     def setKeyboard(self, keyboard: Any) -> None:  # noqa: N802
         self._keyboard = keyboard
+        self._refresh_stateful_components()
 
     def getKeyboard(self) -> Any:  # noqa: N802
         return self._keyboard
@@ -51,21 +62,24 @@ class Hardware:
     def getApplication(self) -> Any:  # noqa: N802
         return self._application
 
+    def _refresh_stateful_components(self) -> None:
+        components = [c for c in (self._display, self._sound_processor, self._keyboard) if c is not None]
+        self._state_savers = tuple(c.saveState for c in components if hasattr(c, "saveState"))
+        self._state_loaders = tuple(c.loadState for c in components if hasattr(c, "loadState"))
+
     def saveState(self, state_set: Any) -> None:  # noqa: N802
         for memory in self._memory.getMemories():
             if hasattr(memory, "saveState"):
                 memory.saveState(state_set)
-        for component in (self._display, self._sound_processor, self._keyboard):
-            if component is not None and hasattr(component, "saveState"):
-                component.saveState(state_set)
+        for save in self._state_savers:
+            save(state_set)
 
     def loadState(self, state_set: Any) -> None:  # noqa: N802
         for memory in self._memory.getMemories():
             if hasattr(memory, "loadState"):
                 memory.loadState(state_set)
-        for component in (self._display, self._sound_processor, self._keyboard):
-            if component is not None and hasattr(component, "loadState"):
-                component.loadState(state_set)
+        for load in self._state_loaders:
+            load(state_set)
 
 
 __all__ = ["Hardware"]
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, MutableSequence, Protocol, Type, TypeVar
+import struct
+from typing import Callable, Dict, Iterable, List, Protocol, Type, TypeVar
+
+
+_U16_BE = struct.Struct(">H")
 
 
 class Addressable(Protocol):
@@ -28,7 +32,14 @@ class Addressable(Protocol):
 
 
 class UnmappedMemory:
-    """Default memory region used to back unassigned address space."""
+    """Default memory region used to back unassigned address space.
+
+    Reads return 0; the 0xAA probe byte at 0xD000 is served by a separate
+    ``_D000Stub`` installed by ``MemorySystem.allocateSpace``.
+    """
+
+    direct_load = True
+    direct_store = False
 
     def __init__(self, start: int, length: int) -> None:
         self._start = start & 0xFFFF
@@ -40,51 +51,222 @@ class UnmappedMemory:
     def getEndAddress(self) -> int:  # noqa: N802 - Java互換API
         return (self._start + self._length - 1) & 0xFFFF
 
-    def load8(self, address: int) -> int:
-        return 0xAA if (address & 0xFFFF) == 0xD000 else 0x00
+    def bind_storage(self, view: memoryview) -> None:
+        view[:] = bytes(len(view))
+
+    def load8(self, address: int) -> int:  # noqa: ARG002 - constant
+        return 0x00
 
     def store8(self, address: int, value: int) -> None:  # noqa: ARG002 - intentional no-op
         return None
 
-    def load16(self, address: int) -> int:
-        if (address & 0xFFFF) == 0xD000:
-            return 0xAA00
+    def load16(self, address: int) -> int:  # noqa: ARG002 - constant
         return 0x0000
 
     def store16(self, address: int, value: int) -> None:  # noqa: ARG002 - intentional no-op
         return None
 
 
+class _D000Stub:
+    """Single byte at 0xD000 that reads back 0xAA, as on the real machine."""
+
+    ADDRESS = 0xD000
+
+    def getStartAddress(self) -> int:  # noqa: N802 - Java互換API
+        return self.ADDRESS
+
+    def getEndAddress(self) -> int:  # noqa: N802 - Java互換API
+        return self.ADDRESS
+
+    def load8(self, address: int) -> int:  # noqa: ARG002 - constant
+        return 0xAA
+
+    def store8(self, address: int, value: int) -> None:  # noqa: ARG002 - intentional no-op
+        return None
+
+    def load16(self, address: int) -> int:  # noqa: ARG002 - constant
+        return 0xAA00
+
+    def store16(self, address: int, value: int) -> None:  # noqa: ARG002 - intentional no-op
+        return None
+
+
 _AddressableT = TypeVar("_AddressableT", bound=Addressable)
 
 
+class _MixedPage:
+    """Per-byte router for a page shared by several components.
+
+    The JR-100 map is page aligned except for the VIA at 0xC800-0xC80F;
+    such pages get one of these in the page table.
+    """
+
+    def __init__(self, owners: List[Addressable]) -> None:
+        self.owners = owners
+
+    def load8(self, address: int) -> int:
+        return self.owners[address & 0xFF].load8(address)
+
+    def store8(self, address: int, value: int) -> None:
+        self.owners[address & 0xFF].store8(address, value)
+
+
 class MemorySystem:
-    """Port of jp.asamomiji.emulator.MemorySystem."""
+    """Port of jp.asamomiji.emulator.MemorySystem.
+
+    Components are routed through a 256-entry page table (``_pages``) with
+    the bound ``load8``/``store8`` methods of each page's owner cached in
+    parallel lists, so an access is a single list index plus call.  Pages
+    shared by several components hold a ``_MixedPage``.  The tracing and
+    unallocated variants are swapped in as instance attributes, keeping the
+    hot path free of ``debug`` checks.
+
+    Plain storage is additionally mirrored in the flat ``mem`` bytearray.  A
+    component opts in by providing ``bind_storage(view)``, which adopts a
+    ``memoryview`` slice of ``mem`` as its backing store, and the class
+    attributes ``direct_load``/``direct_store``.  Pages owned entirely by
+    such a component are served from ``mem``; everything else (I/O, mixed
+    pages, write hooks) is flagged in ``_mmio_load``/``_mmio_store`` and
+    dispatched to the component.  Both flag arrays always cover all 256
+    pages and are updated in place, so the CPU can cache ``mem`` and the
+    flags (``mmio_load``/``mmio_store``) and only fall back to
+    ``load8``/``store8`` for flagged pages.  Debug tracing flags every page.
+
+    ``dirty_pages`` has a byte per page that every store through this class
+    (and every CPU store into ``mem``) sets; the CPU clears it once it has
+    re-checked the code it cached from that page.  Writes made straight into
+    a component's storage view are not tracked, so components that do so
+    after start-up must flag the pages themselves.
+
+    Pages owned entirely by a component whose ``writable`` attribute is
+    false (ROM) drop stores in ``store8`` without calling the component or
+    flagging the page dirty.
+
+    Callers that cache the bound accessors register a callback with
+    ``watch_accessors``; it runs whenever ``load8``/``store8`` are swapped.
+    """
 
     def __init__(self) -> None:
-        self._space: MutableSequence[Addressable] = []
+        self._capacity = 0
+        self._pages: List[Addressable | _MixedPage] = []
+        self._load8_fns: List[Callable[[int], int]] = []
+        self._store8_fns: List[Callable[[int, int], None]] = []
+        self.mem = bytearray()
+        self._mmio_load = bytearray(b"\x01" * 0x100)
+        self._mmio_store = bytearray(b"\x01" * 0x100)
+        self._dirty_pages = bytearray(b"\x01" * 0x100)
+        self._read_only = bytearray(0x100)
         self._map: Dict[Type[Addressable], Addressable] = {}
-        self.debug = False
+        self._memories: tuple[Addressable, ...] = ()
+        self._debug = False
+        self._accessor_watchers: List[Callable[[], None]] = []
+        self._bind_accessors()
+
+    @property
+    def debug(self) -> bool:
+        return self._debug
+
+    @debug.setter
+    def debug(self, enabled: bool) -> None:
+        self._debug = bool(enabled)
+        if self._capacity:
+            self._refresh_pages(0, self._capacity - 1)
+        self._bind_accessors()
+
+    def watch_accessors(self, callback: Callable[[], None]) -> None:
+        """Call ``callback`` each time the ``load8``/``store8`` accessors change."""
+        self._accessor_watchers.append(callback)
+
+    @property
+    def mmio_load(self) -> bytearray:
+        """Per-page flags; nonzero pages must be read through ``load8``."""
+        return self._mmio_load
+
+    @property
+    def mmio_store(self) -> bytearray:
+        """Per-page flags; nonzero pages must be written through ``store8``."""
+        return self._mmio_store
+
+    @property
+    def dirty_pages(self) -> bytearray:
+        """Per-page flags set by stores; cleared by the code that watches them."""
+        return self._dirty_pages
 
     def allocateSpace(self, capacity: int) -> None:  # noqa: N802 - Java互換API
         if capacity < 0 or capacity > 0x10000:
             raise ValueError(f"invalid capacity {capacity}")
         default = UnmappedMemory(0, capacity if capacity else 1)
-        self._space = [default] * capacity
+        pages = (capacity + 0xFF) >> 8
+        self._capacity = capacity
+        self._pages = [default] * pages
+        self._load8_fns = [default.load8] * pages
+        self._store8_fns = [default.store8] * pages
         self._map = {UnmappedMemory: default}
+        self._memories = (default,)
+        self.mem = bytearray(capacity)
+        self._mmio_load[:] = b"\x01" * 0x100
+        self._mmio_store[:] = b"\x01" * 0x100
+        self._dirty_pages[:] = b"\x01" * 0x100
+        self._read_only[:] = bytes(0x100)
+        if capacity:
+            default.bind_storage(memoryview(self.mem))
+            self._refresh_pages(0, capacity - 1)
+        if capacity > _D000Stub.ADDRESS:
+            self._map_range(_D000Stub(), _D000Stub.ADDRESS, _D000Stub.ADDRESS)
+        self._bind_accessors()
 
     def registMemory(self, memory: Addressable) -> None:  # noqa: N802 - Java互換API
-        if not self._space:
+        if not self._capacity:
             raise RuntimeError("memory space not allocated")
         start = memory.getStartAddress() & 0xFFFF
         end = memory.getEndAddress() & 0xFFFF
         if end < start:
             raise ValueError("end address precedes start address")
-        if end >= len(self._space):
+        if end >= self._capacity:
             raise ValueError("memory outside allocated space")
-        for address in range(start, end + 1):
-            self._space[address] = memory
+        bind_storage = getattr(memory, "bind_storage", None)
+        if bind_storage is not None:
+            bind_storage(memoryview(self.mem)[start : end + 1])
+        self._map_range(memory, start, end)
         self._map[memory.__class__] = memory
+        self._memories = tuple(self._map.values())
+
+    def refresh_memory(self, memory: Addressable) -> None:
+        """Re-read the ``direct_load``/``direct_store`` flags of ``memory``."""
+        self._refresh_pages(memory.getStartAddress() & 0xFFFF, memory.getEndAddress() & 0xFFFF)
+
+    def _map_range(self, memory: Addressable, start: int, end: int) -> None:
+        pages = self._pages
+        for page in range(start >> 8, (end >> 8) + 1):
+            base = page << 8
+            low = max(start, base) - base
+            high = min(end, base + 0xFF) - base
+            current = pages[page]
+            if low == 0 and high == 0xFF:
+                owner: Addressable | _MixedPage = memory
+            else:
+                owners = list(current.owners) if isinstance(current, _MixedPage) else [current] * 0x100
+                owners[low : high + 1] = [memory] * (high - low + 1)
+                first = owners[0]
+                owner = first if all(item is first for item in owners) else _MixedPage(owners)
+            pages[page] = owner
+            self._load8_fns[page] = owner.load8
+            self._store8_fns[page] = owner.store8
+        self._refresh_pages(start, end)
+
+    def _refresh_pages(self, start: int, end: int) -> None:
+        for page in range(start >> 8, (end >> 8) + 1):
+            owner = self._pages[page]
+            bound = (
+                not self._debug
+                and ((page + 1) << 8) <= self._capacity
+                and hasattr(owner, "bind_storage")
+            )
+            self._mmio_load[page] = 0 if bound and getattr(owner, "direct_load", False) else 1
+            self._mmio_store[page] = 0 if bound and getattr(owner, "direct_store", False) else 1
+            self._read_only[page] = 0 if getattr(owner, "writable", True) else 1
+            # A newly bound component may bring its own contents.
+            self._dirty_pages[page] = 1
 
     def getMemory(self, cls: Type[_AddressableT]) -> _AddressableT | None:  # noqa: N802
         memory = self._map.get(cls)
@@ -96,7 +278,7 @@ class MemorySystem:
         return None
 
     def getMemories(self) -> Iterable[Addressable]:  # noqa: N802
-        return tuple(self._map.values())
+        return self._memories
 
     def getStartAddress(self, cls: Type[_AddressableT]) -> int:  # noqa: N802
         memory = self.getMemory(cls)
@@ -111,28 +293,88 @@ class MemorySystem:
         return memory.getEndAddress()
 
     def load8(self, address: int) -> int:
-        if not self._space:
-            raise RuntimeError("memory space not allocated")
         addr = address & 0xFFFF
-        value = self._space[addr].load8(addr) & 0xFF
-        if self.debug:
-            print(f"load8: addr={addr:04X} val={value:02X}")
-        return value
+        if self._mmio_load[addr >> 8]:
+            return self._load8_fns[addr >> 8](addr) & 0xFF
+        return self.mem[addr]
 
     def store8(self, address: int, value: int) -> None:
-        if not self._space:
-            raise RuntimeError("memory space not allocated")
         addr = address & 0xFFFF
-        if self.debug:
-            print(f"store8: addr={addr:04X} val={value & 0xFF:02X}")
-        self._space[addr].store8(addr, value & 0xFF)
+        page = addr >> 8
+        if self._mmio_store[page]:
+            if self._read_only[page]:
+                return
+            self._dirty_pages[page] = 1
+            self._store8_fns[page](addr, value & 0xFF)
+        else:
+            self._dirty_pages[page] = 1
+            self.mem[addr] = value & 0xFF
+
+    def _load8_traced(self, address: int) -> int:
+        addr = address & 0xFFFF
+        value = self._load8_fns[addr >> 8](addr) & 0xFF
+        print(f"load8: addr={addr:04X} val={value:02X}")
+        return value
+
+    def _store8_traced(self, address: int, value: int) -> None:
+        addr = address & 0xFFFF
+        print(f"store8: addr={addr:04X} val={value & 0xFF:02X}")
+        self._dirty_pages[addr >> 8] = 1
+        self._store8_fns[addr >> 8](addr, value & 0xFF)
+
+    def _load8_unallocated(self, address: int) -> int:  # noqa: ARG002
+        raise RuntimeError("memory space not allocated")
+
+    def _store8_unallocated(self, address: int, value: int) -> None:  # noqa: ARG002
+        raise RuntimeError("memory space not allocated")
+
+    def _bind_accessors(self) -> None:
+        if not self._capacity:
+            self.load8 = self._load8_unallocated  # type: ignore[method-assign]
+            self.store8 = self._store8_unallocated  # type: ignore[method-assign]
+        elif self._debug:
+            self.load8 = self._load8_traced  # type: ignore[method-assign]
+            self.store8 = self._store8_traced  # type: ignore[method-assign]
+        else:
+            for name in ("load8", "store8", "load16", "store16"):
+                vars(self).pop(name, None)
+            self._notify_accessor_watchers()
+            return
+        # Word accesses go through the swapped byte accessors.
+        self.load16 = self._load16_split  # type: ignore[method-assign]
+        self.store16 = self._store16_split  # type: ignore[method-assign]
+        self._notify_accessor_watchers()
+
+    def _notify_accessor_watchers(self) -> None:
+        for callback in self._accessor_watchers:
+            callback()
 
     def load16(self, address: int) -> int:
+        addr = address & 0xFFFF
+        following = (addr + 1) & 0xFFFF
+        mmio = self._mmio_load
+        if addr == 0xFFFF or mmio[addr >> 8] or mmio[following >> 8]:
+            return (self.load8(addr) << 8) | self.load8(following)
+        return _U16_BE.unpack_from(self.mem, addr)[0]
+
+    def store16(self, address: int, value: int) -> None:
+        addr = address & 0xFFFF
+        following = (addr + 1) & 0xFFFF
+        mmio = self._mmio_store
+        if addr == 0xFFFF or mmio[addr >> 8] or mmio[following >> 8]:
+            self.store8(addr, (value >> 8) & 0xFF)
+            self.store8(following, value & 0xFF)
+            return
+        self._dirty_pages[addr >> 8] = 1
+        self._dirty_pages[following >> 8] = 1
+        _U16_BE.pack_into(self.mem, addr, value & 0xFFFF)
+
+    def _load16_split(self, address: int) -> int:
         high = self.load8(address)
         low = self.load8(address + 1)
         return ((high << 8) | low) & 0xFFFF
 
-    def store16(self, address: int, value: int) -> None:
+    def _store16_split(self, address: int, value: int) -> None:
         self.store8(address, (value >> 8) & 0xFF)
         self.store8(address + 1, value & 0xFF)
 
@@ -2,80 +2,61 @@
 
 from __future__ import annotations
 
+import itertools
 import threading
 import time
-from dataclasses import dataclass
-from typing import Callable, List
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from typing import Callable, List, Optional
 
 
 @dataclass(order=True)
 class _ScheduledEvent:
     time_offset: int
-    command: Callable[[], None]
+    command: Callable[[], None] = field(compare=False)
+    sequence: int = 0
 
 
 class TimeManager:
-    """Port of jp.asamomiji.emulator.TimeManager."""
+    """Port of jp.asamomiji.emulator.TimeManager.
 
-    _POLL_INTERVAL_SECS = 100e-6  # 100 microseconds
+    The Java version runs its own polling thread; here ``dispatcher`` is
+    driven once per frame by ``Computer.runFrame`` instead, so an idle
+    queue costs nothing between frames.
+    """
 
     def __init__(self) -> None:
         self._events: List[_ScheduledEvent] = []
+        self._sequence = itertools.count()
         self._lock = threading.Lock()
-        self._running = False
-        self._thread: threading.Thread | None = None
-        self._wake = threading.Event()
 
     def addEvent(self, time_offset: int, command: Callable[[], None]) -> None:  # noqa: N802
-        event = _ScheduledEvent(time_offset, command)
-        with self._lock:
-            self._insert_sorted(event)
-        self._wake.set()
+        self.addScheduledEvent(_ScheduledEvent(time_offset, command))
 
     def addScheduledEvent(self, event: _ScheduledEvent) -> None:  # noqa: N802
         with self._lock:
-            self._insert_sorted(event)
-        self._wake.set()
+            event.sequence = next(self._sequence)
+            heappush(self._events, event)
 
-    def start(self) -> None:
-        if self._running:
-            return
-        self._running = True
-        self._thread = threading.Thread(target=self._run_loop, daemon=True)
-        self._thread.start()
+    def dispatcher(self, now: Optional[int] = None) -> None:
+        """Run every command due at ``now`` (``time.monotonic_ns()`` by default).
 
-    def stop(self) -> None:
-        if not self._running:
+        The clock is only read, and the lock only taken, when the earliest
+        event may be due.
+        """
+        events = self._events
+        if not events:
+            return
+        if now is None:
+            now = time.monotonic_ns()
+        if events[0].time_offset > now:
             return
-        self._running = False
-        self._wake.set()
-        if self._thread is not None:
-            self._thread.join(timeout=0.5)
-            self._thread = None
-
-    def dispatcher(self) -> None:
-        now = time.monotonic_ns()
         commands: List[Callable[[], None]] = []
         with self._lock:
             while self._events and self._events[0].time_offset <= now:
-                commands.append(self._events.pop(0).command)
+                commands.append(heappop(self._events).command)
         for command in commands:
             command()
 
-    def _run_loop(self) -> None:
-        while self._running:
-            self.dispatcher()
-            self._wake.wait(self._POLL_INTERVAL_SECS)
-            self._wake.clear()
-
-    def _insert_sorted(self, event: _ScheduledEvent) -> None:
-        index = 0
-        for index, existing in enumerate(self._events):
-            if event.time_offset < existing.time_offset:
-                self._events.insert(index, event)
-                break
-        else:
-            self._events.append(event)
-
 
 __all__ = ["TimeManager"]
@@ -0,0 +1,202 @@
+"""Direct-mapped cache of compiled straight-line blocks for ``execute()``.
+
+A block starts at a PC in a flat RAM page and runs the inline templates
+(see ``codegen``) of consecutive instructions up to and including the
+first one that can change the flow of control or the interrupt mask, an
+instruction without a template, or the end of the page.  Operand bytes
+are folded into the source as constants, so a block is only valid while
+its code bytes are unchanged.  Blocks never span pages: once a page is
+flagged in ``dirty`` (see ``MemorySystem.dirty_pages``), ``recheck``
+compares the code of every block cached from it before clearing the flag,
+and a block that stores into its own remaining code returns right after
+that store.  A block is only compiled once its entry point has been
+reached ``HOT_VISITS`` times.
+
+Compiled code objects are shared by every CPU through a module-level
+cache keyed by ``(start, code)``; each ``BlockCache`` turns them into
+functions over its own CPU's memory bindings.
+"""
+
+from __future__ import annotations
+
+import re
+from types import CodeType, FunctionType
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from .codegen import TABLES, Template
+
+# (start, end, code, cycles, function); a slot whose function is None has a
+# cycle count no budget reaches, so the loop decodes that PC itself.
+Block = Tuple[int, int, bytes, int, Optional[FunctionType]]
+
+_NOT_COMPILABLE = 1 << 62
+_EMPTY: Block = (-1, -1, b"", _NOT_COMPILABLE, None)
+_MAX_INSTRUCTIONS = 32
+_MAX_SHARED_BLOCKS = 4096
+_shared: Dict[Tuple[int, bytes], Tuple[CodeType, int]] = {}
+
+
+class BlockCache:
+    """Per-CPU block table indexed by ``pc & MASK``."""
+
+    SIZE = 1024
+    MASK = SIZE - 1
+    # Entry points reached fewer times than this run through the per-op
+    # loop: compiling a block costs about as much as interpreting it a
+    # hundred times, so code that runs once (start-up, loaders) never pays.
+    HOT_VISITS = 128
+
+    def __init__(
+        self,
+        templates: Mapping[int, Template],
+        block_ends: FrozenSet[int],
+        namespace: Mapping[str, object],
+    ) -> None:
+        self._templates = templates
+        self._block_ends = block_ends
+        self._ram: bytes | bytearray = b""
+        self._globals: Dict[str, object] = dict(TABLES)
+        self._globals.update(namespace)
+        self._dirty: bytes | bytearray = b""
+        self.slots: List[Block] = [_EMPTY] * self.SIZE
+        # Start addresses of the blocks built in each page, for recheck().
+        self._starts: List[Set[int]] = [set() for _ in range(0x100)]
+        self._visits: Dict[int, int] = {}
+
+    def bind(
+        self,
+        ram: bytes | bytearray,
+        mmio_load: bytes | bytearray,
+        mmio_store: bytes | bytearray,
+        load8: Callable[[int], int],
+        store8: Callable[[int, int], None],
+        dirty: bytes | bytearray,
+    ) -> None:
+        """Point the block functions at the CPU's current memory bindings."""
+        self._ram = ram
+        self._dirty = dirty
+        scope = self._globals
+        scope["ram"] = ram
+        scope["mmio_load"] = mmio_load
+        scope["mmio_store"] = mmio_store
+        scope["load8"] = load8
+        scope["store8"] = store8
+        scope["dirty"] = dirty
+
+    def recheck(self, start: int) -> Block:
+        """Drop stale blocks in the dirty page of ``start``; return its block."""
+        page = start >> 8
+        ram = self._ram
+        slots = self.slots
+        kept = set()
+        for address in self._starts[page]:
+            block = slots[address & self.MASK]
+            if block[0] != address:
+                continue
+            if block[4] is not None and ram[address : block[1]] == block[2]:
+                kept.add(address)
+            else:
+                slots[address & self.MASK] = _EMPTY
+        self._starts[page] = kept
+        self._dirty[page] = 0
+        block = slots[start & self.MASK]
+        return block if block[0] == start else self.build(start)
+
+    def build(self, start: int) -> Block:
+        """Compile (or reuse) the block at ``start`` once it is hot enough.
+
+        Until then the slot is left alone and ``_EMPTY`` is returned, so the
+        loop decodes ``start`` itself and calls back here on the next visit.
+        """
+        visits = self._visits
+        count = visits.get(start, 0) + 1
+        if count < self.HOT_VISITS:
+            if len(visits) >= _MAX_SHARED_BLOCKS:
+                visits.clear()
+            visits[start] = count
+            return _EMPTY
+        visits.pop(start, None)
+        end, cycles = self._extent(start)
+        code = bytes(self._ram[start:end])
+        if end == start:
+            block: Block = (start, start, code, _NOT_COMPILABLE, None)
+        else:
+            key = (start, code)
+            shared = _shared.get(key)
+            if shared is None:
+                if len(_shared) >= _MAX_SHARED_BLOCKS:
+                    _shared.clear()
+                shared = _shared[key] = (self._compile(start, code), cycles)
+            function = FunctionType(shared[0], self._globals)
+            block = (start, end, code, shared[1], function)
+        self.slots[start & self.MASK] = block
+        self._starts[start >> 8].add(start)
+        return block
+
+    def _extent(self, start: int) -> Tuple[int, int]:
+        ram = self._ram
+        templates = self._templates
+        at = start
+        cycles = 0
+        for _ in range(_MAX_INSTRUCTIONS):
+            opcode = ram[at]
+            template = templates.get(opcode)
+            if template is None:
+                break
+            cycles += template[1]
+            at += template[2]
+            # Blocks stay inside one page so a single MMIO check covers them.
+            if opcode in self._block_ends or at & 0xFF > 0xFD or at >> 8 != start >> 8:
+                break
+        return at, cycles
+
+    def _compile(self, start: int, code: bytes) -> CodeType:
+        templates = self._templates
+        end = start + len(code)
+        body: List[str] = []
+        offset = cycles = 0
+        while offset < len(code):
+            template, instruction_cycles, length = templates[code[offset]]
+            source = template
+            for index in range(1, length):
+                source = source.replace(f"ram[at + {index}]", f"0x{code[offset + index]:02X}")
+            offset += length
+            cycles += instruction_cycles
+            following = start + offset
+            if offset == len(code):
+                body.append(f"pc = 0x{following & 0xFFFF:04X}")
+                body.extend(line for line in source.split("\n") if line)
+                break
+            # A store into the rest of the block ends it early, after the
+            # storing instruction, so the new code is decoded afresh.
+            lines = [line for line in source.split("\n") if line]
+            checked = _guard_stores(lines, following, end)
+            body.extend(checked)
+            if len(checked) != len(lines):
+                body.append("if modified:")
+                body.append(f"    return 0x{following:04X}, a, b, ix, sp, ccr, nz, {cycles}")
+        if any(line.startswith("if modified") for line in body):
+            body.insert(0, "modified = False")
+        body.append(f"return pc, a, b, ix, sp, ccr, nz, {cycles}")
+        source = "def block(a, b, ix, sp, ccr, nz):\n" + "".join(f"    {line}\n" for line in body)
+        scope: Dict[str, object] = {}
+        exec(compile(source, f"<mb8861-block-{start:04X}>", "exec"), scope)  # noqa: S102
+        return scope["block"].__code__  # type: ignore[attr-defined]
+
+
+_RAM_STORE = re.compile(r"^(\s*)ram\[(\w+)\] = ")
+
+
+def _guard_stores(lines: List[str], low: int, high: int) -> List[str]:
+    """Flag RAM stores landing in ``[low, high)`` through the ``modified`` local."""
+    guarded = []
+    for line in lines:
+        guarded.append(line)
+        match = _RAM_STORE.match(line)
+        if match:
+            indent, address = match.groups()
+            guarded.append(f"{indent}if 0x{low:04X} <= {address} < 0x{high:04X}:")
+            guarded.append(f"{indent}    modified = True")
+    return guarded
+
+__all__ = ["BlockCache"]
@@ -0,0 +1,420 @@
+"""Source generation for the MB8861 ``execute()`` fast loop.
+
+Opcodes with an inline template run inside a single generated function
+whose registers live in locals; every other opcode flushes the registers
+back to the CPU and goes through its bound handler.  Templates are plain
+Python statements over the loop locals:
+
+``pc a b ix sp ccr``
+    CPU registers (``ccr`` always includes bits 7-6).  ``pc`` already
+    points past the whole instruction when a template starts.
+``nz``
+    Lazy N/Z: the last result that set them, with the real bits kept out
+    of ``ccr`` until something reads them (``NZ_FLAGS[nz]``).  Values up
+    to 0xFF give N = bit 7 and Z = (value == 0); ``NZ_BOTH`` stands for
+    N and Z set together, which only TAP/RTI can produce.
+``at``
+    Address of the opcode.  The loop only inlines instructions that sit
+    in a flat RAM page without crossing its end, so operand bytes are
+    read straight from ``ram[at + 1]``/``ram[at + 2]``.
+``WRAP16 SIGNED8 NZ16 ADD_FLAGS SUB_FLAGS SHIFT_FLAGS``
+    16-bit wraparound table, used in place of ``& 0xFFFF``, 8-bit sign
+    extension, the lazy N/Z of a 16-bit result, and the flag results of
+    8-bit adds, subtracts and shifts (globals, see ``TABLES``).
+``ram mmio_load mmio_store load8 store8``
+    Flat memory image, per-page MMIO flags and the memory accessors.
+``dirty``
+    Per-page written flags (``MemorySystem.dirty_pages``); every store into
+    ``ram`` sets its page so cached blocks there get re-checked.
+
+The helpers below build the recurring fragments (operand fetch, flagged
+memory access, N/Z updates) so templates stay short.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Mapping, Tuple
+
+from .instructions import AddressingMode
+
+_REGISTERS = ("pc", "a", "b", "ix", "sp")
+
+NZ_BOTH = 0x100
+
+
+def _build_nz_flags() -> bytes:
+    table = bytearray(NZ_BOTH + 1)
+    for value in range(0x100):
+        table[value] = ((value >> 4) & 0x08) | (0 if value else 0x04)
+    table[NZ_BOTH] = 0x0C
+    return bytes(table)
+
+
+NZ_FLAGS = _build_nz_flags()
+# Lazy N/Z value for CCR bits 3-2 (index (ccr >> 2) & 3).
+NZ_FROM_CCR = (0x01, 0x00, 0x80, NZ_BOTH)
+# Lazy N/Z value of a 16-bit result: its high byte, with the low byte
+# folded into bit 0 so only zero maps to zero.
+NZ16 = bytes((value >> 8) | (1 if value & 0xFF else 0) for value in range(0x10000))
+# CCR N/Z bits of a 16-bit result.
+NZ16_FLAGS = bytes(NZ_FLAGS[lazy] for lazy in NZ16)
+
+# SIGNED8[v] is the byte v as a two's-complement displacement.
+SIGNED8 = tuple(range(0x80)) + tuple(range(-0x80, 0))
+
+
+def _build_alu_flags(subtract: bool) -> bytes:
+    # Index (carry << 16) | (x << 8) | y.  Java parity: V only for operands
+    # of equal (add) or opposite (subtract) non-zero sign; the add H flag
+    # ignores the carry in, and subtract leaves H alone.
+    table = bytearray(0x20000)
+    for x in range(0x100):
+        sx = SIGNED8[x]
+        for y in range(0x100):
+            sy = SIGNED8[y]
+            if subtract:
+                sy = -sy
+            half = 0 if subtract or (x & 0x0F) + (y & 0x0F) <= 0x0F else 0x20
+            for carry in (0, 1):
+                total = x - y - carry if subtract else x + y + carry
+                n = total & 0x80
+                overflow = (sx > 0 and sy > 0 and n) or (sx < 0 and sy < 0 and not n)
+                table[(carry << 16) | (x << 8) | y] = (
+                    half | (0x02 if overflow else 0) | ((total >> 8) & 0x01)
+                )
+    return bytes(table)
+
+
+# H, V and C after an 8-bit add/subtract (see _build_alu_flags).
+ADD_FLAGS = _build_alu_flags(subtract=False)
+SUB_FLAGS = _build_alu_flags(subtract=True)
+# V and C after a shift or rotate, indexed (carry out << 8) | result; V is
+# N XOR C as on the 6800.
+SHIFT_FLAGS = bytes(
+    ((((index >> 7) ^ (index >> 8)) & 0x01) << 1) | (index >> 8) for index in range(0x200)
+)
+# WRAP16[x] == x & 0xFFFF for -0x20000 <= x < 0x20000 (negative indexes
+# count back from 0x20000); one tuple index is cheaper than add-then-mask.
+WRAP16 = tuple(range(0x10000)) * 2
+
+
+def _build_branch_masks() -> Tuple[int, ...]:
+    """Truth table of each Bxx condition (opcode low nibble) over CCR bits 3-0."""
+    conditions = (
+        lambda n, z, v, c: True,  # BRA
+        lambda n, z, v, c: False,  # BRN
+        lambda n, z, v, c: not (c or z),  # BHI
+        lambda n, z, v, c: c or z,  # BLS
+        lambda n, z, v, c: not c,  # BCC
+        lambda n, z, v, c: c,  # BCS
+        lambda n, z, v, c: not z,  # BNE
+        lambda n, z, v, c: z,  # BEQ
+        lambda n, z, v, c: not v,  # BVC
+        lambda n, z, v, c: v,  # BVS
+        lambda n, z, v, c: not n,  # BPL
+        lambda n, z, v, c: n,  # BMI
+        lambda n, z, v, c: n == v,  # BGE
+        lambda n, z, v, c: n != v,  # BLT
+        lambda n, z, v, c: not (z or n != v),  # BGT
+        lambda n, z, v, c: z or n != v,  # BLE
+    )
+    masks = []
+    for condition in conditions:
+        mask = 0
+        for flags in range(16):
+            n, z, v, c = (bool(flags & bit) for bit in (0x08, 0x04, 0x02, 0x01))
+            if condition(n, z, v, c):
+                mask |= 1 << flags
+        masks.append(mask)
+    return tuple(masks)
+
+
+# BRANCH_MASKS[opcode & 0x0F] >> (ccr & 0x0F) & 1 tells whether a Bxx is
+# taken; templates fold the mask in as a constant.
+BRANCH_MASKS = _build_branch_masks()
+
+
+# Module tables the templates refer to by name.
+TABLES: Dict[str, object] = {
+    "ADD_FLAGS": ADD_FLAGS,
+    "NZ16": NZ16,
+    "NZ_BOTH": NZ_BOTH,
+    "NZ_FLAGS": NZ_FLAGS,
+    "NZ_FROM_CCR": NZ_FROM_CCR,
+    "SHIFT_FLAGS": SHIFT_FLAGS,
+    "SIGNED8": SIGNED8,
+    "SUB_FLAGS": SUB_FLAGS,
+    "WRAP16": WRAP16,
+}
+
+
+# ----------------------------------------------------------------------
+# Template fragments
+
+
+def fetch8(dst: str, offset: int = 1) -> str:
+    """Read operand byte ``offset`` of the instruction into ``dst``."""
+    return f"{dst} = ram[at + {offset}]\n"
+
+
+def fetch16(dst: str) -> str:
+    """Read the big-endian operand word of the instruction into ``dst``."""
+    return f"{dst} = (ram[at + 1] << 8) | ram[at + 2]\n"
+
+
+def read8(dst: str, address: str) -> str:
+    return f"{dst} = load8({address}) if mmio_load[{address} >> 8] else ram[{address}]\n"
+
+
+def write8(address: str, value: str) -> str:
+    return (
+        f"if mmio_store[{address} >> 8]:\n"
+        f"    store8({address}, {value})\n"
+        f"else:\n"
+        f"    ram[{address}] = {value}\n"
+        f"    dirty[{address} >> 8] = 1\n"
+    )
+
+
+def effective_address(mode: AddressingMode) -> str:
+    """Leave the operand address of a DIRECT/INDEXED/EXTENDED opcode in ``ea``."""
+    if mode is AddressingMode.DIRECT:
+        return fetch8("ea")
+    if mode is AddressingMode.INDEXED:
+        return fetch8("ea") + "ea = WRAP16[ix + ea]\n"
+    if mode is AddressingMode.EXTENDED:
+        return fetch16("ea")
+    raise ValueError(f"no effective address for {mode}")
+
+
+def operand8(mode: AddressingMode) -> str:
+    """Leave the 8-bit operand in ``v``."""
+    if mode is AddressingMode.IMMEDIATE:
+        return fetch8("v")
+    return effective_address(mode) + read8("v", "ea")
+
+
+def operand16(mode: AddressingMode) -> str:
+    """Leave the 16-bit operand in ``v``; direct-page words wrap in page zero."""
+    if mode is AddressingMode.IMMEDIATE:
+        return fetch16("v")
+    return (
+        effective_address(mode)
+        + read8("hi", "ea")
+        + _next_byte(mode)
+        + read8("lo", "ea")
+        + "v = (hi << 8) | lo\n"
+    )
+
+
+def _next_byte(mode: AddressingMode) -> str:
+    # Direct-page words wrap within page zero.
+    if mode is AddressingMode.DIRECT:
+        return "ea = (ea + 1) & 0xFF\n"
+    return "ea = WRAP16[ea + 1]\n"
+
+
+def store16(mode: AddressingMode, value: str) -> str:
+    return (
+        effective_address(mode)
+        + f"hi = {value} >> 8\n"
+        + write8("ea", "hi")
+        + _next_byte(mode)
+        + f"lo = {value} & 0xFF\n"
+        + write8("ea", "lo")
+    )
+
+
+def push16(value: str) -> str:
+    return (
+        "sp = WRAP16[sp - 2]\n"
+        "ea = WRAP16[sp + 1]\n"
+        + f"hi = {value} >> 8\n"
+        + write8("ea", "hi")
+        + "ea = WRAP16[sp + 2]\n"
+        + f"lo = {value} & 0xFF\n"
+        + write8("ea", "lo")
+    )
+
+
+def pull16(dst: str) -> str:
+    return (
+        "ea = WRAP16[sp + 1]\n"
+        + read8("hi", "ea")
+        + "ea = WRAP16[sp + 2]\n"
+        + read8("lo", "ea")
+        + "sp = WRAP16[sp + 2]\n"
+        + f"{dst} = (hi << 8) | lo\n"
+    )
+
+
+def nz16(value: str) -> str:
+    """Set lazy N/Z from a 16-bit ``value`` (high byte, low byte folded into bit 0)."""
+    return f"nz = NZ16[{value}]\n"
+
+
+def nzv8(value: str) -> str:
+    """Set N/Z from an 8-bit ``value`` and clear V."""
+    return f"nz = {value}\nccr &= 0xFD\n"
+
+
+def nzv16(value: str) -> str:
+    """Set N/Z from a 16-bit ``value`` and clear V."""
+    return nz16(value) + "ccr &= 0xFD\n"
+
+
+def materialize_ccr() -> str:
+    """Fold the lazy N/Z back into ``ccr``."""
+    return "ccr = (ccr & 0xF3) | NZ_FLAGS[nz]\n"
+
+
+def refresh_nz() -> str:
+    """Re-derive the lazy N/Z after ``ccr`` was loaded as a whole."""
+    return "nz = NZ_FROM_CCR[(ccr >> 2) & 0x03]\n"
+
+
+def relative_jump() -> str:
+    """Add the signed 8-bit displacement in ``v`` to ``pc``."""
+    return "pc = WRAP16[pc + SIGNED8[v]]\n"
+
+
+# ----------------------------------------------------------------------
+# Loop assembly
+
+
+def _indent(source: str, depth: int) -> List[str]:
+    pad = "    " * depth
+    return [pad + line if line else line for line in source.rstrip("\n").split("\n")]
+
+
+def _flush(depth: int) -> List[str]:
+    lines = [f"cpu.{name} = {name}" for name in _REGISTERS]
+    lines.append("cpu.ccr = (ccr & 0xF3) | NZ_FLAGS[nz]")
+    return _indent("\n".join(lines), depth)
+
+
+def _reload(depth: int) -> List[str]:
+    lines = [f"{name} = cpu.{name}" for name in _REGISTERS]
+    lines.append("ccr = cpu.ccr")
+    return _indent("\n".join(lines) + "\n" + refresh_nz(), depth)
+
+
+def _fallback(depth: int) -> List[str]:
+    return (
+        _indent("pc = at + 1", depth)
+        + _flush(depth)
+        + _indent("remaining -= dispatch[op]()", depth)
+        + _reload(depth)
+    )
+
+
+def _inline(template: str, cycles: int, length: int, depth: int) -> List[str]:
+    # at & 0xFF <= 0xFD, so only a three-byte instruction can carry past 0xFFFF.
+    advance = f"pc = WRAP16[at + {length}]\n" if length > 2 else f"pc = at + {length}\n"
+    return _indent(advance + template + f"remaining -= {cycles}\n", depth)
+
+
+Template = Tuple[str, int, int]
+
+
+def _emit(
+    templates: Mapping[int, Template], opcodes: List[int], lo: int, hi: int, depth: int
+) -> List[str]:
+    # Bisect the opcode space so an opcode is found in at most eight compares.
+    inside = [opcode for opcode in opcodes if lo <= opcode < hi]
+    if not inside:
+        return _fallback(depth)
+    if hi - lo == 1:
+        return _inline(*templates[lo], depth)
+    if len(inside) == 1:
+        opcode = inside[0]
+        return (
+            _indent(f"if op == 0x{opcode:02X}:", depth)
+            + _inline(*templates[opcode], depth + 1)
+            + _indent("else:", depth)
+            + _fallback(depth + 1)
+        )
+    mid = (lo + hi) // 2
+    return (
+        _indent(f"if op < 0x{mid:02X}:", depth)
+        + _emit(templates, inside, lo, mid, depth + 1)
+        + _indent("else:", depth)
+        + _emit(templates, inside, mid, hi, depth + 1)
+    )
+
+
+def generate_source(templates: Mapping[int, Template], name: str = "run") -> str:
+    """Return the source of ``name(cpu, clocks)``.
+
+    ``templates`` maps opcodes to ``(template, cycles, length)`` where
+    ``length`` counts the opcode byte and its operands.
+    """
+    lines = [
+        f"def {name}(cpu, clocks):",
+        "    ram = cpu._ram",
+        "    mmio_load = cpu._mmio_load",
+        "    mmio_store = cpu._mmio_store",
+        "    load8 = cpu._mem_load8",
+        "    store8 = cpu._mem_store8",
+        "    dirty = cpu._code_page_dirty",
+        "    dispatch = cpu._dispatch",
+        "    fast = cpu._fast_step",
+        "    blocks = cpu._blocks.slots",
+        "    build = cpu._blocks.build",
+        "    recheck = cpu._blocks.recheck",
+    ]
+    lines += _reload(1)
+    lines += [
+        "    remaining = clocks",
+        "    while remaining > 0:",
+        "        if cpu._step_impl is not fast:",
+    ]
+    lines += _flush(3)
+    lines += ["            remaining -= cpu._step_impl()"]
+    lines += _reload(3)
+    lines += ["            continue"]
+    # Instructions in MMIO pages or running into the next page take the
+    # regular fetch path; everything else is decoded straight from ram.
+    lines += [
+        "        at = pc",
+        "        if mmio_load[at >> 8] or at & 0xFF > 0xFD:",
+    ]
+    lines += _flush(3)
+    lines += ["            remaining -= fast()"]
+    lines += _reload(3)
+    lines += ["            continue"]
+    # Run the cached straight-line block at this PC when the budget covers
+    # all of it, so execute() stops on the same instruction as step() would.
+    # Blocks in a page written since its last check are verified first.
+    lines += [
+        "        if dirty[at >> 8]:",
+        "            block = recheck(at)",
+        "        else:",
+        "            block = blocks[at & 0x3FF]",
+        "            if block[0] != at:",
+        "                block = build(at)",
+        "        if remaining >= block[3]:",
+        "            pc, a, b, ix, sp, ccr, nz, used = block[4](a, b, ix, sp, ccr, nz)",
+        "            remaining -= used",
+        "            continue",
+        "        op = ram[at]",
+    ]
+    lines += _emit(templates, sorted(templates), 0x00, 0x100, 2)
+    lines += _flush(1)
+    lines += ["    return -remaining", ""]
+    return "\n".join(lines)
+
+
+def compile_loop(
+    templates: Mapping[int, Template], namespace: Dict[str, object], name: str = "run"
+) -> Callable[..., int]:
+    """Compile ``generate_source`` output with ``namespace`` as its globals."""
+    source = generate_source(templates, name)
+    code = compile(source, f"<mb8861-{name}>", "exec")
+    scope = dict(TABLES)
+    scope.update(namespace)
+    exec(code, scope)  # noqa: S102 - source is generated from the opcode table
+    return scope[name]
+
+
+__all__ = ["TABLES", "compile_loop", "generate_source"]
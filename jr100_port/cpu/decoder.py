@@ -2,20 +2,47 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
 from .instructions import AddressingMode, Instruction
 
+Handler = Callable[..., int]
+
 
 class Decoder:
+    """Opcode table stored as parallel 256-entry lists.
+
+    ``handlers`` and ``modes`` are indexed by opcode and are what the CPU
+    dispatches through; ``templates`` and ``operand_bytes`` are what the
+    generated ``execute()`` loop is compiled from.  Mnemonic and cycle
+    count are only needed for disassembly and debugging, so they live in
+    the cold ``_debug_info`` mapping and ``lookup`` rebuilds an
+    ``Instruction`` on demand.
+    """
+
     def __init__(self) -> None:
-        self._table: Dict[int, Instruction] = {}
+        self.handlers: List[Optional[Handler]] = [None] * 256
+        self.modes: List[Optional[AddressingMode]] = [None] * 256
+        self.templates: List[Optional[str]] = [None] * 256
+        self.operand_bytes: List[int] = [0] * 256
+        self._debug_info: Dict[int, Tuple[str, int]] = {}
 
     def register(self, instruction: Instruction) -> None:
-        self._table[instruction.opcode] = instruction
+        opcode = instruction.opcode & 0xFF
+        self.handlers[opcode] = instruction.handler
+        self.modes[opcode] = instruction.mode
+        self.templates[opcode] = instruction.template
+        self.operand_bytes[opcode] = instruction.operand_bytes
+        self._debug_info[opcode] = (instruction.name, instruction.cycles)
 
     def lookup(self, opcode: int) -> Instruction:
-        return self._table[opcode]
+        name, cycles = self._debug_info[opcode]
+        mode = self.modes[opcode]
+        handler = self.handlers[opcode]
+        assert mode is not None and handler is not None
+        return Instruction(
+            opcode, name, mode, cycles, handler, self.templates[opcode], self.operand_bytes[opcode]
+        )
 
 
 __all__ = ["Decoder"]
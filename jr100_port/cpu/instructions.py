@@ -3,24 +3,42 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Callable
+from enum import IntEnum
+from typing import Callable, Optional
 
 
-class AddressingMode(Enum):
-    IMPLIED = auto()
-    IMMEDIATE = auto()
-    DIRECT = auto()
-    RELATIVE = auto()
+class AddressingMode(IntEnum):
+    """Operand addressing; members are small ints so handlers can index by mode."""
+
+    IMPLIED = 0
+    IMMEDIATE = 1
+    DIRECT = 2
+    INDEXED = 3
+    EXTENDED = 4
+    RELATIVE = 5
 
 
 @dataclass(frozen=True)
 class Instruction:
+    """Opcode metadata.
+
+    Handlers take only the CPU.  Instructions available in several
+    addressing modes share one handler, registered per opcode as a copy
+    whose mode and cycle count parameters default to that opcode's.
+
+    ``template`` is the opcode's inline source for the generated
+    ``execute()`` loop (see ``templates``); opcodes without one run
+    through ``handler`` there as well.  ``operand_bytes`` is the number of
+    bytes following the opcode, which that loop reads in one go.
+    """
+
     opcode: int
     name: str
     mode: AddressingMode
     cycles: int
-    handler: Callable[["MB8861", AddressingMode], int]
+    handler: Callable[["MB8861"], int]
+    template: Optional[str] = None
+    operand_bytes: int = 0
 
 
 __all__ = ["AddressingMode", "Instruction"]
@@ -2,8 +2,92 @@
 
 from __future__ import annotations
 
-from .decoder import Decoder
+from functools import partial
+from types import FunctionType
+from typing import Callable, Optional
+
+from . import codegen, templates
+from .blocks import BlockCache
+from .codegen import ADD_FLAGS as _ADD_FLAGS
+from .codegen import BRANCH_MASKS as _BRANCH_MASKS
+from .codegen import NZ16_FLAGS as _NZ16
+from .codegen import NZ_FLAGS as _NZ
+from .codegen import SHIFT_FLAGS as _SHIFT_FLAGS
+from .codegen import SIGNED8 as _SIGNED8
+from .codegen import SUB_FLAGS as _SUB_FLAGS
+from .codegen import WRAP16 as _WRAP16
+from .decoder import Decoder, Handler
 from .instructions import AddressingMode, Instruction
+from .templates import unary
+
+# Condition code register bits (MC6800 layout; bits 7-6 always read as 1).
+_BIT_H = 0x20
+_BIT_I = 0x10
+_BIT_N = 0x08
+_BIT_Z = 0x04
+_BIT_V = 0x02
+_BIT_C = 0x01
+_CCR_FIXED = 0xC0
+
+_IMMEDIATE = AddressingMode.IMMEDIATE
+_DIRECT = AddressingMode.DIRECT
+_INDEXED = AddressingMode.INDEXED
+_EXTENDED = AddressingMode.EXTENDED
+
+_CLEAR_Z = 0xFF & ~_BIT_Z
+_CLEAR_NZV = 0xFF & ~(_BIT_N | _BIT_Z | _BIT_V)
+_CLEAR_NZVC = 0xFF & ~(_BIT_N | _BIT_Z | _BIT_V | _BIT_C)
+_CLEAR_HNZVC = 0xFF & ~(_BIT_H | _BIT_N | _BIT_Z | _BIT_V | _BIT_C)
+
+# 8-bit helpers bound into the shared handlers: (cpu, value) and (cpu, left, right).
+_UnaryOperation = Callable[["MB8861", int], int]
+_BinaryOperation = Callable[["MB8861", int, int], int]
+
+# Stand-ins for memories without a flat image: every page is flagged, so the
+# image is never indexed and one shared read-only copy serves all CPUs.
+_NO_RAM = bytes(0x10000)
+_ALL_PAGES = b"\x01" * 0x100
+_NO_PAGES = bytes(0x100)
+
+# Besides relative-mode opcodes, these end a compiled block (see blocks).
+_BLOCK_END_NAMES = frozenset({"JMP", "JSR", "RTS", "RTI", "CLI", "TAP"})
+
+
+class UndefinedOpcodeError(RuntimeError):
+    """Raised when the CPU fetches an opcode with no registered instruction."""
+
+    def __init__(self, opcode: int, address: int) -> None:
+        super().__init__(f"undefined opcode {opcode:02X} at {address:04X}")
+        self.opcode = opcode
+        self.address = address
+
+
+def _specialize(function: FunctionType, *arguments) -> FunctionType:
+    """Copy ``function`` with ``arguments`` as defaults ahead of its current ones.
+
+    Unlike ``partialmethod`` the copy binds as a plain method, so the
+    dispatch table calls it without an extra ``functools.partial`` layer.
+    """
+    defaults = arguments + (function.__defaults__ or ())
+    assert function.__code__.co_argcount > len(defaults)
+    copy = FunctionType(function.__code__, function.__globals__, function.__name__, defaults)
+    copy.__qualname__ = function.__qualname__
+    return copy
+
+
+def _flag(mask: int) -> property:
+    """Expose one CCR bit as a bool attribute for tests and debugging.
+
+    The emulator itself only reads and writes the packed ``ccr`` byte.
+    """
+
+    def getter(cpu: "MB8861") -> bool:
+        return bool(cpu.ccr & mask)
+
+    def setter(cpu: "MB8861", value: bool) -> None:
+        cpu.ccr = (cpu.ccr | mask) if value else (cpu.ccr & ~mask)
+
+    return property(getter, setter)
 
 
 class MB8861:
@@ -21,40 +105,109 @@ class MB8861:
         self.b = 0
         self.ix = 0
         self.sp = 0
-        self.ch = False
-        self.ci = False
-        self.cn = False
-        self.cz = False
-        self.cv = False
-        self.cc = False
+        self.ccr = _CCR_FIXED
         self._waiting = False
         self._pending_irq = False
         self._pending_nmi = False
+        # step() goes through _step_impl, which stays on the fetch/dispatch-only
+        # path until an interrupt request or WAI needs the full ladder.
+        self._fast_step = self._step_fast
+        self._slow_step = self._step_slow
+        self._step_impl = self._fast_step
+        # Indexed by AddressingMode; only the modes a handler family uses are set.
+        self._operand_readers = (
+            None,
+            self._fetch_byte,
+            self._read_direct,
+            self._read_indexed,
+            self._read_extended,
+            None,
+        )
+        self._address_resolvers = (
+            None,
+            None,
+            self._fetch_byte,
+            self._indexed_address,
+            self._fetch_word,
+            None,
+        )
         self._decoder = Decoder()
         self._register_instructions()
+        # Opcode-indexed handlers bound to this CPU; undefined opcodes trap
+        # with their own opcode bound, so the trap does not read the bus again.
+        self._dispatch = tuple(
+            (
+                _specialize(MB8861._opcode_undefined, opcode)
+                if handler is None
+                else handler
+            ).__get__(self, MB8861)
+            for opcode, handler in enumerate(self._decoder.handlers)
+        )
+        if MB8861._run_loop is None:
+            self._compile_run_loop()
+        self._blocks = BlockCache(MB8861._inline_templates, MB8861._block_ends, {})
+        self._bind_memory()
+        watch_accessors = getattr(memory, "watch_accessors", None)
+        if watch_accessors is not None:
+            watch_accessors(self._bind_memory)
+
+    # Generated by _compile_run_loop() on first instantiation and shared by all CPUs.
+    _run_loop = None
+    _inline_templates: dict = {}
+    _block_ends: frozenset = frozenset()
+
+    def _compile_run_loop(self) -> None:
+        # Every opcode registered with a template is inlined over register
+        # locals; the rest go through the bound handlers (see codegen).
+        decoder = self._decoder
+        inline = {
+            opcode: (template, decoder._debug_info[opcode][1], 1 + decoder.operand_bytes[opcode])
+            for opcode, template in enumerate(decoder.templates)
+            if template is not None
+        }
+        MB8861._inline_templates = inline
+        MB8861._block_ends = frozenset(
+            opcode
+            for opcode in inline
+            if decoder.modes[opcode] is AddressingMode.RELATIVE
+            or decoder._debug_info[opcode][0] in _BLOCK_END_NAMES
+        )
+        MB8861._run_loop = staticmethod(codegen.compile_loop(inline, {}))
 
     def reset(self) -> None:
+        self._bind_memory()
         self.pc = self.memory.load16(self.VECTOR_RESTART)
         self.a = 0
         self.b = 0
         self.ix = 0
         self.sp = 0x01FF
-        self.ch = False
-        self.ci = False
-        self.cn = False
-        self.cz = False
-        self.cv = False
-        self.cc = False
+        self.ccr = _CCR_FIXED
         self._waiting = False
         self._pending_irq = False
         self._pending_nmi = False
+        self._step_impl = self._fast_step
 
     def step(self) -> int:
+        return self._step_impl()
+
+    def _step_fast(self) -> int:
+        # _fetch_byte() inlined: one frame per instruction besides the handler.
+        pc = self.pc
+        self.pc = _WRAP16[pc + 1]
+        if self._mmio_load[pc >> 8]:
+            return self._dispatch[self._mem_load8(pc)]()
+        return self._dispatch[self._ram[pc]]()
+
+    def _step_slow(self) -> int:
+        if not (self._waiting or self._pending_nmi or self._pending_irq):
+            self._step_impl = self._fast_step
+            return self._step_fast()
+
         if self._waiting:
             if self._pending_nmi:
                 self._pending_nmi = False
                 return self._service_interrupt(self.VECTOR_NMI, 12)
-            if self._pending_irq and not self.ci:
+            if self._pending_irq and not self.ccr & _BIT_I:
                 self._pending_irq = False
                 return self._service_interrupt(self.VECTOR_IRQ, 12)
             return 1
@@ -63,20 +216,41 @@ class MB8861:
             self._pending_nmi = False
             return self._service_interrupt(self.VECTOR_NMI, 12)
 
-        if self._pending_irq and not self.ci:
+        if self._pending_irq and not self.ccr & _BIT_I:
             self._pending_irq = False
             return self._service_interrupt(self.VECTOR_IRQ, 12)
 
-        opcode = self.memory.load8(self.pc)
-        self.pc = (self.pc + 1) & 0xFFFF
-        instruction = self._decoder.lookup(opcode)
-        return instruction.handler(self, instruction.mode)
+        return self._dispatch[self._fetch_byte()]()
 
     def execute(self, clocks: int) -> int:
-        elapsed = 0
-        while elapsed < clocks:
-            elapsed += self.step()
-        return elapsed - clocks
+        self._bind_memory()
+        return self._run_loop(self, clocks)
+
+    def _execute_stepwise(self, clocks: int) -> int:
+        # Reference loop over the bound handlers; execute() must match it.
+        self._bind_memory()
+        load8 = self._mem_load8
+        ram = self._ram
+        mmio_load = self._mmio_load
+        dispatch = self._dispatch
+        fast = self._fast_step
+        remaining = clocks
+        while remaining > 0:
+            step_impl = self._step_impl
+            if step_impl is not fast:
+                remaining -= step_impl()
+                continue
+            pc = self.pc
+            self.pc = _WRAP16[pc + 1]
+            remaining -= dispatch[load8(pc) if mmio_load[pc >> 8] else ram[pc]]()
+        return -remaining
+
+    ch = _flag(_BIT_H)
+    ci = _flag(_BIT_I)
+    cn = _flag(_BIT_N)
+    cz = _flag(_BIT_Z)
+    cv = _flag(_BIT_V)
+    cc = _flag(_BIT_C)
 
     @property
     def waiting(self) -> bool:
@@ -84,9 +258,11 @@ class MB8861:
 
     def request_irq(self) -> None:
         self._pending_irq = True
+        self._step_impl = self._slow_step
 
     def request_nmi(self) -> None:
         self._pending_nmi = True
+        self._step_impl = self._slow_step
 
     def clear_irq(self) -> None:
         self._pending_irq = False
@@ -100,1765 +276,1252 @@ class MB8861:
     def _register_instructions(self) -> None:
         register = self._decoder.register
 
-        register(Instruction(0x01, "NOP", AddressingMode.IMPLIED, 2, MB8861._opcode_nop))
-        register(Instruction(0x86, "LDAA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_ldaa_imm))
-        register(Instruction(0x96, "LDAA", AddressingMode.DIRECT, 3, MB8861._opcode_ldaa_dir))
-        register(Instruction(0xA6, "LDAA", AddressingMode.DIRECT, 5, MB8861._opcode_ldaa_ind))
-        register(Instruction(0xB6, "LDAA", AddressingMode.DIRECT, 4, MB8861._opcode_ldaa_ext))
-        register(Instruction(0x97, "STAA", AddressingMode.DIRECT, 4, MB8861._opcode_staa_dir))
-        register(Instruction(0xA7, "STAA", AddressingMode.DIRECT, 6, MB8861._opcode_staa_ind))
-        register(Instruction(0xB7, "STAA", AddressingMode.DIRECT, 5, MB8861._opcode_staa_ext))
-        register(Instruction(0x48, "ASLA", AddressingMode.IMPLIED, 2, MB8861._opcode_asla))
-        register(Instruction(0x58, "ASLB", AddressingMode.IMPLIED, 2, MB8861._opcode_aslb))
-        register(Instruction(0x47, "ASRA", AddressingMode.IMPLIED, 2, MB8861._opcode_asra))
-        register(Instruction(0x57, "ASRB", AddressingMode.IMPLIED, 2, MB8861._opcode_asrb))
-        register(Instruction(0x44, "LSRA", AddressingMode.IMPLIED, 2, MB8861._opcode_lsra))
-        register(Instruction(0x54, "LSRB", AddressingMode.IMPLIED, 2, MB8861._opcode_lsrb))
-        register(Instruction(0x49, "ROLA", AddressingMode.IMPLIED, 2, MB8861._opcode_rola))
-        register(Instruction(0x59, "ROLB", AddressingMode.IMPLIED, 2, MB8861._opcode_rolb))
-        register(Instruction(0x46, "RORA", AddressingMode.IMPLIED, 2, MB8861._opcode_rora))
-        register(Instruction(0x56, "RORB", AddressingMode.IMPLIED, 2, MB8861._opcode_rorb))
-        register(Instruction(0x40, "NEGA", AddressingMode.IMPLIED, 2, MB8861._opcode_nega))
-        register(Instruction(0x50, "NEGB", AddressingMode.IMPLIED, 2, MB8861._opcode_negb))
-        register(Instruction(0x43, "COMA", AddressingMode.IMPLIED, 2, MB8861._opcode_coma))
-        register(Instruction(0x53, "COMB", AddressingMode.IMPLIED, 2, MB8861._opcode_comb))
-        register(Instruction(0x4A, "DECA", AddressingMode.IMPLIED, 2, MB8861._opcode_deca))
-        register(Instruction(0x5A, "DECB", AddressingMode.IMPLIED, 2, MB8861._opcode_decb))
-        register(Instruction(0x4C, "INCA", AddressingMode.IMPLIED, 2, MB8861._opcode_inca))
-        register(Instruction(0x5C, "INCB", AddressingMode.IMPLIED, 2, MB8861._opcode_incb))
-        register(Instruction(0x4F, "CLRA", AddressingMode.IMPLIED, 2, MB8861._opcode_clra))
-        register(Instruction(0x5F, "CLRB", AddressingMode.IMPLIED, 2, MB8861._opcode_clrb))
-        register(Instruction(0x4D, "TSTA", AddressingMode.IMPLIED, 2, MB8861._opcode_tsta))
-        register(Instruction(0x5D, "TSTB", AddressingMode.IMPLIED, 2, MB8861._opcode_tstb))
-        register(Instruction(0x19, "DAA", AddressingMode.IMPLIED, 2, MB8861._opcode_daa))
-        register(Instruction(0x1B, "ABA", AddressingMode.IMPLIED, 2, MB8861._opcode_aba))
-        register(Instruction(0x36, "PSHA", AddressingMode.IMPLIED, 4, MB8861._opcode_psha))
-        register(Instruction(0x37, "PSHB", AddressingMode.IMPLIED, 4, MB8861._opcode_pshb))
-        register(Instruction(0x32, "PULA", AddressingMode.IMPLIED, 4, MB8861._opcode_pula))
-        register(Instruction(0x33, "PULB", AddressingMode.IMPLIED, 4, MB8861._opcode_pulb))
-        register(Instruction(0x16, "TAB", AddressingMode.IMPLIED, 2, MB8861._opcode_tab))
-        register(Instruction(0x17, "TBA", AddressingMode.IMPLIED, 2, MB8861._opcode_tba))
-        register(Instruction(0x11, "CBA", AddressingMode.IMPLIED, 2, MB8861._opcode_cba))
-        register(Instruction(0x10, "SBA", AddressingMode.IMPLIED, 2, MB8861._opcode_sba))
-        register(Instruction(0x06, "TAP", AddressingMode.IMPLIED, 2, MB8861._opcode_tap))
-        register(Instruction(0x07, "TPA", AddressingMode.IMPLIED, 2, MB8861._opcode_tpa))
-        register(Instruction(0x09, "DEX", AddressingMode.IMPLIED, 4, MB8861._opcode_dex))
-        register(Instruction(0x08, "INX", AddressingMode.IMPLIED, 4, MB8861._opcode_inx))
-        register(Instruction(0x34, "DES", AddressingMode.IMPLIED, 4, MB8861._opcode_des))
-        register(Instruction(0x31, "INS", AddressingMode.IMPLIED, 4, MB8861._opcode_ins))
-        register(Instruction(0x30, "TSX", AddressingMode.IMPLIED, 4, MB8861._opcode_tsx))
-        register(Instruction(0x35, "TXS", AddressingMode.IMPLIED, 4, MB8861._opcode_txs))
-        register(Instruction(0x3E, "WAI", AddressingMode.IMPLIED, 9, MB8861._opcode_wai))
-        register(Instruction(0x3F, "SWI", AddressingMode.IMPLIED, 12, MB8861._opcode_swi))
-        register(Instruction(0x0C, "CLC", AddressingMode.IMPLIED, 2, MB8861._opcode_clc))
-        register(Instruction(0x0E, "CLI", AddressingMode.IMPLIED, 2, MB8861._opcode_cli))
-        register(Instruction(0x0A, "CLV", AddressingMode.IMPLIED, 2, MB8861._opcode_clv))
-        register(Instruction(0x0B, "SEC", AddressingMode.IMPLIED, 2, MB8861._opcode_sec))
-        register(Instruction(0x0F, "SEI", AddressingMode.IMPLIED, 2, MB8861._opcode_sei))
-        register(Instruction(0x0D, "SEV", AddressingMode.IMPLIED, 2, MB8861._opcode_sev))
-        register(Instruction(0x85, "BITA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_bita_imm))
-        register(Instruction(0x95, "BITA", AddressingMode.DIRECT, 3, MB8861._opcode_bita_dir))
-        register(Instruction(0xA5, "BITA", AddressingMode.DIRECT, 5, MB8861._opcode_bita_ind))
-        register(Instruction(0xB5, "BITA", AddressingMode.DIRECT, 4, MB8861._opcode_bita_ext))
-        register(Instruction(0x71, "NIM", AddressingMode.DIRECT, 8, MB8861._opcode_nim_ind))
-        register(Instruction(0x72, "OIM", AddressingMode.DIRECT, 8, MB8861._opcode_oim_ind))
-        register(Instruction(0x75, "XIM", AddressingMode.DIRECT, 8, MB8861._opcode_xim_ind))
-        register(Instruction(0x7B, "TMM", AddressingMode.DIRECT, 7, MB8861._opcode_tmm_ind))
-        register(Instruction(0x84, "ANDA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_anda_imm))
-        register(Instruction(0x94, "ANDA", AddressingMode.DIRECT, 3, MB8861._opcode_anda_dir))
-        register(Instruction(0xA4, "ANDA", AddressingMode.DIRECT, 5, MB8861._opcode_anda_ind))
-        register(Instruction(0xB4, "ANDA", AddressingMode.DIRECT, 4, MB8861._opcode_anda_ext))
-        register(Instruction(0x8B, "ADDA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_adda_imm))
-        register(Instruction(0x9B, "ADDA", AddressingMode.DIRECT, 3, MB8861._opcode_adda_dir))
-        register(Instruction(0xAB, "ADDA", AddressingMode.DIRECT, 5, MB8861._opcode_adda_ind))
-        register(Instruction(0xBB, "ADDA", AddressingMode.DIRECT, 4, MB8861._opcode_adda_ext))
-        register(Instruction(0x89, "ADCA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_adca_imm))
-        register(Instruction(0x99, "ADCA", AddressingMode.DIRECT, 3, MB8861._opcode_adca_dir))
-        register(Instruction(0xA9, "ADCA", AddressingMode.DIRECT, 5, MB8861._opcode_adca_ind))
-        register(Instruction(0xB9, "ADCA", AddressingMode.DIRECT, 4, MB8861._opcode_adca_ext))
-        register(Instruction(0x82, "SBCA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_sbca_imm))
-        register(Instruction(0x81, "CMPA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_cmpa_imm))
-        register(Instruction(0x91, "CMPA", AddressingMode.DIRECT, 3, MB8861._opcode_cmpa_dir))
-        register(Instruction(0xA1, "CMPA", AddressingMode.DIRECT, 5, MB8861._opcode_cmpa_ind))
-        register(Instruction(0xB1, "CMPA", AddressingMode.DIRECT, 4, MB8861._opcode_cmpa_ext))
-        register(Instruction(0x80, "SUBA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_suba_imm))
-        register(Instruction(0x90, "SUBA", AddressingMode.DIRECT, 3, MB8861._opcode_suba_dir))
-        register(Instruction(0xA0, "SUBA", AddressingMode.DIRECT, 5, MB8861._opcode_suba_ind))
-        register(Instruction(0xB0, "SUBA", AddressingMode.DIRECT, 4, MB8861._opcode_suba_ext))
-        register(Instruction(0x92, "SBCA", AddressingMode.DIRECT, 3, MB8861._opcode_sbca_dir))
-        register(Instruction(0xA2, "SBCA", AddressingMode.DIRECT, 5, MB8861._opcode_sbca_ind))
-        register(Instruction(0xB2, "SBCA", AddressingMode.DIRECT, 4, MB8861._opcode_sbca_ext))
-
-        register(Instruction(0x88, "EORA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_eora_imm))
-        register(Instruction(0x98, "EORA", AddressingMode.DIRECT, 3, MB8861._opcode_eora_dir))
-        register(Instruction(0xA8, "EORA", AddressingMode.DIRECT, 5, MB8861._opcode_eora_ind))
-        register(Instruction(0xB8, "EORA", AddressingMode.DIRECT, 4, MB8861._opcode_eora_ext))
-
-        register(Instruction(0x8A, "ORAA", AddressingMode.IMMEDIATE, 2, MB8861._opcode_oraa_imm))
-        register(Instruction(0x9A, "ORAA", AddressingMode.DIRECT, 3, MB8861._opcode_oraa_dir))
-        register(Instruction(0xAA, "ORAA", AddressingMode.DIRECT, 5, MB8861._opcode_oraa_ind))
-        register(Instruction(0xBA, "ORAA", AddressingMode.DIRECT, 4, MB8861._opcode_oraa_ext))
-
-        register(Instruction(0xC6, "LDAB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_ldab_imm))
-        register(Instruction(0xD6, "LDAB", AddressingMode.DIRECT, 3, MB8861._opcode_ldab_dir))
-        register(Instruction(0xE6, "LDAB", AddressingMode.DIRECT, 5, MB8861._opcode_ldab_ind))
-        register(Instruction(0xF6, "LDAB", AddressingMode.DIRECT, 4, MB8861._opcode_ldab_ext))
-        register(Instruction(0xC5, "BITB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_bitb_imm))
-        register(Instruction(0xD5, "BITB", AddressingMode.DIRECT, 3, MB8861._opcode_bitb_dir))
-        register(Instruction(0xE5, "BITB", AddressingMode.DIRECT, 5, MB8861._opcode_bitb_ind))
-        register(Instruction(0xF5, "BITB", AddressingMode.DIRECT, 4, MB8861._opcode_bitb_ext))
-        register(Instruction(0xCB, "ADDB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_addb_imm))
-        register(Instruction(0xDB, "ADDB", AddressingMode.DIRECT, 3, MB8861._opcode_addb_dir))
-        register(Instruction(0xEB, "ADDB", AddressingMode.DIRECT, 5, MB8861._opcode_addb_ind))
-        register(Instruction(0xFB, "ADDB", AddressingMode.DIRECT, 4, MB8861._opcode_addb_ext))
-        register(Instruction(0xEC, "ADX", AddressingMode.IMMEDIATE, 3, MB8861._opcode_adx_imm))
-        register(Instruction(0xFC, "ADX", AddressingMode.DIRECT, 7, MB8861._opcode_adx_ext))
-        register(Instruction(0xC9, "ADCB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_adcb_imm))
-        register(Instruction(0xD9, "ADCB", AddressingMode.DIRECT, 3, MB8861._opcode_adcb_dir))
-        register(Instruction(0xE9, "ADCB", AddressingMode.DIRECT, 5, MB8861._opcode_adcb_ind))
-        register(Instruction(0xF9, "ADCB", AddressingMode.DIRECT, 4, MB8861._opcode_adcb_ext))
-
-        register(Instruction(0xC4, "ANDB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_andb_imm))
-        register(Instruction(0xD4, "ANDB", AddressingMode.DIRECT, 3, MB8861._opcode_andb_dir))
-        register(Instruction(0xE4, "ANDB", AddressingMode.DIRECT, 5, MB8861._opcode_andb_ind))
-        register(Instruction(0xF4, "ANDB", AddressingMode.DIRECT, 4, MB8861._opcode_andb_ext))
-
-        register(Instruction(0xC1, "CMPB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_cmpb_imm))
-        register(Instruction(0xD1, "CMPB", AddressingMode.DIRECT, 3, MB8861._opcode_cmpb_dir))
-        register(Instruction(0xE1, "CMPB", AddressingMode.DIRECT, 5, MB8861._opcode_cmpb_ind))
-        register(Instruction(0xF1, "CMPB", AddressingMode.DIRECT, 4, MB8861._opcode_cmpb_ext))
-
-        register(Instruction(0xC8, "EORB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_eorb_imm))
-        register(Instruction(0xD8, "EORB", AddressingMode.DIRECT, 3, MB8861._opcode_eorb_dir))
-        register(Instruction(0xE8, "EORB", AddressingMode.DIRECT, 5, MB8861._opcode_eorb_ind))
-        register(Instruction(0xF8, "EORB", AddressingMode.DIRECT, 4, MB8861._opcode_eorb_ext))
-
-        register(Instruction(0xD7, "STAB", AddressingMode.DIRECT, 4, MB8861._opcode_stab_dir))
-        register(Instruction(0xE7, "STAB", AddressingMode.DIRECT, 6, MB8861._opcode_stab_ind))
-        register(Instruction(0xF7, "STAB", AddressingMode.DIRECT, 5, MB8861._opcode_stab_ext))
-
-        register(Instruction(0xCA, "ORAB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_orab_imm))
-        register(Instruction(0xDA, "ORAB", AddressingMode.DIRECT, 3, MB8861._opcode_orab_dir))
-        register(Instruction(0xEA, "ORAB", AddressingMode.DIRECT, 5, MB8861._opcode_orab_ind))
-        register(Instruction(0xFA, "ORAB", AddressingMode.DIRECT, 4, MB8861._opcode_orab_ext))
-
-        register(Instruction(0x68, "ASL", AddressingMode.DIRECT, 7, MB8861._opcode_asl_ind))
-        register(Instruction(0x78, "ASL", AddressingMode.DIRECT, 6, MB8861._opcode_asl_ext))
-        register(Instruction(0x67, "ASR", AddressingMode.DIRECT, 7, MB8861._opcode_asr_ind))
-        register(Instruction(0x77, "ASR", AddressingMode.DIRECT, 6, MB8861._opcode_asr_ext))
-        register(Instruction(0x64, "LSR", AddressingMode.DIRECT, 7, MB8861._opcode_lsr_ind))
-        register(Instruction(0x74, "LSR", AddressingMode.DIRECT, 6, MB8861._opcode_lsr_ext))
-        register(Instruction(0x69, "ROL", AddressingMode.DIRECT, 7, MB8861._opcode_rol_ind))
-        register(Instruction(0x79, "ROL", AddressingMode.DIRECT, 6, MB8861._opcode_rol_ext))
-        register(Instruction(0x66, "ROR", AddressingMode.DIRECT, 7, MB8861._opcode_ror_ind))
-        register(Instruction(0x76, "ROR", AddressingMode.DIRECT, 6, MB8861._opcode_ror_ext))
-        register(Instruction(0x60, "NEG", AddressingMode.DIRECT, 7, MB8861._opcode_neg_ind))
-        register(Instruction(0x70, "NEG", AddressingMode.DIRECT, 6, MB8861._opcode_neg_ext))
-        register(Instruction(0x63, "COM", AddressingMode.DIRECT, 7, MB8861._opcode_com_ind))
-        register(Instruction(0x73, "COM", AddressingMode.DIRECT, 6, MB8861._opcode_com_ext))
-        register(Instruction(0x6A, "DEC", AddressingMode.DIRECT, 7, MB8861._opcode_dec_ind))
-        register(Instruction(0x7A, "DEC", AddressingMode.DIRECT, 6, MB8861._opcode_dec_ext))
-        register(Instruction(0x6C, "INC", AddressingMode.DIRECT, 7, MB8861._opcode_inc_ind))
-        register(Instruction(0x7C, "INC", AddressingMode.DIRECT, 6, MB8861._opcode_inc_ext))
-        register(Instruction(0x6F, "CLR", AddressingMode.DIRECT, 7, MB8861._opcode_clr_ind))
-        register(Instruction(0x7F, "CLR", AddressingMode.DIRECT, 6, MB8861._opcode_clr_ext))
-        register(Instruction(0x6D, "TST", AddressingMode.DIRECT, 7, MB8861._opcode_tst_ind))
-        register(Instruction(0x7D, "TST", AddressingMode.DIRECT, 6, MB8861._opcode_tst_ext))
-
-        register(Instruction(0xC0, "SUBB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_subb_imm))
-        register(Instruction(0xD0, "SUBB", AddressingMode.DIRECT, 3, MB8861._opcode_subb_dir))
-        register(Instruction(0xE0, "SUBB", AddressingMode.DIRECT, 5, MB8861._opcode_subb_ind))
-        register(Instruction(0xF0, "SUBB", AddressingMode.DIRECT, 4, MB8861._opcode_subb_ext))
-        register(Instruction(0xC2, "SBCB", AddressingMode.IMMEDIATE, 2, MB8861._opcode_sbcb_imm))
-        register(Instruction(0xD2, "SBCB", AddressingMode.DIRECT, 3, MB8861._opcode_sbcb_dir))
-        register(Instruction(0xE2, "SBCB", AddressingMode.DIRECT, 5, MB8861._opcode_sbcb_ind))
-        register(Instruction(0xF2, "SBCB", AddressingMode.DIRECT, 4, MB8861._opcode_sbcb_ext))
-
-        register(Instruction(0xCE, "LDX", AddressingMode.IMMEDIATE, 3, MB8861._opcode_ldx_imm))
-        register(Instruction(0xDE, "LDX", AddressingMode.DIRECT, 4, MB8861._opcode_ldx_dir))
-        register(Instruction(0xEE, "LDX", AddressingMode.DIRECT, 6, MB8861._opcode_ldx_ind))
-        register(Instruction(0xFE, "LDX", AddressingMode.DIRECT, 5, MB8861._opcode_ldx_ext))
-        register(Instruction(0x8E, "LDS", AddressingMode.IMMEDIATE, 3, MB8861._opcode_lds_imm))
-        register(Instruction(0x9E, "LDS", AddressingMode.DIRECT, 4, MB8861._opcode_lds_dir))
-        register(Instruction(0xAE, "LDS", AddressingMode.DIRECT, 6, MB8861._opcode_lds_ind))
-        register(Instruction(0xBE, "LDS", AddressingMode.DIRECT, 5, MB8861._opcode_lds_ext))
-
-        register(Instruction(0x8C, "CPX", AddressingMode.IMMEDIATE, 3, MB8861._opcode_cpx_imm))
-        register(Instruction(0x9C, "CPX", AddressingMode.DIRECT, 4, MB8861._opcode_cpx_dir))
-        register(Instruction(0xAC, "CPX", AddressingMode.DIRECT, 6, MB8861._opcode_cpx_ind))
-        register(Instruction(0xBC, "CPX", AddressingMode.DIRECT, 5, MB8861._opcode_cpx_ext))
-
-        register(Instruction(0xDF, "STX", AddressingMode.DIRECT, 5, MB8861._opcode_stx_dir))
-        register(Instruction(0xEF, "STX", AddressingMode.DIRECT, 7, MB8861._opcode_stx_ind))
-        register(Instruction(0xFF, "STX", AddressingMode.DIRECT, 6, MB8861._opcode_stx_ext))
-        register(Instruction(0x9F, "STS", AddressingMode.DIRECT, 5, MB8861._opcode_sts_dir))
-        register(Instruction(0xAF, "STS", AddressingMode.DIRECT, 7, MB8861._opcode_sts_ind))
-        register(Instruction(0xBF, "STS", AddressingMode.DIRECT, 6, MB8861._opcode_sts_ext))
-
-        register(Instruction(0x8D, "BSR", AddressingMode.RELATIVE, 8, MB8861._opcode_bsr_rel))
-        register(Instruction(0xAD, "JSR", AddressingMode.DIRECT, 8, MB8861._opcode_jsr_ind))
-        register(Instruction(0xBD, "JSR", AddressingMode.DIRECT, 9, MB8861._opcode_jsr_ext))
-        register(Instruction(0x6E, "JMP", AddressingMode.DIRECT, 4, MB8861._opcode_jmp_ind))
-        register(Instruction(0x7E, "JMP", AddressingMode.DIRECT, 3, MB8861._opcode_jmp_ext))
-        register(Instruction(0x39, "RTS", AddressingMode.IMPLIED, 5, MB8861._opcode_rts))
-        register(Instruction(0x3B, "RTI", AddressingMode.IMPLIED, 10, MB8861._opcode_rti))
-
-        register(Instruction(0x24, "BCC", AddressingMode.RELATIVE, 4, MB8861._opcode_bcc_rel))
-        register(Instruction(0x22, "BHI", AddressingMode.RELATIVE, 4, MB8861._opcode_bhi_rel))
-        register(Instruction(0x23, "BLS", AddressingMode.RELATIVE, 4, MB8861._opcode_bls_rel))
-        register(Instruction(0x25, "BCS", AddressingMode.RELATIVE, 4, MB8861._opcode_bcs_rel))
-        register(Instruction(0x26, "BNE", AddressingMode.RELATIVE, 4, MB8861._opcode_bne_rel))
-        register(Instruction(0x27, "BEQ", AddressingMode.RELATIVE, 4, MB8861._opcode_beq_rel))
-        register(Instruction(0x28, "BVC", AddressingMode.RELATIVE, 4, MB8861._opcode_bvc_rel))
-        register(Instruction(0x29, "BVS", AddressingMode.RELATIVE, 4, MB8861._opcode_bvs_rel))
-        register(Instruction(0x2A, "BPL", AddressingMode.RELATIVE, 4, MB8861._opcode_bpl_rel))
-        register(Instruction(0x2D, "BLT", AddressingMode.RELATIVE, 4, MB8861._opcode_blt_rel))
-        register(Instruction(0x2E, "BGT", AddressingMode.RELATIVE, 4, MB8861._opcode_bgt_rel))
-        register(Instruction(0x2B, "BMI", AddressingMode.RELATIVE, 4, MB8861._opcode_bmi_rel))
-        register(Instruction(0x2C, "BGE", AddressingMode.RELATIVE, 4, MB8861._opcode_bge_rel))
-        register(Instruction(0x2F, "BLE", AddressingMode.RELATIVE, 4, MB8861._opcode_ble_rel))
-        register(Instruction(0x20, "BRA", AddressingMode.RELATIVE, 4, MB8861._opcode_bra_rel))
-
-    # ------------------------------------------------------------------
-    # Opcode handlers (8-bit data)
+        def implied(
+            opcode: int, name: str, cycles: int, handler: Handler, template: Optional[str] = None
+        ) -> None:
+            register(Instruction(opcode, name, AddressingMode.IMPLIED, cycles, handler, template))
+
+        def family(
+            handler: Handler,
+            name: str,
+            *forms: tuple[int, AddressingMode, int],
+            template: Optional[Callable[[AddressingMode], str]] = None,
+            immediate_bytes: int = 1,
+        ) -> None:
+            # One handler serves every addressing mode of an instruction; the
+            # mode and cycle count are bound per opcode, and the inline
+            # template is built per mode.
+            for opcode, mode, cycles in forms:
+                bound = _specialize(handler, mode, cycles)
+                source = None if template is None else template(mode)
+                size = immediate_bytes if mode is _IMMEDIATE else 2 if mode is _EXTENDED else 1
+                register(Instruction(opcode, name, mode, cycles, bound, source, size))
+
+        def branch(opcode: int, name: str) -> None:
+            # Conditional branches share _do_branch; the bound mask is the
+            # condition's truth table over CCR bits 3-0 (see BRANCH_MASKS).
+            bound = _specialize(MB8861._do_branch, _BRANCH_MASKS[opcode & 0x0F])
+            source = templates.branch(opcode)
+            register(Instruction(opcode, name, AddressingMode.RELATIVE, 4, bound, source, 1))
+
+        implied(0x01, "NOP", 2, MB8861._opcode_nop, templates.NOP)
+        # The accumulator ALU instructions: A at the listed opcode, B 0x40
+        # above it, each in four addressing modes 0x10 apart.  CMP and BIT
+        # return the accumulator unchanged.
+        for stem, opcode, operation, template in (
+            ("SUB", 0x80, MB8861._sub, templates.subtract),
+            ("CMP", 0x81, MB8861._cmp, templates.compare),
+            ("SBC", 0x82, MB8861._sbc, templates.subtract_with_carry),
+            ("AND", 0x84, MB8861._and, partial(templates.logical, "&")),
+            ("BIT", 0x85, MB8861._bit, templates.bit),
+            ("EOR", 0x88, MB8861._eor, partial(templates.logical, "^")),
+            ("ADC", 0x89, MB8861._adc, templates.add_with_carry),
+            ("ORA", 0x8A, MB8861._ora, partial(templates.logical, "|")),
+            ("ADD", 0x8B, MB8861._add, templates.add),
+        ):
+            for acc, handler, base in (
+                ("a", MB8861._do_alu_a, opcode),
+                ("b", MB8861._do_alu_b, opcode + 0x40),
+            ):
+                family(
+                    _specialize(handler, operation),
+                    stem + acc.upper(),
+                    (base, AddressingMode.IMMEDIATE, 2),
+                    (base + 0x10, AddressingMode.DIRECT, 3),
+                    (base + 0x20, AddressingMode.INDEXED, 5),
+                    (base + 0x30, AddressingMode.EXTENDED, 4),
+                    template=partial(template, acc),
+                )
+        family(
+            MB8861._do_ldaa,
+            "LDAA",
+            (0x86, AddressingMode.IMMEDIATE, 2),
+            (0x96, AddressingMode.DIRECT, 3),
+            (0xA6, AddressingMode.INDEXED, 5),
+            (0xB6, AddressingMode.EXTENDED, 4),
+            template=partial(templates.load, "a"),
+        )
+        family(
+            MB8861._do_staa,
+            "STAA",
+            (0x97, AddressingMode.DIRECT, 4),
+            (0xA7, AddressingMode.INDEXED, 6),
+            (0xB7, AddressingMode.EXTENDED, 5),
+            template=partial(templates.store, "a"),
+        )
+        implied(0x48, "ASLA", 2, MB8861._opcode_asla, unary("asl", "a"))
+        implied(0x58, "ASLB", 2, MB8861._opcode_aslb, unary("asl", "b"))
+        implied(0x47, "ASRA", 2, MB8861._opcode_asra, unary("asr", "a"))
+        implied(0x57, "ASRB", 2, MB8861._opcode_asrb, unary("asr", "b"))
+        implied(0x44, "LSRA", 2, MB8861._opcode_lsra, unary("lsr", "a"))
+        implied(0x54, "LSRB", 2, MB8861._opcode_lsrb, unary("lsr", "b"))
+        implied(0x49, "ROLA", 2, MB8861._opcode_rola, unary("rol", "a"))
+        implied(0x59, "ROLB", 2, MB8861._opcode_rolb, unary("rol", "b"))
+        implied(0x46, "RORA", 2, MB8861._opcode_rora, unary("ror", "a"))
+        implied(0x56, "RORB", 2, MB8861._opcode_rorb, unary("ror", "b"))
+        implied(0x40, "NEGA", 2, MB8861._opcode_nega, unary("neg", "a"))
+        implied(0x50, "NEGB", 2, MB8861._opcode_negb, unary("neg", "b"))
+        implied(0x43, "COMA", 2, MB8861._opcode_coma, unary("com", "a"))
+        implied(0x53, "COMB", 2, MB8861._opcode_comb, unary("com", "b"))
+        implied(0x4A, "DECA", 2, MB8861._opcode_deca, unary("dec", "a"))
+        implied(0x5A, "DECB", 2, MB8861._opcode_decb, unary("dec", "b"))
+        implied(0x4C, "INCA", 2, MB8861._opcode_inca, unary("inc", "a"))
+        implied(0x5C, "INCB", 2, MB8861._opcode_incb, unary("inc", "b"))
+        implied(0x4F, "CLRA", 2, MB8861._opcode_clra, unary("clr", "a"))
+        implied(0x5F, "CLRB", 2, MB8861._opcode_clrb, unary("clr", "b"))
+        implied(0x4D, "TSTA", 2, MB8861._opcode_tsta, unary("tst", "a"))
+        implied(0x5D, "TSTB", 2, MB8861._opcode_tstb, unary("tst", "b"))
+        implied(0x19, "DAA", 2, MB8861._opcode_daa, templates.DAA)
+        implied(0x1B, "ABA", 2, MB8861._opcode_aba, templates.ABA)
+        implied(0x36, "PSHA", 4, MB8861._opcode_psha, templates.push("a"))
+        implied(0x37, "PSHB", 4, MB8861._opcode_pshb, templates.push("b"))
+        implied(0x32, "PULA", 4, MB8861._opcode_pula, templates.pull("a"))
+        implied(0x33, "PULB", 4, MB8861._opcode_pulb, templates.pull("b"))
+        implied(0x16, "TAB", 2, MB8861._opcode_tab, templates.TAB)
+        implied(0x17, "TBA", 2, MB8861._opcode_tba, templates.TBA)
+        implied(0x11, "CBA", 2, MB8861._opcode_cba, templates.CBA)
+        implied(0x10, "SBA", 2, MB8861._opcode_sba, templates.SBA)
+        implied(0x06, "TAP", 2, MB8861._opcode_tap, templates.TAP)
+        implied(0x07, "TPA", 2, MB8861._opcode_tpa, templates.TPA)
+        implied(0x09, "DEX", 4, MB8861._opcode_dex, templates.DEX)
+        implied(0x08, "INX", 4, MB8861._opcode_inx, templates.INX)
+        implied(0x34, "DES", 4, MB8861._opcode_des, templates.DES)
+        implied(0x31, "INS", 4, MB8861._opcode_ins, templates.INS)
+        implied(0x30, "TSX", 4, MB8861._opcode_tsx, templates.TSX)
+        implied(0x35, "TXS", 4, MB8861._opcode_txs, templates.TXS)
+        implied(0x3E, "WAI", 9, MB8861._opcode_wai)
+        implied(0x3F, "SWI", 12, MB8861._opcode_swi)
+        implied(0x0C, "CLC", 2, MB8861._opcode_clc, templates.CLC)
+        implied(0x0E, "CLI", 2, MB8861._opcode_cli, templates.CLI)
+        implied(0x0A, "CLV", 2, MB8861._opcode_clv, templates.CLV)
+        implied(0x0B, "SEC", 2, MB8861._opcode_sec, templates.SEC)
+        implied(0x0F, "SEI", 2, MB8861._opcode_sei, templates.SEI)
+        implied(0x0D, "SEV", 2, MB8861._opcode_sev, templates.SEV)
+        register(
+            Instruction(
+                0x71,
+                "NIM",
+                AddressingMode.INDEXED,
+                8,
+                _specialize(MB8861._do_modify_indexed, MB8861._nim),
+                templates.immediate_to_indexed("nim"),
+                2,
+            )
+        )
+        register(
+            Instruction(
+                0x72,
+                "OIM",
+                AddressingMode.INDEXED,
+                8,
+                _specialize(MB8861._do_modify_indexed, MB8861._oim),
+                templates.immediate_to_indexed("oim"),
+                2,
+            )
+        )
+        register(
+            Instruction(
+                0x75,
+                "XIM",
+                AddressingMode.INDEXED,
+                8,
+                _specialize(MB8861._do_modify_indexed, MB8861._xim),
+                templates.immediate_to_indexed("xim"),
+                2,
+            )
+        )
+        register(
+            Instruction(
+                0x7B,
+                "TMM",
+                AddressingMode.INDEXED,
+                7,
+                MB8861._opcode_tmm_ind,
+                templates.immediate_to_indexed("tmm"),
+                2,
+            )
+        )
+        family(
+            MB8861._do_ldab,
+            "LDAB",
+            (0xC6, AddressingMode.IMMEDIATE, 2),
+            (0xD6, AddressingMode.DIRECT, 3),
+            (0xE6, AddressingMode.INDEXED, 5),
+            (0xF6, AddressingMode.EXTENDED, 4),
+            template=partial(templates.load, "b"),
+        )
+        register(
+            Instruction(
+                0xEC,
+                "ADX",
+                AddressingMode.IMMEDIATE,
+                3,
+                MB8861._opcode_adx_imm,
+                templates.add_ix(AddressingMode.IMMEDIATE),
+                1,
+            )
+        )
+        register(
+            Instruction(
+                0xFC,
+                "ADX",
+                AddressingMode.EXTENDED,
+                7,
+                MB8861._opcode_adx_ext,
+                templates.add_ix(AddressingMode.EXTENDED),
+                2,
+            )
+        )
+        family(
+            MB8861._do_stab,
+            "STAB",
+            (0xD7, AddressingMode.DIRECT, 4),
+            (0xE7, AddressingMode.INDEXED, 6),
+            (0xF7, AddressingMode.EXTENDED, 5),
+            template=partial(templates.store, "b"),
+        )
 
-    def _opcode_nop(self, _mode: AddressingMode) -> int:
-        return 2
+        family(
+            _specialize(MB8861._do_modify, MB8861._asl),
+            "ASL",
+            (0x68, AddressingMode.INDEXED, 7),
+            (0x78, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "asl"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._asr),
+            "ASR",
+            (0x67, AddressingMode.INDEXED, 7),
+            (0x77, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "asr"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._lsr),
+            "LSR",
+            (0x64, AddressingMode.INDEXED, 7),
+            (0x74, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "lsr"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._rol),
+            "ROL",
+            (0x69, AddressingMode.INDEXED, 7),
+            (0x79, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "rol"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._ror),
+            "ROR",
+            (0x66, AddressingMode.INDEXED, 7),
+            (0x76, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "ror"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._neg),
+            "NEG",
+            (0x60, AddressingMode.INDEXED, 7),
+            (0x70, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "neg"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._com),
+            "COM",
+            (0x63, AddressingMode.INDEXED, 7),
+            (0x73, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "com"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._dec),
+            "DEC",
+            (0x6A, AddressingMode.INDEXED, 7),
+            (0x7A, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "dec"),
+        )
+        family(
+            _specialize(MB8861._do_modify, MB8861._inc),
+            "INC",
+            (0x6C, AddressingMode.INDEXED, 7),
+            (0x7C, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "inc"),
+        )
+        family(
+            MB8861._do_clr,
+            "CLR",
+            (0x6F, AddressingMode.INDEXED, 7),
+            (0x7F, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "clr"),
+        )
+        family(
+            MB8861._do_tst,
+            "TST",
+            (0x6D, AddressingMode.INDEXED, 7),
+            (0x7D, AddressingMode.EXTENDED, 6),
+            template=partial(unary, "tst"),
+        )
 
-    def _opcode_ldaa_imm(self, _mode: AddressingMode) -> int:
-        value = self._fetch_byte()
-        self.a = self._lda(value)
-        return 2
+        family(
+            MB8861._do_ldx,
+            "LDX",
+            (0xCE, AddressingMode.IMMEDIATE, 3),
+            (0xDE, AddressingMode.DIRECT, 4),
+            (0xEE, AddressingMode.INDEXED, 6),
+            (0xFE, AddressingMode.EXTENDED, 5),
+            template=partial(templates.load16, "ix"),
+            immediate_bytes=2,
+        )
+        family(
+            MB8861._do_lds,
+            "LDS",
+            (0x8E, AddressingMode.IMMEDIATE, 3),
+            (0x9E, AddressingMode.DIRECT, 4),
+            (0xAE, AddressingMode.INDEXED, 6),
+            (0xBE, AddressingMode.EXTENDED, 5),
+            template=partial(templates.load16, "sp"),
+            immediate_bytes=2,
+        )
 
-    def _opcode_ldaa_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.a = self._lda(self._load_direct(address))
-        return 3
+        family(
+            MB8861._do_cpx,
+            "CPX",
+            (0x8C, AddressingMode.IMMEDIATE, 3),
+            (0x9C, AddressingMode.DIRECT, 4),
+            (0xAC, AddressingMode.INDEXED, 6),
+            (0xBC, AddressingMode.EXTENDED, 5),
+            template=templates.compare_ix,
+            immediate_bytes=2,
+        )
 
-    def _opcode_ldaa_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.a = self._lda(self._load_indexed(offset))
-        return 5
+        family(
+            MB8861._do_stx,
+            "STX",
+            (0xDF, AddressingMode.DIRECT, 5),
+            (0xEF, AddressingMode.INDEXED, 7),
+            (0xFF, AddressingMode.EXTENDED, 6),
+            template=partial(templates.store16_flags_from_ix, "ix"),
+        )
+        family(
+            MB8861._do_sts,
+            "STS",
+            (0x9F, AddressingMode.DIRECT, 5),
+            (0xAF, AddressingMode.INDEXED, 7),
+            (0xBF, AddressingMode.EXTENDED, 6),
+            template=partial(templates.store16_flags_from_ix, "sp"),
+        )
 
-    def _opcode_ldaa_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.a = self._lda(self._load_extended(address))
-        return 4
+        register(
+            Instruction(
+                0x8D, "BSR", AddressingMode.RELATIVE, 8, MB8861._opcode_bsr_rel, templates.BSR, 1
+            )
+        )
+        family(
+            MB8861._do_jsr,
+            "JSR",
+            (0xAD, AddressingMode.INDEXED, 8),
+            (0xBD, AddressingMode.EXTENDED, 9),
+            template=templates.jump_to_subroutine,
+        )
+        family(
+            MB8861._do_jmp,
+            "JMP",
+            (0x6E, AddressingMode.INDEXED, 4),
+            (0x7E, AddressingMode.EXTENDED, 3),
+            template=templates.jump,
+        )
+        implied(0x39, "RTS", 5, MB8861._opcode_rts, templates.RTS)
+        implied(0x3B, "RTI", 10, MB8861._opcode_rti, templates.RTI)
+
+        branch(0x24, "BCC")
+        branch(0x22, "BHI")
+        branch(0x23, "BLS")
+        branch(0x25, "BCS")
+        branch(0x26, "BNE")
+        branch(0x27, "BEQ")
+        branch(0x28, "BVC")
+        branch(0x29, "BVS")
+        branch(0x2A, "BPL")
+        branch(0x2D, "BLT")
+        branch(0x2E, "BGT")
+        branch(0x2B, "BMI")
+        branch(0x2C, "BGE")
+        branch(0x2F, "BLE")
+        branch(0x20, "BRA")
 
-    def _opcode_staa_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._sta_direct(address, self.a)
-        return 4
+    # ------------------------------------------------------------------
+    # Opcode handlers (8-bit data)
 
-    def _opcode_staa_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._sta_indexed(offset, self.a)
-        return 6
+    def _opcode_undefined(self, opcode: int) -> int:
+        raise UndefinedOpcodeError(opcode, _WRAP16[self.pc - 1])
 
-    def _opcode_staa_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._sta_extended(address, self.a)
-        return 5
+    def _opcode_nop(self) -> int:
+        return 2
 
-    def _opcode_asla(self, _mode: AddressingMode) -> int:
+    def _opcode_asla(self) -> int:
         self.a = self._asl(self.a)
         return 2
 
-    def _opcode_aslb(self, _mode: AddressingMode) -> int:
+    def _opcode_aslb(self) -> int:
         self.b = self._asl(self.b)
         return 2
 
-    def _opcode_asra(self, _mode: AddressingMode) -> int:
+    def _opcode_asra(self) -> int:
         self.a = self._asr(self.a)
         return 2
 
-    def _opcode_asrb(self, _mode: AddressingMode) -> int:
+    def _opcode_asrb(self) -> int:
         self.b = self._asr(self.b)
         return 2
 
-    def _opcode_lsra(self, _mode: AddressingMode) -> int:
+    def _opcode_lsra(self) -> int:
         self.a = self._lsr(self.a)
         return 2
 
-    def _opcode_lsrb(self, _mode: AddressingMode) -> int:
+    def _opcode_lsrb(self) -> int:
         self.b = self._lsr(self.b)
         return 2
 
-    def _opcode_rola(self, _mode: AddressingMode) -> int:
+    def _opcode_rola(self) -> int:
         self.a = self._rol(self.a)
         return 2
 
-    def _opcode_rolb(self, _mode: AddressingMode) -> int:
+    def _opcode_rolb(self) -> int:
         self.b = self._rol(self.b)
         return 2
 
-    def _opcode_rora(self, _mode: AddressingMode) -> int:
+    def _opcode_rora(self) -> int:
         self.a = self._ror(self.a)
         return 2
 
-    def _opcode_rorb(self, _mode: AddressingMode) -> int:
+    def _opcode_rorb(self) -> int:
         self.b = self._ror(self.b)
         return 2
 
-    def _opcode_nega(self, _mode: AddressingMode) -> int:
+    def _opcode_nega(self) -> int:
         self.a = self._neg(self.a)
         return 2
 
-    def _opcode_negb(self, _mode: AddressingMode) -> int:
+    def _opcode_negb(self) -> int:
         self.b = self._neg(self.b)
         return 2
 
-    def _opcode_coma(self, _mode: AddressingMode) -> int:
+    def _opcode_coma(self) -> int:
         self.a = self._com(self.a)
         return 2
 
-    def _opcode_comb(self, _mode: AddressingMode) -> int:
+    def _opcode_comb(self) -> int:
         self.b = self._com(self.b)
         return 2
 
-    def _opcode_deca(self, _mode: AddressingMode) -> int:
+    def _opcode_deca(self) -> int:
         self.a = self._dec(self.a)
         return 2
 
-    def _opcode_decb(self, _mode: AddressingMode) -> int:
+    def _opcode_decb(self) -> int:
         self.b = self._dec(self.b)
         return 2
 
-    def _opcode_inca(self, _mode: AddressingMode) -> int:
+    def _opcode_inca(self) -> int:
         self.a = self._inc(self.a)
         return 2
 
-    def _opcode_incb(self, _mode: AddressingMode) -> int:
+    def _opcode_incb(self) -> int:
         self.b = self._inc(self.b)
         return 2
 
-    def _opcode_clra(self, _mode: AddressingMode) -> int:
-        self.a = self._clr()
+    def _opcode_clra(self) -> int:
+        self.a = 0
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _BIT_Z
         return 2
 
-    def _opcode_clrb(self, _mode: AddressingMode) -> int:
-        self.b = self._clr()
+    def _opcode_clrb(self) -> int:
+        self.b = 0
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _BIT_Z
         return 2
 
-    def _opcode_tsta(self, _mode: AddressingMode) -> int:
-        self._tst(self.a)
+    def _opcode_tsta(self) -> int:
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _NZ[self.a]
         return 2
 
-    def _opcode_tstb(self, _mode: AddressingMode) -> int:
-        self._tst(self.b)
+    def _opcode_tstb(self) -> int:
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _NZ[self.b]
         return 2
 
-    def _opcode_psha(self, _mode: AddressingMode) -> int:
+    def _opcode_psha(self) -> int:
         self._push_byte(self.a)
         return 4
 
-    def _opcode_pshb(self, _mode: AddressingMode) -> int:
+    def _opcode_pshb(self) -> int:
         self._push_byte(self.b)
         return 4
 
-    def _opcode_pula(self, _mode: AddressingMode) -> int:
+    def _opcode_pula(self) -> int:
         self.a = self._pull_byte()
         return 4
 
-    def _opcode_pulb(self, _mode: AddressingMode) -> int:
+    def _opcode_pulb(self) -> int:
         self.b = self._pull_byte()
         return 4
 
-    def _opcode_tab(self, _mode: AddressingMode) -> int:
+    def _opcode_tab(self) -> int:
         self._tab()
         return 2
 
-    def _opcode_tba(self, _mode: AddressingMode) -> int:
+    def _opcode_tba(self) -> int:
         self._tba()
         return 2
 
-    def _opcode_cba(self, _mode: AddressingMode) -> int:
+    def _opcode_cba(self) -> int:
         self._cmp(self.a, self.b)
         return 2
 
-    def _opcode_daa(self, _mode: AddressingMode) -> int:
+    def _opcode_daa(self) -> int:
         self.a = self._daa()
         return 2
 
-    def _opcode_aba(self, _mode: AddressingMode) -> int:
+    def _opcode_aba(self) -> int:
         self.a = self._add(self.a, self.b)
         return 2
 
-    def _opcode_sba(self, _mode: AddressingMode) -> int:
+    def _opcode_sba(self) -> int:
         self.a = self._sub(self.a, self.b)
         return 2
 
-    def _opcode_tap(self, _mode: AddressingMode) -> int:
+    def _opcode_tap(self) -> int:
         self._tap()
         return 2
 
-    def _opcode_tpa(self, _mode: AddressingMode) -> int:
+    def _opcode_tpa(self) -> int:
         self._tpa()
         return 2
 
-    def _opcode_dex(self, _mode: AddressingMode) -> int:
+    def _opcode_dex(self) -> int:
         self._dex()
         return 4
 
-    def _opcode_inx(self, _mode: AddressingMode) -> int:
+    def _opcode_inx(self) -> int:
         self._inx()
         return 4
 
-    def _opcode_des(self, _mode: AddressingMode) -> int:
+    def _opcode_des(self) -> int:
         self._des()
         return 4
 
-    def _opcode_ins(self, _mode: AddressingMode) -> int:
+    def _opcode_ins(self) -> int:
         self._ins()
         return 4
 
-    def _opcode_tsx(self, _mode: AddressingMode) -> int:
-        self.ix = (self.sp + 1) & 0xFFFF
+    def _opcode_tsx(self) -> int:
+        self.ix = _WRAP16[self.sp + 1]
         return 4
 
-    def _opcode_txs(self, _mode: AddressingMode) -> int:
-        self.sp = (self.ix - 1) & 0xFFFF
+    def _opcode_txs(self) -> int:
+        self.sp = _WRAP16[self.ix - 1]
         return 4
 
-    def _opcode_clc(self, _mode: AddressingMode) -> int:
-        self.cc = False
+    def _opcode_clc(self) -> int:
+        self.ccr &= 0xFF & ~_BIT_C
         return 2
 
-    def _opcode_cli(self, _mode: AddressingMode) -> int:
-        self.ci = False
+    def _opcode_cli(self) -> int:
+        self.ccr &= 0xFF & ~_BIT_I
         return 2
 
-    def _opcode_clv(self, _mode: AddressingMode) -> int:
-        self.cv = False
+    def _opcode_clv(self) -> int:
+        self.ccr &= 0xFF & ~_BIT_V
         return 2
 
-    def _opcode_sec(self, _mode: AddressingMode) -> int:
-        self.cc = True
+    def _opcode_sec(self) -> int:
+        self.ccr |= _BIT_C
         return 2
 
-    def _opcode_sei(self, _mode: AddressingMode) -> int:
-        self.ci = True
+    def _opcode_sei(self) -> int:
+        self.ccr |= _BIT_I
         return 2
 
-    def _opcode_sev(self, _mode: AddressingMode) -> int:
-        self.cv = True
+    def _opcode_sev(self) -> int:
+        self.ccr |= _BIT_V
         return 2
 
-    def _opcode_wai(self, _mode: AddressingMode) -> int:
+    def _opcode_wai(self) -> int:
         self._waiting = True
+        self._step_impl = self._slow_step
         return 9
 
-    def _opcode_swi(self, _mode: AddressingMode) -> int:
+    def _opcode_swi(self) -> int:
         self._push_all_registers()
-        self.ci = True
+        self.ccr |= _BIT_I
         self.pc = self._load16_extended(self.VECTOR_SWI)
         self._waiting = False
         return 12
 
-    def _opcode_bita_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self._bit(self.a, operand)
-        return 2
+    def _opcode_tmm_ind(self) -> int:
+        operands = self._fetch_word()
+        address = _WRAP16[self.ix + (operands & 0xFF)]
+        if self._mmio_load[address >> 8]:
+            self._tmm(operands >> 8, self._mem_load8(address))
+        else:
+            self._tmm(operands >> 8, self._ram[address])
+        return 7
 
-    def _opcode_bita_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._bit(self.a, self._load_direct(address))
-        return 3
+    def _do_modify_indexed(self, operation: _BinaryOperation) -> int:
+        # NIM/OIM/XIM: immediate byte, then the offset of the indexed operand.
+        operands = self._fetch_word()
+        address = _WRAP16[self.ix + (operands & 0xFF)]
+        page = address >> 8
+        ram = self._ram
+        value = self._mem_load8(address) if self._mmio_load[page] else ram[address]
+        result = operation(self, operands >> 8, value)
+        if self._mmio_store[page]:
+            self._mem_store8(address, result)
+        else:
+            ram[address] = result
+            self._code_page_dirty[page] = 1
+        return 8
 
-    def _opcode_bita_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._bit(self.a, self._load_indexed(offset))
-        return 5
+    def _opcode_adx_imm(self) -> int:
+        self.ix = self._add16(self.ix, self._fetch_byte())
+        return 3
 
-    def _opcode_bita_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._bit(self.a, self._load_extended(address))
-        return 4
+    def _opcode_adx_ext(self) -> int:
+        self.ix = self._add16(self.ix, self._load16_extended(self._fetch_word()))
+        return 7
 
-    def _opcode_bitb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self._bit(self.b, operand)
-        return 2
+    # ------------------------------------------------------------------
+    # Opcode handlers shared across addressing modes (see family())
 
-    def _opcode_bitb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._bit(self.b, self._load_direct(address))
-        return 3
+    def _do_alu_a(self, mode: AddressingMode, cycles: int, operation: _BinaryOperation) -> int:
+        self.a = operation(self, self.a, self._operand_readers[mode]())
+        return cycles
 
-    def _opcode_bitb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._bit(self.b, self._load_indexed(offset))
-        return 5
+    def _do_alu_b(self, mode: AddressingMode, cycles: int, operation: _BinaryOperation) -> int:
+        self.b = operation(self, self.b, self._operand_readers[mode]())
+        return cycles
 
-    def _opcode_bitb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._bit(self.b, self._load_extended(address))
-        return 4
+    def _do_ldaa(self, mode: AddressingMode, cycles: int) -> int:
+        self.a = self._lda(self._operand_readers[mode]())
+        return cycles
 
-    def _opcode_nim_ind(self, _mode: AddressingMode) -> int:
-        value = self._fetch_byte()
-        offset = self._fetch_byte()
-        result = self._nim(value, self._load_indexed(offset))
-        self._store_indexed(offset, result)
-        return 8
+    def _do_ldab(self, mode: AddressingMode, cycles: int) -> int:
+        self.b = self._lda(self._operand_readers[mode]())
+        return cycles
 
-    def _opcode_oim_ind(self, _mode: AddressingMode) -> int:
-        value = self._fetch_byte()
-        offset = self._fetch_byte()
-        result = self._oim(value, self._load_indexed(offset))
-        self._store_indexed(offset, result)
-        return 8
+    def _do_staa(self, mode: AddressingMode, cycles: int) -> int:
+        address = self._address_resolvers[mode]()
+        value = self.a
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[value]
+        page = address >> 8
+        if self._mmio_store[page]:
+            self._mem_store8(address, value)
+        else:
+            self._ram[address] = value
+            self._code_page_dirty[page] = 1
+        return cycles
 
-    def _opcode_xim_ind(self, _mode: AddressingMode) -> int:
-        value = self._fetch_byte()
-        offset = self._fetch_byte()
-        result = self._xim(value, self._load_indexed(offset))
-        self._store_indexed(offset, result)
-        return 8
+    def _do_stab(self, mode: AddressingMode, cycles: int) -> int:
+        address = self._address_resolvers[mode]()
+        value = self.b
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[value]
+        page = address >> 8
+        if self._mmio_store[page]:
+            self._mem_store8(address, value)
+        else:
+            self._ram[address] = value
+            self._code_page_dirty[page] = 1
+        return cycles
 
-    def _opcode_tmm_ind(self, _mode: AddressingMode) -> int:
-        value = self._fetch_byte()
-        offset = self._fetch_byte()
-        self._tmm(value, self._load_indexed(offset))
-        return 7
+    def _do_ldx(self, mode: AddressingMode, cycles: int) -> int:
+        self._ldx(self._read_operand16(mode))
+        return cycles
 
-    def _opcode_asl_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._asl(value))
-        return 7
+    def _do_lds(self, mode: AddressingMode, cycles: int) -> int:
+        self._lds(self._read_operand16(mode))
+        return cycles
 
-    def _opcode_asl_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._asl(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    def _do_cpx(self, mode: AddressingMode, cycles: int) -> int:
+        self._cpx(self._read_operand16(mode))
+        return cycles
 
-    def _opcode_asr_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._asr(value))
-        return 7
+    def _do_stx(self, mode: AddressingMode, cycles: int) -> int:
+        ix = self.ix
+        self._write_operand16(mode, ix)
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ16[ix]
+        return cycles
 
-    def _opcode_asr_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._asr(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    def _do_sts(self, mode: AddressingMode, cycles: int) -> int:
+        self._write_operand16(mode, self.sp)
+        # Java parity: STS derives N/Z from IX, not SP.
+        ix = self.ix
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ16[ix]
+        return cycles
 
-    def _opcode_lsr_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._lsr(value))
-        return 7
+    def _do_jmp(self, mode: AddressingMode, cycles: int) -> int:
+        self.pc = self._address_resolvers[mode]()
+        return cycles
 
-    def _opcode_lsr_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._lsr(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    def _do_jsr(self, mode: AddressingMode, cycles: int) -> int:
+        target = self._address_resolvers[mode]()
+        self._push_word(self.pc)
+        self.pc = target
+        return cycles
 
-    def _opcode_rol_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._rol(value))
-        return 7
+    def _do_modify(self, mode: AddressingMode, cycles: int, operation: _UnaryOperation) -> int:
+        # Read-modify-write on memory; ``operation`` is the 8-bit helper (_asl, ...).
+        address = self._address_resolvers[mode]()
+        page = address >> 8
+        ram = self._ram
+        value = self._mem_load8(address) if self._mmio_load[page] else ram[address]
+        result = operation(self, value)
+        if self._mmio_store[page]:
+            self._mem_store8(address, result)
+        else:
+            ram[address] = result
+            self._code_page_dirty[page] = 1
+        return cycles
 
-    def _opcode_rol_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._rol(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    def _do_clr(self, mode: AddressingMode, cycles: int) -> int:
+        address = self._address_resolvers[mode]()
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _BIT_Z
+        if self._mmio_store[address >> 8]:
+            self._mem_store8(address, 0)
+        else:
+            self._ram[address] = 0
+            self._code_page_dirty[address >> 8] = 1
+        return cycles
 
-    def _opcode_ror_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._ror(value))
-        return 7
+    def _do_tst(self, mode: AddressingMode, cycles: int) -> int:
+        address = self._address_resolvers[mode]()
+        value = self._mem_load8(address) if self._mmio_load[address >> 8] else self._ram[address]
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _NZ[value]
+        return cycles
 
-    def _opcode_ror_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._ror(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    # ------------------------------------------------------------------
+    # Opcode handlers (branches)
 
-    def _opcode_neg_ind(self, _mode: AddressingMode) -> int:
+    def _do_branch(self, mask: int) -> int:
         offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._neg(value))
-        return 7
-
-    def _opcode_neg_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._neg(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+        if mask >> (self.ccr & 0x0F) & 1:
+            self.pc = _WRAP16[self.pc + _SIGNED8[offset]]
+        return 4
 
-    def _opcode_com_ind(self, _mode: AddressingMode) -> int:
+    def _opcode_bsr_rel(self) -> int:
         offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._com(value))
-        return 7
+        pc = self.pc
+        # _push_word inlined for the flat-RAM case; subroutine calls are hot.
+        sp = self.sp
+        high = _WRAP16[sp - 1]
+        mmio = self._mmio_store
+        if mmio[high >> 8] or mmio[sp >> 8]:
+            self._push_word(pc)
+        else:
+            self.sp = _WRAP16[sp - 2]
+            ram = self._ram
+            ram[high] = pc >> 8
+            ram[sp] = pc & 0xFF
+            dirty = self._code_page_dirty
+            dirty[high >> 8] = 1
+            dirty[sp >> 8] = 1
+        self.pc = _WRAP16[pc + _SIGNED8[offset]]
+        return 8
 
-    def _opcode_com_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._com(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    def _opcode_rts(self) -> int:
+        # _pop_word inlined for the flat-RAM case.
+        sp = self.sp
+        high = _WRAP16[sp + 1]
+        low = _WRAP16[sp + 2]
+        mmio = self._mmio_load
+        if mmio[high >> 8] or mmio[low >> 8]:
+            self.pc = self._pop_word()
+        else:
+            self.sp = low
+            ram = self._ram
+            self.pc = (ram[high] << 8) | ram[low]
+        return 5
 
-    def _opcode_dec_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._dec(value))
-        return 7
+    def _opcode_rti(self) -> int:
+        self._pop_all_registers()
+        return 10
 
-    def _opcode_dec_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._dec(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    # ------------------------------------------------------------------
+    # Memory helpers
+    #
+    # Addresses passed in are already wrapped (0-0xFFFF, or 0-0xFF for the
+    # direct-page helpers), values are register-width, and the memory's
+    # load8 returns bytes, so none of these mask their inputs again.  New
+    # 16-bit values wrap through _WRAP16 (codegen.WRAP16), which is cheaper
+    # than ``& 0xFFFF`` in CPython.
+
+    def _bind_memory(self) -> None:
+        # Cache the flat RAM image and per-page MMIO flags so plain RAM accesses
+        # skip the memory object, plus its bound load8/store8 for the rest.
+        # Memories without a flat image dispatch every access through those.
+        # Stores into the image flag their page in the memory's dirty_pages,
+        # which tells the block cache what to re-check.  Rebound on reset(),
+        # on execute() and whenever MemorySystem swaps its accessors (tracing
+        # toggled), so step() alone sees the change too.
+        memory = self.memory
+        self._mem_load8 = memory.load8
+        self._mem_store8 = memory.store8
+        ram = getattr(memory, "mem", None)
+        if ram is None:
+            self._ram = _NO_RAM
+            self._mmio_load = self._mmio_store = _ALL_PAGES
+            self._code_page_dirty = _NO_PAGES
+        else:
+            self._ram = ram
+            self._mmio_load = memory.mmio_load
+            self._mmio_store = memory.mmio_store
+            self._code_page_dirty = memory.dirty_pages
+        self._blocks.bind(
+            self._ram,
+            self._mmio_load,
+            self._mmio_store,
+            self._mem_load8,
+            self._mem_store8,
+            self._code_page_dirty,
+        )
 
-    def _opcode_inc_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._store_indexed(offset, self._inc(value))
-        return 7
+    def _indexed_address(self) -> int:
+        return _WRAP16[self.ix + self._fetch_byte()]
 
-    def _opcode_inc_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        result = self._inc(self._load_extended(address))
-        self.memory.store8(address & 0xFFFF, result & 0xFF)
-        return 6
+    def _read_direct(self) -> int:
+        address = self._fetch_byte()
+        if self._mmio_load[address >> 8]:
+            return self._mem_load8(address)
+        return self._ram[address]
 
-    def _opcode_clr_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._store_indexed(offset, self._clr())
-        return 7
+    def _read_indexed(self) -> int:
+        address = _WRAP16[self.ix + self._fetch_byte()]
+        if self._mmio_load[address >> 8]:
+            return self._mem_load8(address)
+        return self._ram[address]
 
-    def _opcode_clr_ext(self, _mode: AddressingMode) -> int:
+    def _read_extended(self) -> int:
         address = self._fetch_word()
-        value = self._clr()
-        self.memory.store8(address & 0xFFFF, value & 0xFF)
-        return 6
-
-    def _opcode_tst_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        value = self._load_indexed(offset)
-        self._tst(value)
-        return 7
+        if self._mmio_load[address >> 8]:
+            return self._mem_load8(address)
+        return self._ram[address]
+
+    def _read_operand16(self, mode: AddressingMode) -> int:
+        if mode is _DIRECT:
+            # Direct-page words wrap within page zero.
+            return self._load16_direct(self._fetch_byte())
+        if mode is _INDEXED:
+            return self._load16_extended(self._indexed_address())
+        # Immediate data or an extended address: the two bytes after the
+        # opcode, read straight from the RAM image unless either is MMIO.
+        pc = self.pc
+        following = _WRAP16[pc + 1]
+        mmio = self._mmio_load
+        if mmio[pc >> 8] or mmio[following >> 8]:
+            word = self._fetch_word()
+        else:
+            ram = self._ram
+            word = (ram[pc] << 8) | ram[following]
+            self.pc = _WRAP16[pc + 2]
+        if mode is _IMMEDIATE:
+            return word
+        if mmio[word >> 8] or mmio[_WRAP16[word + 1] >> 8]:
+            return self._load16_extended(word)
+        ram = self._ram
+        return (ram[word] << 8) | ram[_WRAP16[word + 1]]
+
+    def _write_operand16(self, mode: AddressingMode, value: int) -> None:
+        if mode is _DIRECT:
+            self._store16_direct(self._fetch_byte(), value)
+        elif mode is _INDEXED:
+            self._store16_extended(self._indexed_address(), value)
+        else:
+            pc = self.pc
+            following = _WRAP16[pc + 1]
+            mmio = self._mmio_load
+            if mmio[pc >> 8] or mmio[following >> 8]:
+                address = self._fetch_word()
+            else:
+                ram = self._ram
+                address = (ram[pc] << 8) | ram[following]
+                self.pc = _WRAP16[pc + 2]
+            self._store16_extended(address, value)
 
-    def _opcode_tst_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        value = self._load_extended(address)
-        self._tst(value)
-        return 6
+    def _fetch_byte(self) -> int:
+        pc = self.pc
+        self.pc = _WRAP16[pc + 1]
+        if self._mmio_load[pc >> 8]:
+            return self._mem_load8(pc)
+        return self._ram[pc]
 
-    def _opcode_adda_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.a = self._add(self.a, operand)
-        return 2
+    def _fetch_word(self) -> int:
+        pc = self.pc
+        following = _WRAP16[pc + 1]
+        self.pc = _WRAP16[pc + 2]
+        mmio = self._mmio_load
+        if mmio[pc >> 8] or mmio[following >> 8]:
+            load8 = self._mem_load8
+            hi = load8(pc)
+            return (hi << 8) | load8(following)
+        ram = self._ram
+        return (ram[pc] << 8) | ram[following]
 
-    def _opcode_adda_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self.a = self._add(self.a, operand)
-        return 3
+    def _load_extended(self, address: int) -> int:
+        if self._mmio_load[address >> 8]:
+            return self._mem_load8(address)
+        return self._ram[address]
 
-    def _opcode_adda_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self.a = self._add(self.a, operand)
-        return 5
+    def _load16_direct(self, address: int) -> int:
+        following = (address + 1) & 0xFF
+        if self._mmio_load[0]:
+            load8 = self._mem_load8
+            hi = load8(address)
+            return (hi << 8) | load8(following)
+        ram = self._ram
+        return (ram[address] << 8) | ram[following]
 
-    def _opcode_adda_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self.a = self._add(self.a, operand)
-        return 4
+    def _load16_extended(self, address: int) -> int:
+        following = _WRAP16[address + 1]
+        mmio = self._mmio_load
+        if mmio[address >> 8] or mmio[following >> 8]:
+            load8 = self._mem_load8
+            hi = load8(address)
+            return (hi << 8) | load8(following)
+        ram = self._ram
+        return (ram[address] << 8) | ram[following]
+
+    def _store8(self, address: int, value: int) -> None:
+        if self._mmio_store[address >> 8]:
+            self._mem_store8(address, value)
+        else:
+            self._ram[address] = value
+            self._code_page_dirty[address >> 8] = 1
 
-    def _opcode_anda_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.a = self._and(self.a, operand)
-        return 2
+    def _store16_direct(self, address: int, value: int) -> None:
+        following = (address + 1) & 0xFF
+        if self._mmio_store[0]:
+            store8 = self._mem_store8
+            store8(address, value >> 8)
+            store8(following, value & 0xFF)
+        else:
+            ram = self._ram
+            ram[address] = value >> 8
+            ram[following] = value & 0xFF
+            self._code_page_dirty[0] = 1
 
-    def _opcode_anda_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.a = self._and(self.a, self._load_direct(address))
-        return 3
+    def _store16_extended(self, address: int, value: int) -> None:
+        following = _WRAP16[address + 1]
+        mmio = self._mmio_store
+        if mmio[address >> 8] or mmio[following >> 8]:
+            store8 = self._mem_store8
+            store8(address, value >> 8)
+            store8(following, value & 0xFF)
+        else:
+            ram = self._ram
+            ram[address] = value >> 8
+            ram[following] = value & 0xFF
+            dirty = self._code_page_dirty
+            dirty[address >> 8] = 1
+            dirty[following >> 8] = 1
 
-    def _opcode_anda_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.a = self._and(self.a, self._load_indexed(offset))
-        return 5
+    # ------------------------------------------------------------------
+    # Arithmetic helpers
 
-    def _opcode_anda_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.a = self._and(self.a, self._load_extended(address))
-        return 4
+    def _lda(self, value: int) -> int:
+        value &= 0xFF
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[value]
+        return value
 
-    def _opcode_eora_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.a = self._eor(self.a, operand)
-        return 2
+    def _and(self, x: int, y: int) -> int:
+        value = x & y
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[value]
+        return value
 
-    def _opcode_eora_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.a = self._eor(self.a, self._load_direct(address))
-        return 3
+    def _eor(self, x: int, y: int) -> int:
+        value = x ^ y
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[value]
+        return value
 
-    def _opcode_eora_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.a = self._eor(self.a, self._load_indexed(offset))
-        return 5
+    def _ora(self, x: int, y: int) -> int:
+        value = x | y
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[value]
+        return value
 
-    def _opcode_eora_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.a = self._eor(self.a, self._load_extended(address))
-        return 4
+    def _bit(self, x: int, y: int) -> int:
+        result = x & y
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[result]
+        return x
 
-    def _opcode_oraa_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.a = self._ora(self.a, operand)
-        return 2
+    def _nim(self, x: int, y: int) -> int:
+        value = x & y
+        # Java parity: N is the complement of Z rather than bit 7.
+        self.ccr = (self.ccr & _CLEAR_NZV) | (_BIT_N if value else _BIT_Z)
+        return value
 
-    def _opcode_oraa_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.a = self._ora(self.a, self._load_direct(address))
-        return 3
+    def _oim(self, x: int, y: int) -> int:
+        value = x | y
+        # Java parity: N is the complement of Z rather than bit 7.
+        self.ccr = (self.ccr & _CLEAR_NZV) | (_BIT_N if value else _BIT_Z)
+        return value
 
-    def _opcode_oraa_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.a = self._ora(self.a, self._load_indexed(offset))
-        return 5
+    def _xim(self, x: int, y: int) -> int:
+        value = x ^ y
+        # Java parity: N is the complement of Z rather than bit 7.
+        self.ccr = (self.ccr & _CLEAR_NZV) | (_BIT_N if value else _BIT_Z)
+        return value
 
-    def _opcode_oraa_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.a = self._ora(self.a, self._load_extended(address))
-        return 4
+    def _tmm(self, x: int, y: int) -> None:
+        if x == 0 or y == 0:
+            flags = _BIT_Z
+        elif y == 0xFF:
+            flags = _BIT_V
+        else:
+            flags = _BIT_N
+        self.ccr = (self.ccr & _CLEAR_NZV) | flags
 
-    def _opcode_adca_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.a = self._adc(self.a, operand)
-        return 2
+    def _tab(self) -> None:
+        self.b = self._lda(self.a)
 
-    def _opcode_adca_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self.a = self._adc(self.a, operand)
-        return 3
+    def _tba(self) -> None:
+        self.a = self._lda(self.b)
 
-    def _opcode_adca_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self.a = self._adc(self.a, operand)
-        return 5
+    def _tap(self) -> None:
+        self.ccr = _CCR_FIXED | (self.a & 0x3F)
 
-    def _opcode_adca_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self.a = self._adc(self.a, operand)
-        return 4
+    def _tpa(self) -> None:
+        self.a = self.ccr
 
-    def _opcode_sbca_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.a = self._sbc(self.a, operand)
-        return 2
+    def _dex(self) -> None:
+        ix = self.ix = _WRAP16[self.ix - 1]
+        self.ccr = (self.ccr & _CLEAR_Z) | (0 if ix else _BIT_Z)
 
-    def _opcode_sbca_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self.a = self._sbc(self.a, operand)
-        return 3
+    def _inx(self) -> None:
+        ix = self.ix = _WRAP16[self.ix + 1]
+        self.ccr = (self.ccr & _CLEAR_Z) | (0 if ix else _BIT_Z)
 
-    def _opcode_sbca_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self.a = self._sbc(self.a, operand)
-        return 5
+    def _des(self) -> None:
+        self.sp = _WRAP16[self.sp - 1]
 
-    def _opcode_sbca_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self.a = self._sbc(self.a, operand)
-        return 4
-
-    def _opcode_cmpa_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self._cmp(self.a, operand)
-        return 2
-
-    def _opcode_cmpa_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self._cmp(self.a, operand)
-        return 3
-
-    def _opcode_cmpa_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self._cmp(self.a, operand)
-        return 5
-
-    def _opcode_cmpa_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self._cmp(self.a, operand)
-        return 4
-
-    def _opcode_suba_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.a = self._sub(self.a, operand)
-        return 2
-
-    def _opcode_suba_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self.a = self._sub(self.a, operand)
-        return 3
-
-    def _opcode_suba_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self.a = self._sub(self.a, operand)
-        return 5
-
-    def _opcode_suba_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self.a = self._sub(self.a, operand)
-        return 4
-
-    def _opcode_ldab_imm(self, _mode: AddressingMode) -> int:
-        value = self._fetch_byte()
-        self.b = self._lda(value)
-        return 2
-
-    def _opcode_andb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.b = self._and(self.b, operand)
-        return 2
-
-    def _opcode_andb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.b = self._and(self.b, self._load_direct(address))
-        return 3
-
-    def _opcode_andb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.b = self._and(self.b, self._load_indexed(offset))
-        return 5
-
-    def _opcode_andb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.b = self._and(self.b, self._load_extended(address))
-        return 4
-
-    def _opcode_adcb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.b = self._adc(self.b, operand)
-        return 2
-
-    def _opcode_adcb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self.b = self._adc(self.b, operand)
-        return 3
-
-    def _opcode_adcb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self.b = self._adc(self.b, operand)
-        return 5
-
-    def _opcode_adcb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self.b = self._adc(self.b, operand)
-        return 4
-
-    def _opcode_ldab_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.b = self._lda(self._load_direct(address))
-        return 3
-
-    def _opcode_ldab_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.b = self._lda(self._load_indexed(offset))
-        return 5
-
-    def _opcode_ldab_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.b = self._lda(self._load_extended(address))
-        return 4
-
-    def _opcode_addb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.b = self._add(self.b, operand)
-        return 2
-
-    def _opcode_addb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self.b = self._add(self.b, operand)
-        return 3
-
-    def _opcode_addb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self.b = self._add(self.b, operand)
-        return 5
-
-    def _opcode_addb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self.b = self._add(self.b, operand)
-        return 4
-
-    def _opcode_eorb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.b = self._eor(self.b, operand)
-        return 2
-
-    def _opcode_eorb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.b = self._eor(self.b, self._load_direct(address))
-        return 3
-
-    def _opcode_eorb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.b = self._eor(self.b, self._load_indexed(offset))
-        return 5
-
-    def _opcode_eorb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.b = self._eor(self.b, self._load_extended(address))
-        return 4
-
-    def _opcode_cmpb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self._cmp(self.b, operand)
-        return 2
-
-    def _opcode_cmpb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._cmp(self.b, self._load_direct(address))
-        return 3
-
-    def _opcode_cmpb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._cmp(self.b, self._load_indexed(offset))
-        return 5
-
-    def _opcode_cmpb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._cmp(self.b, self._load_extended(address))
-        return 4
-
-    def _opcode_subb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.b = self._sub(self.b, operand)
-        return 2
-
-    def _opcode_subb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.b = self._sub(self.b, self._load_direct(address))
-        return 3
-
-    def _opcode_subb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.b = self._sub(self.b, self._load_indexed(offset))
-        return 5
-
-    def _opcode_subb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.b = self._sub(self.b, self._load_extended(address))
-        return 4
-
-    def _opcode_sbcb_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.b = self._sbc(self.b, operand)
-        return 2
-
-    def _opcode_sbcb_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        operand = self._load_direct(address)
-        self.b = self._sbc(self.b, operand)
-        return 3
-
-    def _opcode_sbcb_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        operand = self._load_indexed(offset)
-        self.b = self._sbc(self.b, operand)
-        return 5
-
-    def _opcode_sbcb_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load_extended(address)
-        self.b = self._sbc(self.b, operand)
-        return 4
-
-    def _opcode_orab_imm(self, _mode: AddressingMode) -> int:
-        operand = self._fetch_byte()
-        self.b = self._ora(self.b, operand)
-        return 2
-
-    def _opcode_orab_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self.b = self._ora(self.b, self._load_direct(address))
-        return 3
-
-    def _opcode_orab_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.b = self._ora(self.b, self._load_indexed(offset))
-        return 5
-
-    def _opcode_orab_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.b = self._ora(self.b, self._load_extended(address))
-        return 4
-
-    def _opcode_stab_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._sta_direct(address, self.b)
-        return 4
-
-    def _opcode_stab_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._sta_indexed(offset, self.b)
-        return 6
-
-    def _opcode_stab_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._sta_extended(address, self.b)
-        return 5
-
-    def _opcode_adx_imm(self, _mode: AddressingMode) -> int:
-        value = self._fetch_byte()
-        self.ix = self._add16(self.ix, value & 0xFF)
-        return 3
-
-    def _opcode_adx_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        operand = self._load16_extended(address)
-        self.ix = self._add16(self.ix, operand)
-        return 7
-
-    # ------------------------------------------------------------------
-    # Opcode handlers (16-bit data)
-
-    def _opcode_ldx_imm(self, _mode: AddressingMode) -> int:
-        value = self._fetch_word()
-        self._ldx(value)
-        return 3
-
-    def _opcode_ldx_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._ldx(self._load16_direct(address))
-        return 4
-
-    def _opcode_ldx_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._ldx(self._load16_indexed(offset))
-        return 6
-
-    def _opcode_ldx_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._ldx(self._load16_extended(address))
-        return 5
-
-    def _opcode_lds_imm(self, _mode: AddressingMode) -> int:
-        value = self._fetch_word()
-        self._lds(value)
-        return 3
-
-    def _opcode_lds_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._lds(self._load16_direct(address))
-        return 4
-
-    def _opcode_lds_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._lds(self._load16_indexed(offset))
-        return 6
-
-    def _opcode_lds_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._lds(self._load16_extended(address))
-        return 5
-
-    def _opcode_cpx_imm(self, _mode: AddressingMode) -> int:
-        value = self._fetch_word()
-        self._cpx(value)
-        return 3
-
-    def _opcode_cpx_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._cpx(self._load16_direct(address))
-        return 4
-
-    def _opcode_cpx_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._cpx(self._load16_indexed(offset))
-        return 6
-
-    def _opcode_cpx_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._cpx(self._load16_extended(address))
-        return 5
-
-    def _opcode_stx_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._stx_direct(address)
-        return 5
-
-    def _opcode_stx_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._stx_indexed(offset)
-        return 7
-
-    def _opcode_stx_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._stx_extended(address)
-        return 6
-
-    def _opcode_sts_dir(self, _mode: AddressingMode) -> int:
-        address = self._fetch_byte()
-        self._store16_direct(address, self.sp)
-        self.cn = (self.ix & 0x8000) != 0
-        self.cz = self.ix == 0
-        self.cv = False
-        return 5
-
-    def _opcode_sts_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._store16_indexed(offset, self.sp)
-        self.cn = (self.ix & 0x8000) != 0
-        self.cz = self.ix == 0
-        self.cv = False
-        return 7
-
-    def _opcode_sts_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._store16_extended(address, self.sp)
-        self.cn = (self.ix & 0x8000) != 0
-        self.cz = self.ix == 0
-        self.cv = False
-        return 6
-
-    # ------------------------------------------------------------------
-    # Opcode handlers (branches)
-
-    def _opcode_bra_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, True)
-        return 4
-
-    def _opcode_bcc_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, not self.cc)
-        return 4
-
-    def _opcode_bhi_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, not (self.cc or self.cz))
-        return 4
-
-    def _opcode_bls_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, self.cc or self.cz)
-        return 4
-
-    def _opcode_bcs_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, self.cc)
-        return 4
-
-    def _opcode_bne_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, not self.cz)
-        return 4
-
-    def _opcode_beq_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, self.cz)
-        return 4
-
-    def _opcode_bvc_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, not self.cv)
-        return 4
-
-    def _opcode_bvs_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, self.cv)
-        return 4
-
-    def _opcode_bpl_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, not self.cn)
-        return 4
-
-    def _opcode_bmi_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, self.cn)
-        return 4
-
-    def _opcode_blt_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, self.cn ^ self.cv)
-        return 4
-
-    def _opcode_bgt_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, not (self.cz or (self.cn ^ self.cv)))
-        return 4
-
-    def _opcode_bge_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, not (self.cn ^ self.cv))
-        return 4
-
-    def _opcode_ble_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._branch(offset, self.cz or (self.cn ^ self.cv))
-        return 4
-
-    def _opcode_bsr_rel(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self._push_word(self.pc)
-        self._branch(offset, True)
-        return 8
-
-    def _opcode_jsr_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        target = (self.ix + (offset & 0xFF)) & 0xFFFF
-        self._push_word(self.pc)
-        self.pc = target
-        return 8
-
-    def _opcode_jsr_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self._push_word(self.pc)
-        self.pc = address
-        return 9
-
-    def _opcode_jmp_ind(self, _mode: AddressingMode) -> int:
-        offset = self._fetch_byte()
-        self.pc = (self.ix + (offset & 0xFF)) & 0xFFFF
-        return 4
-
-    def _opcode_jmp_ext(self, _mode: AddressingMode) -> int:
-        address = self._fetch_word()
-        self.pc = address & 0xFFFF
-        return 3
-
-    def _opcode_rts(self, _mode: AddressingMode) -> int:
-        self.pc = self._pop_word()
-        return 5
-
-    def _opcode_rti(self, _mode: AddressingMode) -> int:
-        self._pop_all_registers()
-        return 10
-
-    # ------------------------------------------------------------------
-    # Memory helpers
-
-    def _fetch_byte(self) -> int:
-        value = self.memory.load8(self.pc)
-        self.pc = (self.pc + 1) & 0xFFFF
-        return value & 0xFF
-
-    def _fetch_word(self) -> int:
-        hi = self._fetch_byte()
-        lo = self._fetch_byte()
-        return ((hi << 8) | lo) & 0xFFFF
-
-    def _load_direct(self, address: int) -> int:
-        return self.memory.load8(address & 0xFF)
-
-    def _load_indexed(self, offset: int) -> int:
-        base = (self.ix + (offset & 0xFF)) & 0xFFFF
-        return self.memory.load8(base)
-
-    def _store_indexed(self, offset: int, value: int) -> None:
-        base = (self.ix + (offset & 0xFF)) & 0xFFFF
-        self.memory.store8(base, value & 0xFF)
-
-    def _load_extended(self, address: int) -> int:
-        return self.memory.load8(address & 0xFFFF)
-
-    def _load16_direct(self, address: int) -> int:
-        hi = self.memory.load8(address & 0xFF)
-        lo = self.memory.load8((address + 1) & 0xFF)
-        return ((hi << 8) | lo) & 0xFFFF
-
-    def _load16_indexed(self, offset: int) -> int:
-        base = (self.ix + (offset & 0xFF)) & 0xFFFF
-        hi = self.memory.load8(base)
-        lo = self.memory.load8((base + 1) & 0xFFFF)
-        return ((hi << 8) | lo) & 0xFFFF
-
-    def _load16_extended(self, address: int) -> int:
-        hi = self.memory.load8(address & 0xFFFF)
-        lo = self.memory.load8((address + 1) & 0xFFFF)
-        return ((hi << 8) | lo) & 0xFFFF
-
-    def _sta_flags(self, value: int) -> int:
-        value &= 0xFF
-        self.cn = (value & 0x80) != 0
-        self.cz = value == 0
-        self.cv = False
-        return value
-
-    def _sta_direct(self, address: int, value: int) -> None:
-        self.memory.store8(address & 0xFF, self._sta_flags(value))
-
-    def _sta_indexed(self, offset: int, value: int) -> None:
-        base = (self.ix + (offset & 0xFF)) & 0xFFFF
-        self.memory.store8(base, self._sta_flags(value))
-
-    def _sta_extended(self, address: int, value: int) -> None:
-        self.memory.store8(address & 0xFFFF, self._sta_flags(value))
-
-    def _store16_direct(self, address: int, value: int) -> None:
-        hi = (value >> 8) & 0xFF
-        lo = value & 0xFF
-        self.memory.store8(address & 0xFF, hi)
-        self.memory.store8((address + 1) & 0xFF, lo)
-
-    def _store16_indexed(self, offset: int, value: int) -> None:
-        base = (self.ix + (offset & 0xFF)) & 0xFFFF
-        hi = (value >> 8) & 0xFF
-        lo = value & 0xFF
-        self.memory.store8(base, hi)
-        self.memory.store8((base + 1) & 0xFFFF, lo)
-
-    def _store16_extended(self, address: int, value: int) -> None:
-        hi = (value >> 8) & 0xFF
-        lo = value & 0xFF
-        self.memory.store8(address & 0xFFFF, hi)
-        self.memory.store8((address + 1) & 0xFFFF, lo)
-
-    # ------------------------------------------------------------------
-    # Arithmetic helpers
-
-    def _lda(self, value: int) -> int:
-        value &= 0xFF
-        self.cn = (value & 0x80) != 0
-        self.cz = value == 0
-        self.cv = False
-        return value
-
-    def _and(self, x: int, y: int) -> int:
-        result = (x & 0xFF) & (y & 0xFF)
-        value = result & 0xFF
-        self.cn = (value & 0x80) != 0
-        self.cz = value == 0
-        self.cv = False
-        return value
-
-    def _eor(self, x: int, y: int) -> int:
-        value = ((x & 0xFF) ^ (y & 0xFF)) & 0xFF
-        self.cn = (value & 0x80) != 0
-        self.cz = value == 0
-        self.cv = False
-        return value
-
-    def _ora(self, x: int, y: int) -> int:
-        value = ((x & 0xFF) | (y & 0xFF)) & 0xFF
-        self.cn = (value & 0x80) != 0
-        self.cz = value == 0
-        self.cv = False
-        return value
-
-    def _bit(self, x: int, y: int) -> None:
-        result = (x & 0xFF) & (y & 0xFF)
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cv = False
-
-    def _nim(self, x: int, y: int) -> int:
-        result = (x & 0xFF) & (y & 0xFF)
-        value = result & 0xFF
-        self.cz = value == 0
-        self.cn = not self.cz
-        self.cv = False
-        return value
-
-    def _oim(self, x: int, y: int) -> int:
-        result = (x & 0xFF) | (y & 0xFF)
-        value = result & 0xFF
-        self.cz = value == 0
-        self.cn = not self.cz
-        self.cv = False
-        return value
-
-    def _xim(self, x: int, y: int) -> int:
-        result = (x & 0xFF) ^ (y & 0xFF)
-        value = result & 0xFF
-        self.cz = value == 0
-        self.cn = not self.cz
-        self.cv = False
-        return value
-
-    def _tmm(self, x: int, y: int) -> None:
-        value_x = x & 0xFF
-        value_y = y & 0xFF
-        if value_x == 0 or value_y == 0:
-            self.cn = False
-            self.cz = True
-            self.cv = False
-        elif value_y == 0xFF:
-            self.cn = False
-            self.cz = False
-            self.cv = True
-        else:
-            self.cn = True
-            self.cz = False
-            self.cv = False
-
-    def _tab(self) -> None:
-        self.b = self._lda(self.a)
-
-    def _tba(self) -> None:
-        self.a = self._lda(self.b)
-
-    def _tap(self) -> None:
-        value = self.a & 0xFF
-        self.ch = bool(value & 0x20)
-        self.ci = bool(value & 0x10)
-        self.cn = bool(value & 0x08)
-        self.cz = bool(value & 0x04)
-        self.cv = bool(value & 0x02)
-        self.cc = bool(value & 0x01)
-
-    def _tpa(self) -> None:
-        value = 0xC0
-        if self.ch:
-            value |= 0x20
-        if self.ci:
-            value |= 0x10
-        if self.cn:
-            value |= 0x08
-        if self.cz:
-            value |= 0x04
-        if self.cv:
-            value |= 0x02
-        if self.cc:
-            value |= 0x01
-        self.a = value & 0xFF
-
-    def _dex(self) -> None:
-        self.ix = (self.ix - 1) & 0xFFFF
-        self.cz = self.ix == 0
-
-    def _inx(self) -> None:
-        self.ix = (self.ix + 1) & 0xFFFF
-        self.cz = self.ix == 0
-
-    def _des(self) -> None:
-        self.sp = (self.sp - 1) & 0xFFFF
-
-    def _ins(self) -> None:
-        self.sp = (self.sp + 1) & 0xFFFF
+    def _ins(self) -> None:
+        self.sp = _WRAP16[self.sp + 1]
 
     def _asl(self, value: int) -> int:
-        total = (value & 0xFF) << 1
+        total = value << 1
         result = total & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cc = total > 0xFF
-        self.cv = self.cn != self.cc
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _NZ[result] | _SHIFT_FLAGS[total]
         return result
 
     def _asr(self, value: int) -> int:
-        result = ((value & 0xFF) >> 1) | (value & 0x80)
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cc = (value & 0x01) != 0
-        self.cv = self.cn != self.cc
-        return result & 0xFF
+        result = (value >> 1) | (value & 0x80)
+        self.ccr = (
+            (self.ccr & _CLEAR_NZVC) | _NZ[result] | _SHIFT_FLAGS[((value & 1) << 8) | result]
+        )
+        return result
 
     def _lsr(self, value: int) -> int:
-        result = (value & 0xFF) >> 1
-        self.cn = False
-        self.cz = result == 0
-        self.cc = (value & 0x01) != 0
-        self.cv = self.cn != self.cc
-        return result & 0xFF
+        result = value >> 1
+        self.ccr = (
+            (self.ccr & _CLEAR_NZVC) | _NZ[result] | _SHIFT_FLAGS[((value & 1) << 8) | result]
+        )
+        return result
 
     def _rol(self, value: int) -> int:
-        total = ((value & 0xFF) << 1) | (1 if self.cc else 0)
+        ccr = self.ccr
+        total = (value << 1) | (ccr & _BIT_C)
         result = total & 0xFF
-        new_cc = total > 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cc = new_cc
-        self.cv = self.cn != self.cc
+        self.ccr = (ccr & _CLEAR_NZVC) | _NZ[result] | _SHIFT_FLAGS[total]
         return result
 
     def _ror(self, value: int) -> int:
-        result = ((value & 0xFF) >> 1) | (0x80 if self.cc else 0)
-        new_cc = (value & 0x01) != 0
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cc = new_cc
-        self.cv = self.cn != self.cc
-        return result & 0xFF
+        ccr = self.ccr
+        result = (value >> 1) | ((ccr & _BIT_C) << 7)
+        self.ccr = (ccr & _CLEAR_NZVC) | _NZ[result] | _SHIFT_FLAGS[((value & 1) << 8) | result]
+        return result
 
     def _neg(self, value: int) -> int:
-        total = - (value & 0xFF)
-        result = total & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = total == 0
-        self.cv = result == 0x80
-        self.cc = result == 0x00
+        result = -value & 0xFF
+        # Java parity: C is set when the result is zero.
+        if result == 0:
+            flags = _BIT_Z | _BIT_C
+        elif result == 0x80:
+            flags = _BIT_N | _BIT_V
+        else:
+            flags = (result >> 4) & _BIT_N
+        self.ccr = (self.ccr & _CLEAR_NZVC) | flags
         return result
 
     def _com(self, value: int) -> int:
         result = (~value) & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cv = False
-        self.cc = True
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _NZ[result] | _BIT_C
         return result
 
-    def _clr(self) -> int:
-        self.cn = False
-        self.cz = True
-        self.cv = False
-        self.cc = False
-        return 0
-
     def _inc(self, value: int) -> int:
         result = (value + 1) & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cv = (value & 0xFF) == 0x7F
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[result] | (_BIT_V if result == 0x80 else 0)
         return result
 
     def _dec(self, value: int) -> int:
         result = (value - 1) & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        self.cv = (value & 0xFF) == 0x80
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ[result] | (_BIT_V if result == 0x7F else 0)
         return result
 
     def _daa(self) -> int:
-        original = self.a & 0xFF
+        ccr = self.ccr
+        original = self.a
         value = original
-        if (value & 0x0F) >= 0x0A or self.ch:
+        if (value & 0x0F) >= 0x0A or ccr & _BIT_H:
             value += 0x06
         carry_adjust = (value & 0xF0) >= 0xA0
         if carry_adjust:
             value += 0x60
         result = value & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        signed_original = self._to_signed(original)
-        self.cv = (signed_original > 0 and self.cn) or (signed_original < 0 and not self.cn)
+        # Java parity: V when the sign flips, but never from zero.
+        overflow = (((original ^ result) & 0x80) >> 6) if original else 0
+        self.ccr = (
+            (ccr & (_CLEAR_NZVC | _BIT_C))
+            | _NZ[result]
+            | overflow
+            | (_BIT_C if carry_adjust else 0)
+        )
         self.a = result
-        self.cc = carry_adjust or self.cc
         return result
 
-    def _tst(self, value: int) -> None:
-        masked = value & 0xFF
-        self.cn = (masked & 0x80) != 0
-        self.cz = masked == 0
-        self.cv = False
-        self.cc = False
-
     def _ldx(self, value: int) -> None:
-        self.ix = value & 0xFFFF
-        self.cn = (self.ix & 0x8000) != 0
-        self.cz = self.ix == 0
-        self.cv = False
+        ix = self.ix = value
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ16[ix]
 
     def _lds(self, value: int) -> None:
-        self.sp = value & 0xFFFF
-        self.cn = (self.sp & 0x8000) != 0
-        self.cz = self.sp == 0
-        self.cv = False
+        sp = self.sp = value
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ16[sp]
 
     def _cpx(self, value: int) -> None:
-        diff = (self.ix - (value & 0xFFFF)) & 0x1FFFF
-        result = diff & 0xFFFF
-        self.cn = (result & 0x8000) != 0
-        self.cz = result == 0
-        ix_signed = self._to_signed16(self.ix)
-        val_signed = self._to_signed16(value)
-        self.cv = (ix_signed > 0 and val_signed < 0 and self.cn) or (
-            ix_signed < 0 and val_signed > 0 and not self.cn
-        )
+        ix = self.ix
+        result = _WRAP16[ix - value]
+        # Java parity: no overflow when IX is zero.
+        overflow = (((ix ^ value) & (ix ^ result) & 0x8000) >> 14) if ix else 0
+        self.ccr = (self.ccr & _CLEAR_NZV) | _NZ16[result] | overflow
 
-    def _stx_direct(self, address: int) -> None:
-        self._store16_direct(address, self.ix)
-        self.cn = (self.ix & 0x8000) != 0
-        self.cz = self.ix == 0
-        self.cv = False
-
-    def _stx_indexed(self, offset: int) -> None:
-        self._store16_indexed(offset, self.ix)
-        self.cn = (self.ix & 0x8000) != 0
-        self.cz = self.ix == 0
-        self.cv = False
-
-    def _stx_extended(self, address: int) -> None:
-        self._store16_extended(address, self.ix)
-        self.cn = (self.ix & 0x8000) != 0
-        self.cz = self.ix == 0
-        self.cv = False
+    # H/V/C come from the codegen tables, whose upper half holds the
+    # carry-in variants (Java-parity V and H quirks included).
 
     def _add(self, x: int, y: int) -> int:
-        total = (x & 0xFF) + (y & 0xFF)
-        result = total & 0xFF
-        self.ch = ((x & 0x0F) + (y & 0x0F)) > 0x0F
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        sx = self._to_signed(x)
-        sy = self._to_signed(y)
-        self.cv = (sx > 0 and sy > 0 and self.cn) or (sx < 0 and sy < 0 and not self.cn)
-        self.cc = total > 0xFF
+        result = (x + y) & 0xFF
+        self.ccr = (self.ccr & _CLEAR_HNZVC) | _ADD_FLAGS[(x << 8) | y] | _NZ[result]
         return result
 
     def _adc(self, x: int, y: int) -> int:
-        carry_in = 1 if self.cc else 0
-        total = (x & 0xFF) + (y & 0xFF) + carry_in
-        result = total & 0xFF
-        self.ch = ((x & 0x0F) + (y & 0x0F)) > 0x0F
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        sx = self._to_signed(x)
-        sy = self._to_signed(y)
-        self.cv = (sx > 0 and sy > 0 and self.cn) or (sx < 0 and sy < 0 and not self.cn)
-        self.cc = total > 0xFF
+        ccr = self.ccr
+        carry = ccr & _BIT_C
+        result = (x + y + carry) & 0xFF
+        self.ccr = (ccr & _CLEAR_HNZVC) | _ADD_FLAGS[(carry << 16) | (x << 8) | y] | _NZ[result]
         return result
 
     def _sbc(self, x: int, y: int) -> int:
-        borrow = 1 if self.cc else 0
-        total = (x & 0xFF) - (y & 0xFF) - borrow
-        result = total & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        sx = self._to_signed(x)
-        sy = self._to_signed(y)
-        self.cv = (sx > 0 and sy < 0 and self.cn) or (sx < 0 and sy > 0 and not self.cn)
-        self.cc = (total & 0x100) != 0
+        ccr = self.ccr
+        carry = ccr & _BIT_C
+        result = (x - y - carry) & 0xFF
+        self.ccr = (ccr & _CLEAR_NZVC) | _SUB_FLAGS[(carry << 16) | (x << 8) | y] | _NZ[result]
         return result
 
     def _sub(self, x: int, y: int) -> int:
-        total = (x & 0xFF) - (y & 0xFF)
-        result = total & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        sx = self._to_signed(x)
-        sy = self._to_signed(y)
-        self.cv = (sx > 0 and sy < 0 and self.cn) or (sx < 0 and sy > 0 and not self.cn)
-        self.cc = (total & 0x100) != 0
+        result = (x - y) & 0xFF
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _SUB_FLAGS[(x << 8) | y] | _NZ[result]
         return result
 
-    def _cmp(self, x: int, y: int) -> None:
-        total = (x & 0xFF) - (y & 0xFF)
-        result = total & 0xFF
-        self.cn = (result & 0x80) != 0
-        self.cz = result == 0
-        sx = self._to_signed(x)
-        sy = self._to_signed(y)
-        self.cv = (sx > 0 and sy < 0 and self.cn) or (sx < 0 and sy > 0 and not self.cn)
-        self.cc = (total & 0x100) != 0
+    def _cmp(self, x: int, y: int) -> int:
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _SUB_FLAGS[(x << 8) | y] | _NZ[(x - y) & 0xFF]
+        return x
 
     def _add16(self, x: int, y: int) -> int:
-        total = (x & 0xFFFF) + (y & 0xFFFF)
-        result = total & 0xFFFF
-        self.cn = (result & 0x8000) != 0
-        self.cz = result == 0
-        sx = self._to_signed16(x)
-        sy = self._to_signed16(y)
-        self.cv = (sx > 0 and sy > 0 and self.cn) or (sx < 0 and sy < 0 and not self.cn)
-        self.cc = (total & 0x10000) != 0
+        total = x + y
+        result = _WRAP16[total]
+        overflow = (~(x ^ y) & (x ^ result) & 0x8000) >> 14
+        self.ccr = (self.ccr & _CLEAR_NZVC) | _NZ16[result] | overflow | (total >> 16)
         return result
 
     def _push_word(self, value: int) -> None:
-        self.sp = (self.sp - 2) & 0xFFFF
-        hi = (value >> 8) & 0xFF
-        lo = value & 0xFF
-        self.memory.store8((self.sp + 1) & 0xFFFF, hi)
-        self.memory.store8((self.sp + 2) & 0xFFFF, lo)
+        # Low byte at SP, high byte at SP - 1; stacks rarely touch MMIO.
+        sp = self.sp
+        high = _WRAP16[sp - 1]
+        self.sp = _WRAP16[sp - 2]
+        mmio = self._mmio_store
+        if mmio[high >> 8] or mmio[sp >> 8]:
+            self._store16_extended(high, value)
+            return
+        ram = self._ram
+        ram[high] = value >> 8
+        ram[sp] = value & 0xFF
+        dirty = self._code_page_dirty
+        dirty[high >> 8] = 1
+        dirty[sp >> 8] = 1
 
     def _pop_word(self) -> int:
-        hi = self.memory.load8((self.sp + 1) & 0xFFFF)
-        lo = self.memory.load8((self.sp + 2) & 0xFFFF)
-        self.sp = (self.sp + 2) & 0xFFFF
-        return ((hi << 8) | lo) & 0xFFFF
+        sp = self.sp
+        high = _WRAP16[sp + 1]
+        low = _WRAP16[sp + 2]
+        self.sp = low
+        mmio = self._mmio_load
+        if mmio[high >> 8] or mmio[low >> 8]:
+            return self._load16_extended(high)
+        ram = self._ram
+        return (ram[high] << 8) | ram[low]
 
     def _push_all_registers(self) -> None:
-        ccr = 0xC0
-        if self.ch:
-            ccr |= 0x20
-        if self.ci:
-            ccr |= 0x10
-        if self.cn:
-            ccr |= 0x08
-        if self.cz:
-            ccr |= 0x04
-        if self.cv:
-            ccr |= 0x02
-        if self.cc:
-            ccr |= 0x01
-        self._store16_extended((self.sp - 1) & 0xFFFF, self.pc)
-        self._store16_extended((self.sp - 3) & 0xFFFF, self.ix)
-        self.memory.store8((self.sp - 4) & 0xFFFF, self.a & 0xFF)
-        self.memory.store8((self.sp - 5) & 0xFFFF, self.b & 0xFF)
-        self.memory.store8((self.sp - 6) & 0xFFFF, ccr & 0xFF)
-        self.sp = (self.sp - 7) & 0xFFFF
+        sp = self.sp
+        low = sp - 6
+        mmio = self._mmio_store
+        if low >= 0 and not (mmio[low >> 8] or mmio[sp >> 8]):
+            # The whole frame sits in flat RAM: one slice store.
+            ix = self.ix
+            pc = self.pc
+            self._ram[low : sp + 1] = bytes(
+                (self.ccr, self.b, self.a, ix >> 8, ix & 0xFF, pc >> 8, pc & 0xFF)
+            )
+            dirty = self._code_page_dirty
+            dirty[low >> 8] = dirty[sp >> 8] = 1
+            self.sp = _WRAP16[sp - 7]
+            return
+        # Byte by byte, in the order the Java port touches memory.
+        store8 = self._store8
+        pc = self.pc
+        ix = self.ix
+        store8(_WRAP16[sp - 1], pc >> 8)
+        store8(sp, pc & 0xFF)
+        store8(_WRAP16[sp - 3], ix >> 8)
+        store8(_WRAP16[sp - 2], ix & 0xFF)
+        store8(_WRAP16[sp - 4], self.a)
+        store8(_WRAP16[sp - 5], self.b)
+        store8(_WRAP16[sp - 6], self.ccr)
+        self.sp = _WRAP16[sp - 7]
 
     def _pull_byte(self) -> int:
-        value = self.memory.load8((self.sp + 1) & 0xFFFF)
-        self.sp = (self.sp + 1) & 0xFFFF
-        return value
+        sp = self.sp = _WRAP16[self.sp + 1]
+        if self._mmio_load[sp >> 8]:
+            return self._mem_load8(sp)
+        return self._ram[sp]
 
     def _push_byte(self, value: int) -> None:
-        self.memory.store8(self.sp & 0xFFFF, value & 0xFF)
-        self.sp = (self.sp - 1) & 0xFFFF
+        sp = self.sp
+        self._store8(sp, value)
+        self.sp = _WRAP16[sp - 1]
 
     def _pop_all_registers(self) -> None:
-        self.sp = (self.sp + 7) & 0xFFFF
-        ccr_addr = (self.sp - 6) & 0xFFFF
-        ccr = self.memory.load8(ccr_addr)
-        self.ch = bool(ccr & 0x20)
-        self.ci = bool(ccr & 0x10)
-        self.cn = bool(ccr & 0x08)
-        self.cz = bool(ccr & 0x04)
-        self.cv = bool(ccr & 0x02)
-        self.cc = bool(ccr & 0x01)
-        self.b = self.memory.load8((self.sp - 5) & 0xFFFF)
-        self.a = self.memory.load8((self.sp - 4) & 0xFFFF)
-        self.ix = self._load16_extended((self.sp - 3) & 0xFFFF)
-        self.pc = self._load16_extended((self.sp - 1) & 0xFFFF)
+        low = self.sp + 1
+        high = low + 7
+        mmio = self._mmio_load
+        if high <= 0x10000 and not (mmio[low >> 8] or mmio[(high - 1) >> 8]):
+            ccr, self.b, self.a, ix_high, ix_low, pc_high, pc_low = self._ram[low:high]
+            self.ccr = _CCR_FIXED | (ccr & 0x3F)
+            self.ix = (ix_high << 8) | ix_low
+            self.pc = (pc_high << 8) | pc_low
+            self.sp = high - 1
+            return
+        load8 = self._load_extended
+        sp = self.sp = _WRAP16[self.sp + 7]
+        self.ccr = _CCR_FIXED | (load8(_WRAP16[sp - 6]) & 0x3F)
+        self.b = load8(_WRAP16[sp - 5])
+        self.a = load8(_WRAP16[sp - 4])
+        ix_high = load8(_WRAP16[sp - 3])
+        self.ix = (ix_high << 8) | load8(_WRAP16[sp - 2])
+        pc_high = load8(_WRAP16[sp - 1])
+        self.pc = (pc_high << 8) | load8(sp)
 
     def _service_interrupt(self, vector: int, cycles: int) -> int:
         self._push_all_registers()
         self.pc = self._load16_extended(vector)
         self._waiting = False
         return cycles
-
-    # ------------------------------------------------------------------
-    # Branch helper
-
-    def _branch(self, offset: int, condition: bool) -> None:
-        if condition:
-            signed = offset - 0x100 if offset & 0x80 else offset
-            self.pc = (self.pc + signed) & 0xFFFF
-
-    # ------------------------------------------------------------------
-    # Utility conversions
-
-    @staticmethod
-    def _to_signed(value: int) -> int:
-        value &= 0xFF
-        return value - 0x100 if value & 0x80 else value
-
-    @staticmethod
-    def _to_signed16(value: int) -> int:
-        value &= 0xFFFF
-        return value - 0x10000 if value & 0x8000 else value
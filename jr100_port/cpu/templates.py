@@ -0,0 +1,293 @@
+"""Inline source templates for the MB8861 instructions.
+
+Each builder returns the statements the generated ``execute()`` loop runs
+for one opcode (see ``codegen`` for the loop locals).  The templates must
+match the bound handlers in ``mb8861`` bit for bit, Java-parity quirks
+included; ``_execute_stepwise()`` is the reference they are tested against.
+
+N and Z are set through the lazy ``nz`` local, so the ``ccr`` masks below
+only preserve the bits an instruction leaves alone.
+
+Scratch locals: ``v`` operand, ``ea`` address, ``r`` result, ``t`` wide
+result, ``c`` carry out, ``hi``/``lo``/``target``.
+"""
+
+from __future__ import annotations
+
+from .codegen import BRANCH_MASKS, effective_address, fetch8, fetch16, materialize_ccr, nz16
+from .codegen import nzv8, nzv16, operand8, operand16, pull16, push16, read8, refresh_nz
+from .codegen import relative_jump, store16, write8
+from .instructions import AddressingMode
+
+# ----------------------------------------------------------------------
+# Accumulator / memory (8-bit)
+
+
+def load(acc: str, mode: AddressingMode) -> str:
+    return operand8(mode) + f"{acc} = v\n" + nzv8(acc)
+
+
+def store(acc: str, mode: AddressingMode) -> str:
+    return effective_address(mode) + write8("ea", acc) + nzv8(acc)
+
+
+def logical(operator: str, acc: str, mode: AddressingMode) -> str:
+    """AND/ORA/EOR: ``operator`` is ``&``, ``|`` or ``^``."""
+    return operand8(mode) + f"{acc} {operator}= v\n" + nzv8(acc)
+
+
+def bit(acc: str, mode: AddressingMode) -> str:
+    return operand8(mode) + f"r = {acc} & v\n" + nzv8("r")
+
+
+def add(acc: str, mode: AddressingMode) -> str:
+    return operand8(mode) + _add(acc, carry=False)
+
+
+def add_with_carry(acc: str, mode: AddressingMode) -> str:
+    return operand8(mode) + _add(acc, carry=True)
+
+
+def subtract(acc: str, mode: AddressingMode) -> str:
+    return operand8(mode) + _subtract(acc, borrow=False) + f"{acc} = r\n"
+
+
+def subtract_with_carry(acc: str, mode: AddressingMode) -> str:
+    return operand8(mode) + _subtract(acc, borrow=True) + f"{acc} = r\n"
+
+
+def compare(acc: str, mode: AddressingMode) -> str:
+    return operand8(mode) + _subtract(acc, borrow=False)
+
+
+def _add(acc: str, carry: bool) -> str:
+    # H, V and C come from ADD_FLAGS (Java-parity quirks included).
+    if carry:
+        return (
+            "c = ccr & 0x01\n"
+            f"ccr = (ccr & 0xD0) | ADD_FLAGS[(c << 16) | ({acc} << 8) | v]\n"
+            f"{acc} = nz = ({acc} + v + c) & 0xFF\n"
+        )
+    return f"ccr = (ccr & 0xD0) | ADD_FLAGS[({acc} << 8) | v]\n{acc} = nz = ({acc} + v) & 0xFF\n"
+
+
+def _subtract(acc: str, borrow: bool) -> str:
+    # Leaves the difference in r; CMP discards it.
+    if borrow:
+        return (
+            "c = ccr & 0x01\n"
+            f"ccr = (ccr & 0xF0) | SUB_FLAGS[(c << 16) | ({acc} << 8) | v]\n"
+            f"r = nz = ({acc} - v - c) & 0xFF\n"
+        )
+    return f"ccr = (ccr & 0xF0) | SUB_FLAGS[({acc} << 8) | v]\nr = nz = ({acc} - v) & 0xFF\n"
+
+
+# ----------------------------------------------------------------------
+# Index register / stack pointer (16-bit)
+
+
+def load16(register: str, mode: AddressingMode) -> str:
+    """LDX/LDS."""
+    return operand16(mode) + f"{register} = v\n" + nzv16(register)
+
+
+def store16_flags_from_ix(register: str, mode: AddressingMode) -> str:
+    """STX/STS; Java parity: both derive N/Z from IX."""
+    return store16(mode, register) + nzv16("ix")
+
+
+def compare_ix(mode: AddressingMode) -> str:
+    return (
+        operand16(mode)
+        + "r = WRAP16[ix - v]\n"
+        # Java parity: no overflow when IX is zero.
+        "ccr = (ccr & 0xF1) | ((((ix ^ v) & (ix ^ r) & 0x8000) >> 14) if ix else 0)\n"
+        + nz16("r")
+    )
+
+
+def add_ix(mode: AddressingMode) -> str:
+    """ADX: immediate adds a byte, extended adds the word at the address."""
+    if mode is AddressingMode.IMMEDIATE:
+        operand = fetch8("v")
+    else:
+        operand = fetch16("ea") + read8("hi", "ea") + "ea = WRAP16[ea + 1]\n"
+        operand += read8("lo", "ea") + "v = (hi << 8) | lo\n"
+    return operand + (
+        "t = ix + v\n"
+        "r = WRAP16[t]\n"
+        "ccr = (ccr & 0xF0) | ((~(ix ^ v) & (ix ^ r) & 0x8000) >> 14) | (t >> 16)\n"
+        + nz16("r")
+        + "ix = r\n"
+    )
+
+
+# ----------------------------------------------------------------------
+# Read-modify-write (accumulator or memory)
+
+_UNARY = {
+    "asl": "t = v << 1\nr = t & 0xFF\nccr = (ccr & 0xF0) | SHIFT_FLAGS[t]\nnz = r\n",
+    "asr": (
+        "r = (v >> 1) | (v & 0x80)\n"
+        "ccr = (ccr & 0xF0) | SHIFT_FLAGS[((v & 0x01) << 8) | r]\nnz = r\n"
+    ),
+    "lsr": "r = v >> 1\nccr = (ccr & 0xF0) | SHIFT_FLAGS[((v & 0x01) << 8) | r]\nnz = r\n",
+    "rol": (
+        "t = (v << 1) | (ccr & 0x01)\nr = t & 0xFF\n"
+        "ccr = (ccr & 0xF0) | SHIFT_FLAGS[t]\nnz = r\n"
+    ),
+    "ror": (
+        "r = (v >> 1) | ((ccr & 0x01) << 7)\n"
+        "ccr = (ccr & 0xF0) | SHIFT_FLAGS[((v & 0x01) << 8) | r]\nnz = r\n"
+    ),
+    # Java parity: NEG sets C when the result is zero.
+    "neg": (
+        "r = -v & 0xFF\n"
+        "ccr = (ccr & 0xF0) | (0x01 if not r else 0x02 if r == 0x80 else 0)\n"
+        "nz = r\n"
+    ),
+    "com": "r = ~v & 0xFF\nccr = (ccr & 0xF0) | 0x01\nnz = r\n",
+    "dec": "r = (v - 1) & 0xFF\nccr = (ccr & 0xF1) | (0x02 if r == 0x7F else 0)\nnz = r\n",
+    "inc": "r = (v + 1) & 0xFF\nccr = (ccr & 0xF1) | (0x02 if r == 0x80 else 0)\nnz = r\n",
+    "tst": "ccr &= 0xF0\nnz = v\n",
+}
+
+
+def unary(operation: str, target: str | AddressingMode) -> str:
+    """``operation`` on accumulator ``"a"``/``"b"`` or on memory via a mode."""
+    if operation == "clr":
+        if isinstance(target, str):
+            return f"{target} = 0\nccr &= 0xF0\nnz = 0\n"
+        # CLR stores without reading the location first.
+        return effective_address(target) + write8("ea", "0") + "ccr &= 0xF0\nnz = 0\n"
+    body = _UNARY[operation]
+    if isinstance(target, str):
+        if operation == "tst":
+            return f"v = {target}\n" + body
+        return f"v = {target}\n" + body + f"{target} = r\n"
+    source = effective_address(target) + read8("v", "ea") + body
+    if operation == "tst":
+        return source
+    return source + write8("ea", "r")
+
+
+def immediate_to_indexed(operation: str) -> str:
+    """NIM/OIM/XIM/TMM: immediate byte then indexed offset."""
+    source = fetch8("v") + fetch8("ea", 2) + "ea = WRAP16[ix + ea]\n" + read8("t", "ea")
+    if operation == "tmm":
+        # Z, V or N alone; nz = 0x01 leaves both N and Z clear.
+        return source + (
+            "if not v or not t:\n"
+            "    ccr &= 0xF1\n"
+            "    nz = 0x00\n"
+            "elif t == 0xFF:\n"
+            "    ccr = (ccr & 0xF1) | 0x02\n"
+            "    nz = 0x01\n"
+            "else:\n"
+            "    ccr &= 0xF1\n"
+            "    nz = 0x80\n"
+        )
+    operator = {"nim": "&", "oim": "|", "xim": "^"}[operation]
+    # Java parity: N is the complement of Z rather than bit 7.
+    return source + (
+        f"r = v {operator} t\n" "ccr &= 0xF1\nnz = 0x80 if r else 0x00\n" + write8("ea", "r")
+    )
+
+
+# ----------------------------------------------------------------------
+# Inherent instructions
+
+NOP = ""
+TAB = "b = a\n" + nzv8("b")
+TBA = "a = b\n" + nzv8("a")
+ABA = "v = b\n" + _add("a", carry=False)
+SBA = "v = b\n" + _subtract("a", borrow=False) + "a = r\n"
+CBA = "v = b\n" + _subtract("a", borrow=False)
+TAP = "ccr = 0xC0 | (a & 0x3F)\n" + refresh_nz()
+TPA = materialize_ccr() + "a = ccr\n"
+# INX/DEX only touch Z, so N is carried over from the lazy value.
+_Z_FROM_IX = (
+    "n = NZ_FLAGS[nz] & 0x08\n"
+    "if ix:\n"
+    "    nz = 0x80 if n else 0x01\n"
+    "else:\n"
+    "    nz = NZ_BOTH if n else 0x00\n"
+)
+INX = "ix = WRAP16[ix + 1]\n" + _Z_FROM_IX
+DEX = "ix = WRAP16[ix - 1]\n" + _Z_FROM_IX
+INS = "sp = WRAP16[sp + 1]\n"
+DES = "sp = WRAP16[sp - 1]\n"
+TSX = "ix = WRAP16[sp + 1]\n"
+TXS = "sp = WRAP16[ix - 1]\n"
+CLC = "ccr &= 0xFE\n"
+CLI = "ccr &= 0xEF\n"
+CLV = "ccr &= 0xFD\n"
+SEC = "ccr |= 0x01\n"
+SEI = "ccr |= 0x10\n"
+SEV = "ccr |= 0x02\n"
+DAA = (
+    "v = a\n"
+    "if (v & 0x0F) >= 0x0A or ccr & 0x20:\n"
+    "    v += 0x06\n"
+    "c = 0x01 if (v & 0xF0) >= 0xA0 else 0\n"
+    "if c:\n"
+    "    v += 0x60\n"
+    "r = v & 0xFF\n"
+    "ccr = (ccr & 0xF1) | ((((a ^ r) & 0x80) >> 6) if a else 0) | c\n"
+    "nz = r\n"
+    "a = r\n"
+)
+
+
+def push(acc: str) -> str:
+    return write8("sp", acc) + "sp = WRAP16[sp - 1]\n"
+
+
+def pull(acc: str) -> str:
+    return "sp = WRAP16[sp + 1]\n" + read8(acc, "sp")
+
+
+RTS = pull16("pc")
+RTI = (
+    "sp = WRAP16[sp + 7]\n"
+    "ea = WRAP16[sp - 6]\n"
+    + read8("v", "ea")
+    + "ccr = 0xC0 | (v & 0x3F)\n"
+    + refresh_nz()
+    + "ea = WRAP16[sp - 5]\n"
+    + read8("b", "ea")
+    + "ea = WRAP16[sp - 4]\n"
+    + read8("a", "ea")
+    + "ea = WRAP16[sp - 3]\n"
+    + read8("hi", "ea")
+    + "ea = WRAP16[sp - 2]\n"
+    + read8("lo", "ea")
+    + "ix = (hi << 8) | lo\n"
+    + "ea = WRAP16[sp - 1]\n"
+    + read8("hi", "ea")
+    + read8("lo", "sp")
+    + "pc = (hi << 8) | lo\n"
+)
+
+
+# ----------------------------------------------------------------------
+# Jumps and branches
+
+
+def jump(mode: AddressingMode) -> str:
+    return effective_address(mode) + "pc = ea\n"
+
+
+def jump_to_subroutine(mode: AddressingMode) -> str:
+    return effective_address(mode) + "target = ea\n" + push16("pc") + "pc = target\n"
+
+
+def branch(opcode: int) -> str:
+    if opcode == 0x20:
+        return fetch8("v") + relative_jump()
+    mask = BRANCH_MASKS[opcode & 0x0F]
+    condition = f"0x{mask:04X} >> ((ccr & 0x03) | NZ_FLAGS[nz]) & 1"
+    return fetch8("v") + f"if {condition}:\n    " + relative_jump()
+
+
+BSR = fetch8("v") + push16("pc") + relative_jump()
@@ -14,7 +14,9 @@ class Beeper:
     line_on: bool = False
     _backend: Any = field(init=False, default=None)
     _backend_active: bool = field(init=False, default=False)
-    _backend_frequency: float = field(init=False, default=0.0)
+    # Frequencies as whole Hz: the backend cannot resolve finer steps.
+    _frequency_hz: int = field(init=False, default=0)
+    _backend_frequency_hz: int = field(init=False, default=0)
 
     def __post_init__(self) -> None:
         # pygame.mixer の初期化が完了していないとバックエンド生成に失敗するため、
@@ -23,6 +25,7 @@ class Beeper:
 
     def setFrequency(self, timestamp: int, frequency: float) -> None:  # noqa: N802
         self.frequency = max(0.0, float(frequency))
+        self._frequency_hz = round(self.frequency)
         if self.line_on:
             self._apply_state()
 
@@ -36,6 +39,7 @@ class Beeper:
 
     def reset(self) -> None:
         self.frequency = 0.0
+        self._frequency_hz = 0
         self.line_on = False
         self._apply_state()
 
@@ -51,7 +55,7 @@ class Beeper:
                 pass
         self._backend = None
         self._backend_active = False
-        self._backend_frequency = 0.0
+        self._backend_frequency_hz = 0
 
     def saveState(self, state_set) -> None:  # noqa: N802
         state_set["beep.frequency"] = self.frequency
@@ -59,30 +63,32 @@ class Beeper:
 
     def loadState(self, state_set) -> None:  # noqa: N802
         self.frequency = state_set.get("beep.frequency", self.frequency)
+        self._frequency_hz = round(self.frequency)
         self.line_on = state_set.get("beep.line_on", self.line_on)
         self._apply_state()
 
     def _apply_state(self) -> None:
+        enabled = self.line_on and self.frequency > 0.0
+        # Common case (execute() on every tick): the backend already matches.
+        if enabled == self._backend_active and (
+            not enabled or self._frequency_hz == self._backend_frequency_hz
+        ):
+            return
         backend = self._backend
         if backend is None:
             if not self._ensure_backend():
                 self._backend_active = False
-                self._backend_frequency = 0.0
+                self._backend_frequency_hz = 0
                 return
             backend = self._backend
             if backend is None:
                 return
-        enabled = self.line_on and self.frequency > 0.0
-        if (
-            enabled != self._backend_active
-            or (enabled and abs(self.frequency - self._backend_frequency) > 0.5)
-        ):
-            try:
-                backend.set_state(enabled, self.frequency)
-            except Exception:
-                return
-            self._backend_active = enabled
-            self._backend_frequency = self.frequency if enabled else 0.0
+        try:
+            backend.set_state(enabled, self.frequency)
+        except Exception:
+            return
+        self._backend_active = enabled
+        self._backend_frequency_hz = self._frequency_hz if enabled else 0
 
     def _ensure_backend(self) -> bool:
         """Instantiate the pygame-backed beeper when possible."""
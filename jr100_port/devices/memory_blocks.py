@@ -10,6 +10,12 @@ import struct
 
 from jr100_port.core.memory import Addressable
 
+_U32_LE = struct.Struct("<I")
+# PROG v1 start address, payload length and flag; v2 section id and
+# length; PBIN start address and data length.
+_V1_HEADER = struct.Struct("<III")
+_PAIR = struct.Struct("<II")
+
 
 class DisplayLike(Protocol):
     def update_font(self, char_index: int, row: int, value: int) -> None:
@@ -21,6 +27,13 @@ class Memory(Addressable):
     start: int
     length: int
 
+    # Plain byte storage: MemorySystem may serve loads/stores from its flat
+    # buffer once ``bind_storage`` has been called.
+    direct_load = True
+    direct_store = True
+    # False for read-only blocks: MemorySystem then drops stores itself.
+    writable = True
+
     def __post_init__(self) -> None:
         if self.length <= 0:
             raise ValueError("length must be positive")
@@ -33,24 +46,48 @@ class Memory(Addressable):
     def getEndAddress(self) -> int:  # noqa: N802
         return (self.start + self.length - 1) & 0xFFFF
 
+    def bind_storage(self, view: memoryview) -> None:
+        view[:] = self.data
+        self.data = view
+
     def _offset(self, address: int) -> int:
-        offset = (address & 0xFFFF) - self.start
-        if offset < 0 or offset >= self.length:
-            raise IndexError(f"address {address:#06x} outside {self.start:#06x}-{self.getEndAddress():#06x}")
+        # One unsigned compare: addresses below ``start`` wrap to large offsets.
+        offset = (address - self.start) & 0xFFFF
+        if offset >= self.length:
+            raise self._outside(address)
         return offset
 
+    def _outside(self, address: int) -> IndexError:
+        return IndexError(
+            f"address {address & 0xFFFF:#06x} outside {self.start:#06x}-{self.getEndAddress():#06x}"
+        )
+
     def load8(self, address: int) -> int:
-        return self.data[self._offset(address)]
+        offset = (address - self.start) & 0xFFFF
+        if offset >= self.length:
+            raise self._outside(address)
+        return self.data[offset]
 
     def load16(self, address: int) -> int:
-        high = self.load8(address)
-        low = self.load8(address + 1)
-        return ((high << 8) | low) & 0xFFFF
+        offset = (address - self.start) & 0xFFFF
+        if offset + 1 < self.length:
+            data = self.data
+            return (data[offset] << 8) | data[offset + 1]
+        return (self.load8(address) << 8) | self.load8(address + 1)
 
     def store8(self, address: int, value: int) -> None:
-        self.data[self._offset(address)] = value & 0xFF
+        offset = (address - self.start) & 0xFFFF
+        if offset >= self.length:
+            raise self._outside(address)
+        self.data[offset] = value & 0xFF
 
     def store16(self, address: int, value: int) -> None:
+        offset = (address - self.start) & 0xFFFF
+        if offset + 1 < self.length:
+            data = self.data
+            data[offset] = (value >> 8) & 0xFF
+            data[offset + 1] = value & 0xFF
+            return
         self.store8(address, (value >> 8) & 0xFF)
         self.store8(address + 1, value & 0xFF)
 
@@ -64,6 +101,9 @@ class MainRam(RAM):
 
 
 class ROM(Memory):
+    direct_store = False
+    writable = False
+
     def store8(self, address: int, value: int) -> None:  # noqa: ARG002 - read-only
         return None
 
@@ -98,7 +138,7 @@ class BasicRom(ROM):
     def _load_prog(self, blob: bytes) -> None:
         if len(blob) < 16:
             raise ValueError("PROG file truncated")
-        version = struct.unpack_from("<I", blob, 4)[0]
+        version = _U32_LE.unpack_from(blob, 4)[0]
         if version == 1:
             self._load_prog_v1(blob)
         elif version == 2:
@@ -110,7 +150,7 @@ class BasicRom(ROM):
         offset = 8
         if offset + 4 > len(blob):
             raise ValueError("PROG name length missing")
-        name_len = struct.unpack_from("<I", blob, offset)[0]
+        name_len = _U32_LE.unpack_from(blob, offset)[0]
         offset += 4
         if offset + name_len > len(blob):
             raise ValueError("PROG name section truncated")
@@ -118,26 +158,20 @@ class BasicRom(ROM):
 
         if offset + 12 > len(blob):
             raise ValueError("PROG header truncated")
-        start_addr = struct.unpack_from("<I", blob, offset)[0]
-        offset += 4
-        payload_length = struct.unpack_from("<I", blob, offset)[0]
-        offset += 4
-        offset += 4  # flag (unused)
+        start_addr, payload_length, _flag = _V1_HEADER.unpack_from(blob, offset)
+        offset += _V1_HEADER.size
 
         end = offset + payload_length
         if end > len(blob):
             raise ValueError("PROG payload truncated")
-        payload = blob[offset:end]
-        self._write_payload(start_addr, payload)
+        self._write_payload(start_addr, memoryview(blob)[offset:end])
 
     def _load_prog_v2(self, blob: bytes) -> None:
         offset = 8
         length = len(blob)
         while offset + 8 <= length:
-            section_id = struct.unpack_from("<I", blob, offset)[0]
-            offset += 4
-            section_length = struct.unpack_from("<I", blob, offset)[0]
-            offset += 4
+            section_id, section_length = _PAIR.unpack_from(blob, offset)
+            offset += _PAIR.size
             end = offset + section_length
             if end > length:
                 raise ValueError("PROG section truncated")
@@ -155,15 +189,13 @@ class BasicRom(ROM):
     def _parse_pbin_section(self, payload: memoryview) -> None:
         if len(payload) < 8:
             raise ValueError("PBIN section too short")
-        start_addr = struct.unpack_from("<I", payload, 0)[0]
-        data_length = struct.unpack_from("<I", payload, 4)[0]
+        start_addr, data_length = _PAIR.unpack_from(payload, 0)
         expected = 8 + data_length
         if data_length < 0 or expected > len(payload):
             raise ValueError("PBIN section truncated")
-        data = payload[8:8 + data_length]
-        self._write_payload(start_addr, data.tobytes())
+        self._write_payload(start_addr, payload[8:8 + data_length])
 
-    def _write_payload(self, start_addr: int, payload: bytes) -> None:
+    def _write_payload(self, start_addr: int, payload: memoryview) -> None:
         rom_offset = start_addr - self.start
         if rom_offset < 0 or rom_offset + len(payload) > self.length:
             raise ValueError("PROG payload does not fit ROM region")
@@ -173,56 +205,60 @@ class BasicRom(ROM):
         return self.start
 
 
-class UserDefinedCharacterRam(RAM):
+class _FontBackedRam(RAM):
+    """RAM whose bytes are also font rows of the display.
+
+    Every store is reported to the display as (character, row, value); the
+    character index counts from ``_font_base`` bytes into the font table.
+    """
+
+    _font_base = 0
+
     def __init__(self, start: int, length: int, display: DisplayLike | None) -> None:
         super().__init__(start, length)
         self.display = display
 
+    @property
+    def direct_store(self) -> bool:  # type: ignore[override]
+        # Stores need store8() only while the display listens for them.
+        return self.display is not None and not getattr(self.display, "font_updates", True)
+
     def store8(self, address: int, value: int) -> None:
-        super().store8(address, value)
-        if self.display is None:
-            return
         offset = self._offset(address)
-        self.display.update_font(offset // 8, offset % 8, value & 0xFF)
+        value &= 0xFF
+        self.data[offset] = value
+        display = self.display
+        if display is not None:
+            font = offset + self._font_base
+            display.update_font(font >> 3, font & 7, value)
 
     def store16(self, address: int, value: int) -> None:
-        super().store16(address, value)
-        if self.display is None:
-            return
         offset = self._offset(address)
-        self.display.update_font(offset // 8, offset % 8, (value >> 8) & 0xFF)
-        self.display.update_font((offset + 1) // 8, (offset + 1) % 8, value & 0xFF)
+        if offset + 1 >= self.length:
+            raise self._outside(address + 1)
+        high = (value >> 8) & 0xFF
+        low = value & 0xFF
+        data = self.data
+        data[offset] = high
+        data[offset + 1] = low
+        display = self.display
+        if display is not None:
+            font = offset + self._font_base
+            display.update_font(font >> 3, font & 7, high)
+            font += 1
+            display.update_font(font >> 3, font & 7, low)
 
     def set_display(self, display: DisplayLike) -> None:
         self.display = display
 
 
-class VideoRam(RAM):
-    def __init__(self, start: int, length: int, display: DisplayLike | None) -> None:
-        super().__init__(start, length)
-        self.display = display
+class UserDefinedCharacterRam(_FontBackedRam):
+    """User-defined character patterns, reported from the start of the font."""
 
-    def _font_offset(self, address: int) -> int:
-        # Java: display.updateFont((address - (start - 0x100)) / 8, ...)
-        return self._offset(address) + 0x100
 
-    def store8(self, address: int, value: int) -> None:
-        super().store8(address, value)
-        if self.display is None:
-            return
-        offset = self._font_offset(address)
-        self.display.update_font(offset // 8, offset % 8, value & 0xFF)
-
-    def store16(self, address: int, value: int) -> None:
-        super().store16(address, value)
-        if self.display is None:
-            return
-        offset = self._font_offset(address)
-        self.display.update_font(offset // 8, offset % 8, (value >> 8) & 0xFF)
-        self.display.update_font((offset + 1) // 8, (offset + 1) % 8, value & 0xFF)
-
-    def set_display(self, display: DisplayLike) -> None:
-        self.display = display
+class VideoRam(_FontBackedRam):
+    # Java: display.updateFont((address - (start - 0x100)) / 8, ...)
+    _font_base = 0x100
 
 
 class ExtendedIOPort(Addressable):
@@ -250,16 +286,14 @@ class ExtendedIOPort(Addressable):
         if (address & 0xFFFF) == 0xCC02:
             self.gamepad_status = value & 0xFF
 
+    # MemorySystem splits word accesses on I/O pages into byte accesses, so
+    # these only serve direct callers; they compose the same byte view.
     def load16(self, address: int) -> int:
-        addr = address & 0xFFFF
-        if addr == 0xCC01:
-            return self.gamepad_status & 0x00FF
-        if addr == 0xCC02:
-            return (self.gamepad_status << 8) & 0xFF00
-        return 0
+        return (self.load8(address) << 8) | self.load8(address + 1)
 
     def store16(self, address: int, value: int) -> None:
-        return None
+        self.store8(address, value >> 8)
+        self.store8(address + 1, value)
 
     def set_gamepad_state(self, state) -> None:
         self._gamepad_state = state
@@ -32,6 +32,20 @@ class ComputerLike(Protocol):
 
 
 JR100_CPU_CLOCK_HZ = 894_886
+# Timer1 free-run toggles PB7 once per period, so the tone is half the rate.
+_T1_TONE_CLOCK_HZ = 894_886.25 / 2.0
+_NS_PER_SECOND = 1_000_000_000
+_SHORT_RUN = 2
+
+
+def _count_down(value: int, latch: int, ticks: int) -> int:
+    """Timer value after ``ticks`` clocks of counting down to -1 and
+    reloading ``latch`` on the clock after, as the tick loop does."""
+    if ticks <= value + 1:
+        return value - ticks
+    if value >= 0:
+        ticks -= value + 1
+    return latch - (ticks - 1) % (latch + 2)
 
 
 class Via6522:
@@ -63,6 +77,11 @@ class Via6522:
     IFR_BIT_T1 = 0x40
     IFR_BIT_IRQ = 0x80
 
+    # Timer 1 calls storeT1CH_option() on every reload, even while disabled.
+    # Subclasses whose hook depends only on ACR bits 6-7 and the latch set
+    # this so _execute() can skip the identical repeats of a quiet run.
+    T1_RELOAD_HOOK_IDEMPOTENT = False
+
     def __init__(self, computer: ComputerLike, start_address: int) -> None:
         self.computer = computer
         self.start_address = start_address
@@ -92,6 +111,10 @@ class Via6522:
         self.cb1_out = 0
         self.cb2_in = 0
         self.cb2_out = 0
+        # inputPortA()/inputPortB() values, refreshed whenever one of their
+        # sources changes.
+        self._port_a_in = 0
+        self._port_b_in = 0
 
         # Timer state
         self.previous_pb6 = 0
@@ -111,6 +134,69 @@ class Via6522:
         self.shift_started = False
 
         self.current_clock = 0
+        # ACR bits 6-7 and latch 1 as last seen by the timer 1 reload hook.
+        self._t1_hook_key = -1
+
+        # ACR/PCR fields decoded at register writes (see _refresh_acr_modes
+        # and _refresh_pcr_modes); declared here so every field exists from
+        # construction on.
+        self._acr_shift_mode = 0
+        self._acr_t2_pb6 = 0
+        self._acr_t1_mode = 0
+        self._t1_timeout = self._t1_timeout_one_shot
+        self._ca1_active = 0
+        self._ca2_active = 0
+        self._cb1_active = 0
+        self._cb2_active = 0
+        self._ca2_ctrl = 0
+        self._cb2_ctrl = 0
+        self._ca_port_clear = 0
+        self._cb_port_clear = 0
+
+        # Register handlers indexed by the address offset (RS0-RS3).
+        self._load_handlers = (
+            self._load_iorb,
+            self._load_iora,
+            self._load_ddrb,
+            self._load_ddra,
+            self._load_t1cl,
+            self._load_t1ch,
+            self._load_t1ll,
+            self._load_t1lh,
+            self._load_t2cl,
+            self._load_t2ch,
+            self._load_sr,
+            self._load_acr,
+            self._load_pcr,
+            self._load_ifr,
+            self._load_ier,
+            self._load_iora_nh,
+        )
+        self._store_handlers = (
+            self._store_iorb,
+            self._store_iora,
+            self._store_ddrb,
+            self._store_ddra,
+            self._store_t1cl,
+            self._store_t1ch,
+            self._store_t1ll,
+            self._store_t1lh,
+            self._store_t2cl,
+            self._store_t2ch,
+            self._store_sr,
+            self._store_acr,
+            self._store_pcr,
+            self._store_ifr,
+            self._store_ier,
+            self._store_iora_nh,
+        )
+        # Timer 1 time-out actions indexed by ACR bits 6-7.
+        self._t1_timeout_handlers = (
+            self._t1_timeout_one_shot,
+            self._t1_timeout_free_run,
+            self._t1_timeout_one_shot_pb7,
+            self._t1_timeout_free_run_pb7,
+        )
 
         self.reset()
 
@@ -133,15 +219,39 @@ class Via6522:
                 self.ifr &= ~self.IFR_BIT_IRQ
                 self.handlerIRQ(0)
 
+    # _set_interrupt/_clear_interrupt inline _process_irq on a local copy of
+    # IFR; the IRQ hook still runs after IFR has been stored.
     def _set_interrupt(self, value: int) -> None:
-        if (self.ifr & value) == 0:
-            self.ifr |= value
-            self._process_irq()
+        ifr = self.ifr
+        if ifr & value:
+            return
+        ifr |= value
+        if self.ier & ifr & 0x7F:
+            if not ifr & 0x80:
+                self.ifr = ifr | 0x80
+                self.handlerIRQ(1)
+                return
+        elif ifr & 0x80:
+            self.ifr = ifr & 0x7F
+            self.handlerIRQ(0)
+            return
+        self.ifr = ifr
 
     def _clear_interrupt(self, value: int) -> None:
-        if (self.ifr & value) != 0:
-            self.ifr &= ~value
-            self._process_irq()
+        ifr = self.ifr
+        if not ifr & value:
+            return
+        ifr &= ~value
+        if self.ier & ifr & 0x7F:
+            if not ifr & 0x80:
+                self.ifr = ifr | 0x80
+                self.handlerIRQ(1)
+                return
+        elif ifr & 0x80:
+            self.ifr = ifr & 0x7F
+            self.handlerIRQ(0)
+            return
+        self.ifr = ifr
 
     def handlerIRQ(self, state: int) -> None:  # noqa: N802 - override hook
         """IRQ線の変化を通知するフック。サブクラス側で接続先へ伝える。"""
@@ -154,20 +264,23 @@ class Via6522:
         mask = 1 << bit
         if self.ddra & mask:
             return
-        if state:
-            self.port_a |= mask
-        else:
-            self.port_a &= ~mask
+        self.port_a = (self.port_a & ~mask) | (-(state != 0) & mask)
         if (self.acr & 0x01) == 0:
             self.ira = self.port_a & 0xFF
+        self._update_port_a_input()
 
     def setPortAValue(self, value: int) -> None:
         self.port_a = (self.port_a & self.ddra) | (value & ~self.ddra)
         if (self.acr & 0x01) == 0:
             self.ira = self.port_a & 0xFF
+        self._update_port_a_input()
+
+    def _update_port_a_input(self) -> None:
+        ddra = self.ddra
+        self._port_a_in = ((self.ira & ~ddra) | (self.port_a & ddra)) & 0xFF
 
     def inputPortA(self) -> int:  # noqa: N802
-        return ((self.ira & ~self.ddra) | (self.port_a & self.ddra)) & 0xFF
+        return self._port_a_in
 
     def inputPortABit(self, bit: int) -> int:  # noqa: N802
         return (self.inputPortA() >> bit) & 0x01
@@ -183,12 +296,11 @@ class Via6522:
         if self.ca1_in == state:
             return
         self.ca1_in = state
-        edge_pos = (self.pcr & 0x01) == 0x01
-        if (state == 1 and edge_pos) or (state == 0 and not edge_pos):
+        if state == self._ca1_active:
             if (self.acr & 0x01) == 0x01:
                 self.ira = self.inputPortA()
             self._set_interrupt(self.IFR_BIT_CA1)
-            if self.ca2_out == 0 and (self.pcr & 0x0E) == 0x08:
+            if self.ca2_out == 0 and self._ca2_ctrl == 0x08:
                 self.ca2_out = 1
                 self.handlerCA2(self.ca2_out)
 
@@ -196,10 +308,9 @@ class Via6522:
         if self.ca2_in == state:
             return
         self.ca2_in = state
-        if (self.pcr & 0x08) != 0x00:
+        if self._ca2_ctrl & 0x08:
             return
-        rising = (self.pcr & 0x0C) == 0x04
-        if (state == 1 and rising) or (state == 0 and not rising):
+        if state == self._ca2_active:
             self._set_interrupt(self.IFR_BIT_CA2)
 
     def handlerCA2(self, status: int) -> None:  # noqa: N802
@@ -213,31 +324,32 @@ class Via6522:
         mask = 1 << bit
         if self.ddrb & mask:
             return
-        if state:
-            self.port_b |= mask
-        else:
-            self.port_b &= ~mask
+        self.port_b = (self.port_b & ~mask) | (-(state != 0) & mask)
         if (self.acr & 0x02) == 0:
             self.irb = self.port_b & 0xFF
+            self._update_port_b_input()
 
     def setPortBValue(self, value: int) -> None:
         self.port_b = (self.port_b & self.ddrb) | (value & ~self.ddrb)
         if (self.acr & 0x02) == 0:
             self.irb = self.port_b & 0xFF
+            self._update_port_b_input()
 
     def invertPortB(self, bit: int) -> None:  # noqa: N802
         mask = 1 << bit
         if self.ddrb & mask:
             return
-        if self.port_b & mask:
-            self.port_b &= ~mask
-        else:
-            self.port_b |= mask
+        self.port_b ^= mask
         if (self.acr & 0x02) == 0:
             self.irb = self.port_b & 0xFF
+            self._update_port_b_input()
+
+    def _update_port_b_input(self) -> None:
+        ddrb = self.ddrb
+        self._port_b_in = ((self.irb & ~ddrb) | (self.orb & ddrb)) & 0xFF
 
     def inputPortB(self) -> int:  # noqa: N802
-        return ((self.irb & ~self.ddrb) | (self.orb & self.ddrb)) & 0xFF
+        return self._port_b_in
 
     def inputPortBBit(self, bit: int) -> int:  # noqa: N802
         return (self.inputPortB() >> bit) & 0x01
@@ -253,16 +365,15 @@ class Via6522:
         if self.cb1_in == state:
             return
         self.cb1_in = state
-        edge_pos = (self.pcr & 0x10) == 0x10
-        if (state == 1 and edge_pos) or (state == 0 and not edge_pos):
+        if state == self._cb1_active:
             if (self.acr & 0x02) == 0x02:
                 self.irb = self.inputPortB()
-            if self.shift_started and (self.acr & 0x1C) == 0x0C:
+            if self.shift_started and self._acr_shift_mode == 0x0C:
                 self._process_shift_in()
-            if self.shift_started and (self.acr & 0x1C) == 0x1C:
+            if self.shift_started and self._acr_shift_mode == 0x1C:
                 self._process_shift_out()
             self._set_interrupt(self.IFR_BIT_CB1)
-            if self.cb2_out == 0 and (self.pcr & 0xC0) == 0x80:
+            if self.cb2_out == 0 and self._cb2_ctrl in (0x80, 0xA0):
                 self.cb2_out = 1
                 self.handlerCB2(self.cb2_out)
 
@@ -270,10 +381,9 @@ class Via6522:
         if self.cb2_in == state:
             return
         self.cb2_in = state
-        if (self.pcr & 0x80) != 0x00:
+        if self._cb2_ctrl & 0x80:
             return
-        rising = (self.pcr & 0xC0) == 0x40
-        if (state == 1 and rising) or (state == 0 and not rising):
+        if state == self._cb2_active:
             self._set_interrupt(self.IFR_BIT_CB2)
 
     def handlerCB1(self, status: int) -> None:  # noqa: N802
@@ -315,7 +425,7 @@ class Via6522:
             self.sr >>= 1
             self.sr &= 0x7F
             self.sr |= self.cb2_in << 7
-            self.shift_counter = (self.shift_counter + 1) % 8
+            self.shift_counter = (self.shift_counter + 1) & 7
             if self.shift_counter == 0:
                 self._set_interrupt(self.IFR_BIT_SR)
                 self.shift_started = False
@@ -334,7 +444,7 @@ class Via6522:
             self.cb2_out = out_bit
             self.handlerCB2(self.cb2_out)
             self.sr = ((self.sr << 1) & 0xFE) | 0x01
-            self.shift_counter = (self.shift_counter + 1) % 8
+            self.shift_counter = (self.shift_counter + 1) & 7
             if self.shift_counter == 0:
                 self._set_interrupt(self.IFR_BIT_SR)
                 self.shift_started = False
@@ -349,149 +459,188 @@ class Via6522:
         delay = 0
         self._execute(self.computer.getClockCount() - 1 + delay)
         offset = address - self.start_address
-        result = 0
-        if offset == self.VIA_REG_IORB:
-            if (self.acr & 0x02) == 0:
-                result = self.inputPortB()
-            else:
-                result = self.irb & 0xFF
-            self._clear_interrupt(self.IFR_BIT_CB1 | (0x00 if (self.pcr & 0xA0) == 0x20 else self.IFR_BIT_CB2))
-        elif offset == self.VIA_REG_IORA:
-            result = self.inputPortA() if (self.acr & 0x01) == 0 else self.ira & 0xFF
-            self._clear_interrupt(self.IFR_BIT_CA1 | (0x00 if (self.pcr & 0x0A) == 0x02 else self.IFR_BIT_CA2))
-            if self.ca2_out == 1 and (((self.pcr & 0x0E) == 0x0A) or ((self.pcr & 0x0E) == 0x08)):
-                self.ca2_out = 0
-                self.handlerCA2(self.ca2_out)
-                if (self.pcr & 0x0E) == 0x08:
-                    self.ca2_timer = 1
-        elif offset == self.VIA_REG_DDRB:
-            result = self.ddrb & 0xFF
-        elif offset == self.VIA_REG_DDRA:
-            result = self.ddra & 0xFF
-        elif offset == self.VIA_REG_T1CL:
-            self._clear_interrupt(self.IFR_BIT_T1)
-            result = self.timer1 & 0xFF
-        elif offset == self.VIA_REG_T1CH:
-            result = (self.timer1 >> 8) & 0xFF
-        elif offset == self.VIA_REG_T1LL:
-            result = self.latch1 & 0xFF
-        elif offset == self.VIA_REG_T1LH:
-            result = (self.latch1 >> 8) & 0xFF
-        elif offset == self.VIA_REG_T2CL:
-            self._clear_interrupt(self.IFR_BIT_T2)
-            result = self.timer2 & 0xFF
-        elif offset == self.VIA_REG_T2CH:
-            result = (self.timer2 >> 8) & 0xFF
-        elif offset == self.VIA_REG_SR:
-            mode = self.acr & 0x1C
-            if mode in (0x04, 0x08, 0x0C):
-                self._initialize_shift_in()
-            elif mode in (0x10, 0x14, 0x18, 0x1C):
-                self._initialize_shift_out()
-            result = self.sr & 0xFF
-        elif offset == self.VIA_REG_ACR:
-            result = self.acr & 0xFF
-        elif offset == self.VIA_REG_PCR:
-            result = self.pcr & 0xFF
-        elif offset == self.VIA_REG_IFR:
-            result = self.ifr & 0xFF
-        elif offset == self.VIA_REG_IER:
-            result = self.ier | 0x80
-        elif offset == self.VIA_REG_IORANH:
-            result = self.inputPortA() if (self.acr & 0x01) == 0 else self.ira & 0xFF
-        else:
+        if offset & ~0x0F:
             raise AssertionError(f"invalid register {address:#04x}")
-        self._execute(self.computer.getClockCount() + delay)
-        return result & 0xFF
+        # The clock of the access itself is left for the next catch-up: the
+        # next access (or execute()) replays it before anything can look.
+        return self._load_handlers[offset]() & 0xFF
 
     def store8(self, address: int, value: int) -> None:
-        value &= 0xFF
         delay = 0
         self._execute(self.computer.getClockCount() - 1 + delay)
         offset = address - self.start_address
-        if offset == self.VIA_REG_IORB:
-            self.orb = value
-            self.outputPortB()
-            self._clear_interrupt(self.IFR_BIT_CB1 | (0x00 if (self.pcr & 0xA0) == 0x20 else self.IFR_BIT_CB2))
-            if self.cb2_out == 1 and (self.pcr & 0xC0) == 0x80:
-                self.cb2_out = 0
-                self.handlerCB2(self.cb2_out)
-            self.storeORB_option()
-        elif offset == self.VIA_REG_IORA:
-            self.ora = value
-            if self.ddra != 0x00:
-                self.outputPortA()
-            self._clear_interrupt(self.IFR_BIT_CA1 | (0x00 if (self.pcr & 0x0A) == 0x02 else self.IFR_BIT_CA2))
-            if self.ca2_out == 1 and (((self.pcr & 0x0E) == 0x0A) or (self.pcr & 0x0C) == 0x08):
-                self.ca2_out = 0
-                self.handlerCA2(self.ca2_out)
-            if (self.pcr & 0x0E) == 0x0A:
-                self.ca2_timer = 1
-            self.storeIORA_option()
-        elif offset == self.VIA_REG_DDRB:
-            self.ddrb = value
-            self.storeDDRB_option()
-        elif offset == self.VIA_REG_DDRA:
-            self.ddra = value
-            self.storeDDRA_option()
-        elif offset == self.VIA_REG_T1CL:
-            self.latch1 = (self.latch1 & 0xFF00) | value
-            self.storeT1CL_option()
-        elif offset == self.VIA_REG_T1CH:
-            self.latch1 = (self.latch1 & 0x00FF) | ((value << 8) & 0xFF00)
-            self.timer1 = self.latch1
-            self.timer1_initialized = True
-            self.timer1_enable = True
-            self.setPortB(7, 0)
-            self.storeT1CH_option()
-        elif offset == self.VIA_REG_T1LL:
-            self.latch1 = (self.latch1 & 0xFF00) | value
-            self.storeT1LL_option()
-        elif offset == self.VIA_REG_T1LH:
-            self.latch1 = (self.latch1 & 0x00FF) | ((value << 8) & 0xFF00)
-            self.storeT1LH_option()
-        elif offset == self.VIA_REG_T2CL:
-            self.latch2 = (self.latch2 & 0xFF00) | value
-            self.storeT2CL_option()
-        elif offset == self.VIA_REG_T2CH:
-            self.latch2 = (self.latch2 & 0x00FF) | ((value << 8) & 0xFF00)
-            self.timer2 = self.latch2
-            self._clear_interrupt(self.IFR_BIT_T2)
-            self.timer2_initialized = True
-            self.timer2_enable = True
-            self.storeT2CH_option()
-        elif offset == self.VIA_REG_SR:
-            mode = self.acr & 0x1C
-            if mode in (0x04, 0x08, 0x0C):
-                self._initialize_shift_in()
-            elif mode in (0x10, 0x14, 0x18, 0x1C):
-                self._initialize_shift_out()
-            elif mode != 0x00:
-                raise AssertionError(f"invalid sr mode {mode:#02x}")
-            self.sr = value
-            self.storeSR_option()
-        elif offset == self.VIA_REG_ACR:
-            self.acr = value
-            self.storeACR_option()
-        elif offset == self.VIA_REG_PCR:
-            self.pcr = value
-            self.storePCR_option()
-        elif offset == self.VIA_REG_IFR:
-            if value & 0x80:
-                value = 0x7F
-            self._clear_interrupt(value)
-            self.storeIFR_option()
-        elif offset == self.VIA_REG_IER:
-            self.ier = value
-            self.storeIER_option()
-        elif offset == self.VIA_REG_IORANH:
-            self.ora = value
-            if self.ddra != 0x00:
-                self.outputPortA()
-            self.storeIORA_NOHS_option()
-        else:
+        if offset & ~0x0F:
             raise AssertionError(f"invalid register {address:#04x}")
-        self._execute(self.computer.getClockCount() + delay)
+        self._store_handlers[offset](value & 0xFF)
+
+    def _load_iorb(self) -> int:
+        if (self.acr & 0x02) == 0:
+            result = self.inputPortB()
+        else:
+            result = self.irb & 0xFF
+        self._clear_interrupt(self._cb_port_clear)
+        return result
+
+    def _load_iora(self) -> int:
+        result = self.inputPortA() if (self.acr & 0x01) == 0 else self.ira & 0xFF
+        self._clear_interrupt(self._ca_port_clear)
+        if self.ca2_out == 1 and self._ca2_ctrl in (0x08, 0x0A):
+            self.ca2_out = 0
+            self.handlerCA2(self.ca2_out)
+            if self._ca2_ctrl == 0x08:
+                self.ca2_timer = 1
+        return result
+
+    def _load_ddrb(self) -> int:
+        return self.ddrb & 0xFF
+
+    def _load_ddra(self) -> int:
+        return self.ddra & 0xFF
+
+    def _load_t1cl(self) -> int:
+        self._clear_interrupt(self.IFR_BIT_T1)
+        return self.timer1 & 0xFF
+
+    def _load_t1ch(self) -> int:
+        return (self.timer1 >> 8) & 0xFF
+
+    def _load_t1ll(self) -> int:
+        return self.latch1 & 0xFF
+
+    def _load_t1lh(self) -> int:
+        return (self.latch1 >> 8) & 0xFF
+
+    def _load_t2cl(self) -> int:
+        self._clear_interrupt(self.IFR_BIT_T2)
+        return self.timer2 & 0xFF
+
+    def _load_t2ch(self) -> int:
+        return (self.timer2 >> 8) & 0xFF
+
+    def _load_sr(self) -> int:
+        mode = self._acr_shift_mode
+        if mode in (0x04, 0x08, 0x0C):
+            self._initialize_shift_in()
+        elif mode in (0x10, 0x14, 0x18, 0x1C):
+            self._initialize_shift_out()
+        return self.sr & 0xFF
+
+    def _load_acr(self) -> int:
+        return self.acr & 0xFF
+
+    def _load_pcr(self) -> int:
+        return self.pcr & 0xFF
+
+    def _load_ifr(self) -> int:
+        return self.ifr & 0xFF
+
+    def _load_ier(self) -> int:
+        return self.ier | 0x80
+
+    def _load_iora_nh(self) -> int:
+        return self.inputPortA() if (self.acr & 0x01) == 0 else self.ira & 0xFF
+
+    def _store_iorb(self, value: int) -> None:
+        self.orb = value
+        self._update_port_b_input()
+        self.outputPortB()
+        self._clear_interrupt(self._cb_port_clear)
+        if self.cb2_out == 1 and self._cb2_ctrl in (0x80, 0xA0):
+            self.cb2_out = 0
+            self.handlerCB2(self.cb2_out)
+        self.storeORB_option()
+
+    def _store_iora(self, value: int) -> None:
+        self.ora = value
+        if self.ddra != 0x00:
+            self.outputPortA()
+        self._clear_interrupt(self._ca_port_clear)
+        if self.ca2_out == 1 and self._ca2_ctrl in (0x08, 0x0A):
+            self.ca2_out = 0
+            self.handlerCA2(self.ca2_out)
+        if self._ca2_ctrl == 0x0A:
+            self.ca2_timer = 1
+        self.storeIORA_option()
+
+    def _store_ddrb(self, value: int) -> None:
+        self.ddrb = value
+        self._update_port_b_input()
+        self.storeDDRB_option()
+
+    def _store_ddra(self, value: int) -> None:
+        self.ddra = value
+        self._update_port_a_input()
+        self.storeDDRA_option()
+
+    def _store_t1cl(self, value: int) -> None:
+        self.latch1 = (self.latch1 & 0xFF00) | value
+        self.storeT1CL_option()
+
+    def _store_t1ch(self, value: int) -> None:
+        self.latch1 = (self.latch1 & 0x00FF) | ((value << 8) & 0xFF00)
+        self.timer1 = self.latch1
+        self.timer1_initialized = True
+        self.timer1_enable = True
+        self.setPortB(7, 0)
+        self._t1_hook_key = (self._acr_t1_mode << 16) | self.latch1
+        self.storeT1CH_option()
+
+    def _store_t1ll(self, value: int) -> None:
+        self.latch1 = (self.latch1 & 0xFF00) | value
+        self.storeT1LL_option()
+
+    def _store_t1lh(self, value: int) -> None:
+        self.latch1 = (self.latch1 & 0x00FF) | ((value << 8) & 0xFF00)
+        self.storeT1LH_option()
+
+    def _store_t2cl(self, value: int) -> None:
+        self.latch2 = (self.latch2 & 0xFF00) | value
+        self.storeT2CL_option()
+
+    def _store_t2ch(self, value: int) -> None:
+        self.latch2 = (self.latch2 & 0x00FF) | ((value << 8) & 0xFF00)
+        self.timer2 = self.latch2
+        self._clear_interrupt(self.IFR_BIT_T2)
+        self.timer2_initialized = True
+        self.timer2_enable = True
+        self.storeT2CH_option()
+
+    def _store_sr(self, value: int) -> None:
+        mode = self._acr_shift_mode
+        if mode in (0x04, 0x08, 0x0C):
+            self._initialize_shift_in()
+        elif mode in (0x10, 0x14, 0x18, 0x1C):
+            self._initialize_shift_out()
+        elif mode != 0x00:
+            raise AssertionError(f"invalid sr mode {mode:#02x}")
+        self.sr = value
+        self.storeSR_option()
+
+    def _store_acr(self, value: int) -> None:
+        self.acr = value
+        self._refresh_acr_modes()
+        self.storeACR_option()
+
+    def _store_pcr(self, value: int) -> None:
+        self.pcr = value
+        self._refresh_pcr_modes()
+        self.storePCR_option()
+
+    def _store_ifr(self, value: int) -> None:
+        if value & 0x80:
+            value = 0x7F
+        self._clear_interrupt(value)
+        self.storeIFR_option()
+
+    def _store_ier(self, value: int) -> None:
+        self.ier = value
+        self.storeIER_option()
+
+    def _store_iora_nh(self, value: int) -> None:
+        self.ora = value
+        if self.ddra != 0x00:
+            self.outputPortA()
+        self.storeIORA_NOHS_option()
 
     # ---------------------------------------------------------------------
     # Extension points (no-op by default)
@@ -560,74 +709,178 @@ class Via6522:
     # Execution core
     # ---------------------------------------------------------------------
     def _execute(self, clock: int) -> None:
-        while self.current_clock <= clock:
-            if self.ca2_timer >= 0:
-                self.ca2_timer -= 1
-                if self.ca2_timer < 0:
-                    self.ca2_out = 1
-                    self.handlerCA2(self.ca2_out)
-
-            if self.timer1_initialized:
-                self.timer1_initialized = False
-            elif self.timer1 >= 0:
-                self.timer1 -= 1
+        current = self.current_clock
+        if clock - current < _SHORT_RUN:
+            # A clock or two (the usual gap around a register access) are
+            # cheaper to replay than to plan.
+            tick = self._tick
+            while current <= clock:
+                tick()
+                current += 1
+            return
+        while current <= clock:
+            # Jump over the quiet ticks ahead in one step; the tick that ends
+            # the run is replayed by _tick() with all of its side effects.
+            ticks = self._quiet_ticks(clock - current + 1)
+            if ticks:
+                self._skip(ticks)
+                current += ticks
+                if current > clock:
+                    return
+            self._tick()
+            current = self.current_clock
+
+    def _quiet_ticks(self, limit: int) -> int:
+        """How many of the next ``limit`` clocks fire no hook, interrupt or
+        shift (timer reloads that only reload count as quiet)."""
+        if self._acr_shift_mode in (0x08, 0x18):
+            return 0
+        ca2_timer = self.ca2_timer
+        if 0 <= ca2_timer < limit:
+            if not ca2_timer:
+                return 0
+            limit = ca2_timer
+        timer1 = self.timer1
+        pending = self.timer1_initialized
+        quiet = pending + timer1 + 1 if timer1 >= 0 else pending
+        # A disabled timer 1 reloads quietly once the hook has seen this
+        # ACR/latch (see T1_RELOAD_HOOK_IDEMPOTENT).
+        if quiet < limit and (
+            self.timer1_enable
+            or not self.T1_RELOAD_HOOK_IDEMPOTENT
+            or self._t1_hook_key != (self._acr_t1_mode << 16) | self.latch1
+        ):
+            if not quiet:
+                return 0
+            limit = quiet
+        if self.timer2_enable or self.shift_started:
+            # Timer 2 must stop at its underflow instead of reloading.
+            timer2 = self.timer2
+            if timer2 < 0:
+                return 0
+            if not self._acr_t2_pb6:
+                quiet = self.timer2_initialized + timer2 + 1
+                if quiet < limit:
+                    limit = quiet
+            elif timer2 == 0 and limit > 1 and self.previous_pb6 and not self._port_b_in & 0x40:
+                limit = 1
+        return limit
+
+    def _skip(self, ticks: int) -> None:
+        # Advance the counters by ``ticks`` quiet clocks (see _quiet_ticks).
+        if self.ca2_timer > 0:
+            self.ca2_timer -= ticks
+        left = ticks
+        if self.timer1_initialized:
+            self.timer1_initialized = False
+            left -= 1
+        timer1 = self.timer1
+        if left <= timer1 + 1:
+            self.timer1 = timer1 - left
+        else:
+            self.timer1 = _count_down(timer1, self.latch1, left)
+        timer2 = self.timer2
+        latch2 = self.latch2
+        current_pb6 = self._port_b_in & 0x40
+        if self._acr_t2_pb6:
+            # PB6 cannot change mid-run: only the first tick may see a
+            # falling edge.
+            if timer2 < 0:
+                timer2 = latch2
+            elif self.previous_pb6 and not current_pb6:
+                timer2 -= 1
+            if ticks > 1 and timer2 < 0:
+                timer2 = latch2
+        else:
+            left = ticks
+            if timer2 < 0:
+                timer2 = latch2
+                left -= 1
+            if left and self.timer2_initialized:
+                self.timer2_initialized = False
+                left -= 1
+            if left <= timer2 + 1:
+                timer2 -= left
             else:
-                if self.timer1_enable:
-                    self._set_interrupt(self.IFR_BIT_T1)
-                    mode = self.acr & 0xC0
-                    if mode == 0x00:
-                        self.timer1_enable = False
-                        self.timer1TimeoutMode0_option()
-                    elif mode == 0x40:
-                        self.invertPortB(7)
-                        self.timer1TimeoutMode1_option()
-                    elif mode == 0x80:
-                        self.timer1_enable = False
-                        self.setPortB(7, 1)
-                        self.timer1TimeoutMode2_option()
-                    elif mode == 0xC0:
-                        self.invertPortB(7)
-                        self.timer1TimeoutMode3_option()
-                    else:
-                        raise AssertionError(f"invalid t1mode: {mode:#02x}")
-                self.timer1 = self.latch1
-                self.storeT1CH_option()
-
-            current_pb6 = self.inputPortB() & 0x40
-            pb6_negative = self.previous_pb6 != 0 and current_pb6 == 0
-            self.previous_pb6 = current_pb6
-
-            if self.timer2 >= 0:
-                mode = self.acr & 0x20
-                if mode == 0x00:
-                    if self.timer2_initialized:
-                        self.timer2_initialized = False
-                    else:
-                        self.timer2 -= 1
-                elif mode == 0x20:
-                    if pb6_negative:
-                        self.timer2 -= 1
+                timer2 = _count_down(timer2, latch2, left)
+        self.timer2 = timer2
+        self.previous_pb6 = current_pb6
+        self.current_clock += ticks
+
+    def _tick(self) -> None:
+        # One clock with every side effect, exactly as the Java loop body.
+        if self.ca2_timer >= 0:
+            self.ca2_timer -= 1
+            if self.ca2_timer < 0:
+                self.ca2_out = 1
+                self.handlerCA2(self.ca2_out)
+
+        if self.timer1_initialized:
+            self.timer1_initialized = False
+        elif self.timer1 >= 0:
+            self.timer1 -= 1
+        else:
+            if self.timer1_enable:
+                self._set_interrupt(self.IFR_BIT_T1)
+                self._t1_timeout()
+            self.timer1 = self.latch1
+            self._t1_hook_key = (self._acr_t1_mode << 16) | self.latch1
+            self.storeT1CH_option()
+
+        current_pb6 = self._port_b_in & 0x40
+        pb6_negative = self.previous_pb6 != 0 and current_pb6 == 0
+        self.previous_pb6 = current_pb6
+
+        if self.timer2 >= 0:
+            mode = self._acr_t2_pb6
+            if mode == 0x00:
+                if self.timer2_initialized:
+                    self.timer2_initialized = False
                 else:
-                    raise AssertionError(f"invalid t2mode: {mode:#02x}")
+                    self.timer2 -= 1
+            elif mode == 0x20:
+                if pb6_negative:
+                    self.timer2 -= 1
             else:
-                if self.timer2_enable:
-                    self._set_interrupt(self.IFR_BIT_T2)
-                    self.timer2_enable = False
-                if self.shift_started and (self.timer2 & 0xFF) == 0xFF:
-                    mode = self.acr & 0x1C
-                    if mode == 0x04:
-                        self._process_shift_in()
-                    elif mode in (0x10, 0x14):
-                        self._process_shift_out()
-                self.timer2 = self.latch2
-
-            mode = self.acr & 0x1C
-            if mode == 0x08:
-                self._process_shift_in()
-            elif mode == 0x18:
-                self._process_shift_out()
+                raise AssertionError(f"invalid t2mode: {mode:#02x}")
+        else:
+            if self.timer2_enable:
+                self._set_interrupt(self.IFR_BIT_T2)
+                self.timer2_enable = False
+            if self.shift_started and (self.timer2 & 0xFF) == 0xFF:
+                mode = self._acr_shift_mode
+                if mode == 0x04:
+                    self._process_shift_in()
+                elif mode in (0x10, 0x14):
+                    self._process_shift_out()
+            self.timer2 = self.latch2
+
+        mode = self._acr_shift_mode
+        if mode == 0x08:
+            self._process_shift_in()
+        elif mode == 0x18:
+            self._process_shift_out()
+
+        self.current_clock += 1
+
+    # Timer 1 time-out actions by ACR bits 6-7; _refresh_acr_modes() binds
+    # the one for the current mode to _t1_timeout.
+    def _t1_timeout_one_shot(self) -> None:
+        self.timer1_enable = False
+        self.timer1TimeoutMode0_option()
+
+    def _t1_timeout_free_run(self) -> None:
+        self.invertPortB(7)
+        self.timer1TimeoutMode1_option()
 
-            self.current_clock += 1
+    def _t1_timeout_one_shot_pb7(self) -> None:
+        self.timer1_enable = False
+        self.setPortB(7, 1)
+        self.timer1TimeoutMode2_option()
+
+    def _t1_timeout_free_run_pb7(self) -> None:
+        self.invertPortB(7)
+        self.timer1TimeoutMode3_option()
 
     def execute(self) -> None:
         self._execute(self.computer.getClockCount())
@@ -655,6 +908,8 @@ class Via6522:
         self.cb1_out = 0
         self.cb2_in = 0
         self.cb2_out = 0
+        self._port_a_in = 0
+        self._port_b_in = 0
 
         self.latch1 = 0
         self.latch2 = 0
@@ -673,6 +928,36 @@ class Via6522:
         self.shift_counter = 0
 
         self.current_clock = 0
+        self._t1_hook_key = -1
+
+        self._refresh_acr_modes()
+        self._refresh_pcr_modes()
+
+    def _refresh_acr_modes(self) -> None:
+        # ACR fields the clock loop tests every tick, decoded once per write.
+        acr = self.acr
+        self._acr_shift_mode = acr & 0x1C
+        self._acr_t2_pb6 = acr & 0x20
+        self._acr_t1_mode = acr & 0xC0
+        self._t1_timeout = self._t1_timeout_handlers[acr >> 6]
+
+    def _refresh_pcr_modes(self) -> None:
+        # Input level that completes the active edge of each control line.
+        pcr = self.pcr
+        self._ca1_active = pcr & 0x01
+        self._ca2_active = 1 if (pcr & 0x0C) == 0x04 else 0
+        self._cb1_active = (pcr >> 4) & 0x01
+        self._cb2_active = 1 if (pcr & 0xC0) == 0x40 else 0
+        # CA2/CB2 control fields, and the IFR bits a port A/B access clears
+        # (CA2/CB2 are left alone in the independent-interrupt input modes).
+        self._ca2_ctrl = pcr & 0x0E
+        self._cb2_ctrl = pcr & 0xE0
+        self._ca_port_clear = self.IFR_BIT_CA1 | (
+            0x00 if (pcr & 0x0A) == 0x02 else self.IFR_BIT_CA2
+        )
+        self._cb_port_clear = self.IFR_BIT_CB1 | (
+            0x00 if (pcr & 0xA0) == 0x20 else self.IFR_BIT_CB2
+        )
 
 
 class JR100Via6522(Via6522):
@@ -681,15 +966,32 @@ class JR100Via6522(Via6522):
     FONT_NORMAL = 0
     FONT_USER_DEFINED = 1
 
+    # storeT1CH_option only drives the beeper from ACR and timer 1 (the
+    # latch, on a reload); repeating it with both unchanged changes nothing.
+    T1_RELOAD_HOOK_IDEMPOTENT = True
+
     def __init__(self, computer: ComputerLike, start_address: int) -> None:
         super().__init__(computer, start_address)
         self.prev_frequency = 0.0
 
+    def reset(self) -> None:
+        super().reset()
+        self._bind_hardware()
+
+    def _bind_hardware(self) -> None:
+        # The machine wires its peripherals before the VIA; the hooks below
+        # run on port and timer writes, so resolve them once.
+        hardware = self.computer.getHardware()
+        self._display = hardware.getDisplay()
+        self._keyboard = hardware.getKeyboard()
+        self._key_matrix = self._keyboard.getKeyMatrix()
+        self._sound = hardware.getSoundProcessor()
+
     def _jumper_pb7_pb6(self) -> None:
         self.setPortB(6, self.inputPortBBit(7))
 
     def storeORB_option(self) -> None:  # noqa: N802
-        display = self.computer.getHardware().getDisplay()
+        display = self._display
         if self.inputPortB() & 0x20:
             display.setCurrentFont(self.FONT_USER_DEFINED)
         else:
@@ -697,31 +999,22 @@ class JR100Via6522(Via6522):
         self._jumper_pb7_pb6()
 
     def storeIORA_option(self) -> None:  # noqa: N802
-        keyboard = self.computer.getHardware().getKeyboard()
-        matrix = keyboard.getKeyMatrix()
-        row = self.ora & 0x0F
-        value = self.inputPortB() & 0xE0
-        if 0 <= row < len(matrix):
-            value |= (~matrix[row]) & 0x1F
-        else:
-            value |= 0x1F
-        self.setPortBValue(value & 0xFF)
+        # The keyboard keeps all 16 rows, so the 4-bit row select always hits.
+        row = self._key_matrix[self.ora & 0x0F]
+        self.setPortBValue((self.inputPortB() & 0xE0) | (~row & 0x1F))
         self._jumper_pb7_pb6()
 
     def storeT1CH_option(self) -> None:  # noqa: N802
-        sound = self.computer.getHardware().getSoundProcessor()
-        if (self.acr & 0xC0) == 0xC0:
+        sound = self._sound
+        if self._acr_t1_mode == 0xC0:
             period = self.timer1 + 2
-            if period <= 0:
-                frequency = 0.0
-            else:
-                frequency = 894_886.25 / period / 2.0
+            frequency = _T1_TONE_CLOCK_HZ / period if period > 0 else 0.0
             if frequency == self.prev_frequency:
                 sound.setLineOn()
                 return
             self.prev_frequency = frequency
             timestamp = (
-                self.current_clock * 1_000_000_000 // JR100_CPU_CLOCK_HZ
+                self.current_clock * _NS_PER_SECOND // JR100_CPU_CLOCK_HZ
                 + self.computer.getBaseTime()
             )
             sound.setFrequency(timestamp, frequency)
@@ -730,7 +1023,7 @@ class JR100Via6522(Via6522):
             sound.setLineOff()
 
     def timer1TimeoutMode0_option(self) -> None:  # noqa: N802
-        self.computer.getHardware().getSoundProcessor().setLineOff()
+        self._sound.setLineOff()
 
     def timer1TimeoutMode2_option(self) -> None:  # noqa: N802
         self._jumper_pb7_pb6()
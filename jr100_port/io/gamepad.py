@@ -2,22 +2,66 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
+_RIGHT = 0x01
+_LEFT = 0x02
+_UP = 0x04
+_DOWN = 0x08
+_BUTTON = 0x10
 
-@dataclass
+
+def _bit(mask: int) -> property:
+    """Expose one bit of the packed port byte as a bool attribute."""
+
+    def getter(state: "GamepadState") -> bool:
+        return bool(state._state & mask)
+
+    def setter(state: "GamepadState", value: bool) -> None:
+        state._state = (state._state | mask) if value else (state._state & ~mask)
+
+    return property(getter, setter)
+
+
+@dataclass(init=False, repr=False)
 class GamepadState:
     """Tracks joystick direction and button state.
 
     Bit layout (mirrors ExtendedIOPort comment):
     bit0: Right, bit1: Left, bit2: Up, bit3: Down, bit4: Switch (button), bit5: 0, bit6-7: undefined.
+
+    The state is kept packed in that layout, so ``to_byte`` is a single load
+    when the extended I/O port polls it.
     """
 
-    right: bool = False
-    left: bool = False
-    up: bool = False
-    down: bool = False
-    button: bool = False
+    _state: int = field(default=0, init=False, repr=False)
+
+    right = _bit(_RIGHT)
+    left = _bit(_LEFT)
+    up = _bit(_UP)
+    down = _bit(_DOWN)
+    button = _bit(_BUTTON)
+
+    def __init__(
+        self,
+        right: bool = False,
+        left: bool = False,
+        up: bool = False,
+        down: bool = False,
+        button: bool = False,
+    ) -> None:
+        self._state = 0
+        self.right = right
+        self.left = left
+        self.up = up
+        self.down = down
+        self.button = button
+
+    def __repr__(self) -> str:
+        return (
+            f"GamepadState(right={self.right}, left={self.left}, up={self.up}, "
+            f"down={self.down}, button={self.button})"
+        )
 
     def set_direction(
         self,
@@ -40,21 +84,10 @@ class GamepadState:
         self.button = pressed
 
     def clear(self) -> None:
-        self.right = self.left = self.up = self.down = self.button = False
+        self._state = 0
 
     def to_byte(self) -> int:
-        value = 0
-        if self.right:
-            value |= 0x01
-        if self.left:
-            value |= 0x02
-        if self.up:
-            value |= 0x04
-        if self.down:
-            value |= 0x08
-        if self.button:
-            value |= 0x10
-        return value & 0xFF
+        return self._state
 
 
 __all__ = ["GamepadState"]
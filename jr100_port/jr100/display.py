@@ -25,6 +25,10 @@ class JR100Display:
     HEIGHT_CHARS = 24
     PIXELS_PER_CHAR = 8
 
+    # Glyphs are read from memory when drawn, so VideoRam and
+    # UserDefinedCharacterRam need not report writes (see update_font).
+    font_updates = False
+
     def __init__(self, machine) -> None:
         self._machine = machine
         self._memory = machine.getHardware().getMemory()
@@ -89,12 +93,11 @@ class JR100Display:
         return tuple(glyphs)
 
     def _load_user_glyph(self, index: int) -> Glyph:
+        # User-defined and video RAM are plain storage mirrored in the flat
+        # ``mem`` buffer, so glyphs are sliced from it rather than read through
+        # load8(); codes past the UDC area continue into video RAM as in Java.
         base = self._user_defined_ram + index * self.PIXELS_PER_CHAR
-        rows = []
-        for line in range(self.PIXELS_PER_CHAR):
-            value = self._memory.load8(base + line)
-            rows.append(value & 0xFF)
-        return Glyph(tuple(rows))
+        return Glyph(tuple(self._memory.mem[base : base + self.PIXELS_PER_CHAR]))
 
     def update_font(self, code: int, line: int, value: int) -> None:
         # The renderer reads user-defined glyphs from memory on demand,
@@ -105,9 +108,11 @@ class JR100Display:
     def render_surface(self, surface, pygame_module, scale: int) -> None:
         surface.lock()
         try:
+            start = self._video_ram
+            codes = self._memory.mem[start : start + self.WIDTH_CHARS * self.HEIGHT_CHARS]
             for row in range(self.HEIGHT_CHARS):
                 for col in range(self.WIDTH_CHARS):
-                    code = self._memory.load8(self._video_ram + row * self.WIDTH_CHARS + col) & 0xFF
+                    code = codes[row * self.WIDTH_CHARS + col]
                     glyph, inverted, fg_color, bg_color = self.resolve_glyph(code)
                     self._blit_glyph(surface, pygame_module, col, row, glyph, inverted, fg_color, bg_color, scale)
         finally:
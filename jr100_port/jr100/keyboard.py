@@ -5,19 +5,24 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List
 
+KEY_MATRIX_ROWS = 16
+
 
 @dataclass
 class JR100Keyboard:
-    """Maintains the 16x8 key matrix expected by the VIA."""
+    """Maintains the 16x8 key matrix expected by the VIA.
+
+    The matrix list is updated in place so the VIA can keep a reference to it.
+    """
 
     computer: object | None = None
-    matrix: List[int] = field(default_factory=lambda: [0x00] * 16)
+    matrix: List[int] = field(default_factory=lambda: [0x00] * KEY_MATRIX_ROWS)
 
     def getKeyMatrix(self) -> List[int]:  # noqa: N802
         return self.matrix
 
     def reset(self) -> None:
-        self.matrix = [0x00] * 16
+        self.matrix[:] = [0x00] * KEY_MATRIX_ROWS
 
     def execute(self) -> None:
         return None
@@ -35,7 +40,8 @@ class JR100Keyboard:
         state_set["keyboard.matrix"] = list(self.matrix)
 
     def loadState(self, state_set) -> None:  # noqa: N802
-        self.matrix = list(state_set.get("keyboard.matrix", self.matrix))
+        rows = list(state_set.get("keyboard.matrix", self.matrix))[:KEY_MATRIX_ROWS]
+        self.matrix[:] = rows + [0x00] * (KEY_MATRIX_ROWS - len(rows))
 
 
 __all__ = ["JR100Keyboard"]
@@ -79,6 +79,9 @@ class JR100Machine(Computer):
         hardware.setDisplay(self.display)
         udc.set_display(self.display)
         video_ram.set_display(self.display)
+        # The display takes no font updates, so both can be plain RAM again.
+        memory.refresh_memory(udc)
+        memory.refresh_memory(video_ram)
 
         self.via = JR100Via6522(self, 0xC800)
         memory.registMemory(self.via)
@@ -33,6 +33,8 @@ PROG_MAX_BINARY_SECTIONS = 256
 ADDRESS_START_OF_BASIC_PROGRAM = 0x0246
 SENTINEL_VALUE = 0xDF
 
+_U32_LE = struct.Struct("<I")
+
 
 def load_prog(stream: BinaryIO, memory: MemorySystem) -> ProgramImage:
     loader = _ProgLoader(stream, memory)
@@ -105,7 +107,7 @@ class _ProgLoader:
                 break
             if len(length_bytes) < 4:
                 raise ProgFormatError("Unexpected end of PROG file")
-            section_length = struct.unpack("<I", length_bytes)[0]
+            section_length = _U32_LE.unpack(length_bytes)[0]
             section_payload = self._read_exact(section_length)
             reader = io.BytesIO(section_payload)
             payload_size = len(section_payload)
@@ -195,19 +197,19 @@ class _ProgLoader:
             return None
         if len(data) < 4:
             raise ProgFormatError("Unexpected end of PROG file")
-        return struct.unpack("<I", data)[0]
+        return _U32_LE.unpack(data)[0]
 
     def _read_u32(self) -> int:
         data = self._stream.read(4)
         if len(data) < 4:
             raise ProgFormatError("Unexpected end of PROG file")
-        return struct.unpack("<I", data)[0]
+        return _U32_LE.unpack(data)[0]
 
     def _read_u32_from(self, reader: io.BytesIO) -> int:
         data = reader.read(4)
         if len(data) < 4:
             raise ProgFormatError("Unexpected end of PROG section")
-        return struct.unpack("<I", data)[0]
+        return _U32_LE.unpack(data)[0]
 
     def _read_exact(self, length: int) -> bytes:
         if length < 0:
@@ -236,7 +238,7 @@ class _ProgLoader:
         data = reader.read(4)
         if len(data) < 4:
             raise ProgFormatError("Unexpected end of PROG section")
-        length = struct.unpack("<I", data)[0]
+        length = _U32_LE.unpack(data)[0]
         if length < 0 or length > max_length:
             raise ProgFormatError("Invalid string length in PROG section")
         raw = self._read_exact_from(reader, length)
@@ -8,6 +8,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from jr100_port.core.computer import Computer
+from jr100_port.core.time_manager import TimeManager
 
 
 class DummyCPU:
@@ -111,6 +112,26 @@ def test_power_off(computer: TestComputer) -> None:
     assert computer.getRunningStatus() == Computer.STATUS_STOPPED
 
 
+def test_power_on_after_reset_behind_power_off_still_resets(
+    computer: TestComputer,
+) -> None:
+    computer.powerOn()
+    computer.runFrame()
+    # Far enough ahead that a stale reset would not come due in one frame.
+    computer.setClockCount(10 * computer.getIntervalClocks())
+    computer.powerOff()
+    computer.reset()
+    computer.runFrame()
+    assert computer.getRunningStatus() == Computer.STATUS_STOPPED
+
+    computer.powerOn()
+    computer.runFrame()
+
+    cpu = computer.getCPU()
+    assert cpu is not None and cpu.reset_count == 2
+    assert computer.getEventQueue().isEmpty()
+
+
 def test_save_and_load_state(computer: TestComputer) -> None:
     computer.powerOn()
     computer.runFrame()
@@ -126,3 +147,33 @@ def test_execute_without_cpu_raises() -> None:
     comp.powerOn()
     with pytest.raises(RuntimeError):
         comp.runFrame()
+
+
+def test_run_frame_dispatches_due_time_manager_events(computer: TestComputer) -> None:
+    fired = []
+    computer.getTimeManager().addEvent(0, lambda: fired.append("due"))
+    computer.getTimeManager().addEvent(2**62, lambda: fired.append("future"))
+    computer.powerOn()
+    computer.runFrame()
+    assert fired == ["due"]
+
+
+def test_time_manager_orders_by_offset_then_insertion() -> None:
+    manager = TimeManager()
+    fired = []
+    manager.addEvent(20, lambda: fired.append("b1"))
+    manager.addEvent(10, lambda: fired.append("a"))
+    manager.addEvent(20, lambda: fired.append("b2"))
+    manager.dispatcher()
+    assert fired == ["a", "b1", "b2"]
+
+
+def test_time_manager_dispatcher_accepts_explicit_now() -> None:
+    manager = TimeManager()
+    fired = []
+    manager.addEvent(100, lambda: fired.append(100))
+    manager.addEvent(200, lambda: fired.append(200))
+    manager.dispatcher(now=99)
+    assert fired == []
+    manager.dispatcher(now=150)
+    assert fired == [100]
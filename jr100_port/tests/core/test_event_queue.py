@@ -0,0 +1,106 @@
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from jr100_port.core.event_queue import EventQueue, PauseEvent, ResetEvent
+
+
+@dataclass(eq=False)
+class DummyEvent:
+    clock: int
+    name: str = ""
+
+    def dispatch(self, computer) -> None:
+        pass
+
+
+def test_pop_order_is_clock_then_insertion() -> None:
+    queue = EventQueue()
+    late = DummyEvent(30, "late")
+    first = DummyEvent(10, "first")
+    second = DummyEvent(10, "second")
+    middle = DummyEvent(20, "middle")
+    for event in (late, first, second, middle):
+        queue.add(event)
+    assert list(queue) == [first, second, middle, late]
+    assert [queue.pop_first() for _ in range(4)] == [first, second, middle, late]
+    assert queue.isEmpty()
+
+
+def test_remove_head_and_inner_entries() -> None:
+    queue = EventQueue()
+    events = [DummyEvent(clock) for clock in (5, 1, 3, 2, 4)]
+    for event in events:
+        queue.add(event)
+    queue.remove(events[1])  # head (clock 1)
+    queue.remove(events[2])  # inner (clock 3)
+    assert queue.first() is events[3]
+    assert [event.clock for event in queue] == [2, 4, 5]
+    assert [queue.pop_first().clock for _ in range(3)] == [2, 4, 5]
+    assert queue.isEmpty()
+
+
+def test_remove_missing_event_raises() -> None:
+    queue = EventQueue()
+    event = DummyEvent(1)
+    queue.add(event)
+    queue.remove(event)
+    assert queue.isEmpty()
+    with pytest.raises(ValueError):
+        queue.remove(event)
+    with pytest.raises(IndexError):
+        queue.first()
+
+
+def test_same_event_added_twice_is_removed_once_per_call() -> None:
+    queue = EventQueue()
+    event = DummyEvent(7)
+    other = DummyEvent(3)
+    queue.add(event)
+    queue.add(other)
+    queue.add(event)
+    queue.remove(event)
+    assert list(queue) == [other, event]
+    queue.remove(event)
+    assert list(queue) == [other]
+    assert queue.pop_first() is other
+    assert queue.isEmpty()
+
+
+def test_duplicate_control_events_are_coalesced_while_pending() -> None:
+    queue = EventQueue()
+    first = ResetEvent(0)
+    queue.add(first)
+    queue.add(ResetEvent(0))
+    queue.add(PauseEvent(0))
+    assert [type(event) for event in queue] == [ResetEvent, PauseEvent]
+
+    assert queue.pop_first() is first
+    queue.add(ResetEvent(0))
+    assert [type(event) for event in queue] == [PauseEvent, ResetEvent]
+
+
+def test_same_kind_events_at_other_clocks_are_kept() -> None:
+    queue = EventQueue()
+    later = ResetEvent(10)
+    queue.add(later)
+    queue.add(ResetEvent(0))
+
+    assert queue.pop_first().clock == 0
+    assert queue.pop_first() is later
+
+
+def test_clear_forgets_pending_events() -> None:
+    queue = EventQueue()
+    queue.add(ResetEvent(5))
+    queue.clear()
+
+    assert queue.isEmpty()
+    queue.add(ResetEvent(5))
+    assert queue.first().clock == 5
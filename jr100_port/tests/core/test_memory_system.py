@@ -8,6 +8,7 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from jr100_port.core.memory import MemorySystem, UnmappedMemory
+from jr100_port.devices.memory_blocks import MainRam, ROM, VideoRam
 
 
 class DummyMemory:
@@ -105,3 +106,168 @@ def test_get_memory_returns_none_when_missing() -> None:
     memory.allocateSpace(0x100)
     assert memory.getMemory(UnmappedMemory) is not None
     assert memory.getMemory(DummyMemory) is None
+
+
+def test_access_without_allocation_raises() -> None:
+    memory = MemorySystem()
+    with pytest.raises(RuntimeError):
+        memory.load8(0x0000)
+    with pytest.raises(RuntimeError):
+        memory.store8(0x0000, 0x12)
+
+
+def test_debug_toggle_traces_accesses(capsys) -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    dummy = DummyMemory(0x2000, 0x10)
+    memory.registMemory(dummy)
+
+    memory.debug = True
+    memory.store8(0x2001, 0x5A)
+    assert memory.load8(0x2001) == 0x5A
+    assert "store8: addr=2001 val=5A" in capsys.readouterr().out
+
+    memory.debug = False
+    assert memory.load8(0x2001) == 0x5A
+    assert capsys.readouterr().out == ""
+
+
+def test_bound_storage_is_served_from_flat_buffer() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    ram = MainRam(0x0000, 0x1000)
+    ram.store8(0x0010, 0x77)
+    rom = ROM(0xE000, 0x100)
+    rom.data[0] = 0x39
+    memory.registMemory(ram)
+    memory.registMemory(rom)
+
+    assert memory.load8(0x0010) == 0x77
+    memory.store8(0x0020, 0x12)
+    assert memory.mem[0x0020] == 0x12
+    assert ram.load8(0x0020) == 0x12
+
+    memory.store8(0xE000, 0xFF)
+    assert memory.load8(0xE000) == 0x39
+    assert memory.load8(0xD000) == 0xAA and memory._mmio_load[0xD0]
+    assert not memory._mmio_load[0x00] and not memory._mmio_store[0x00]
+    assert not memory._mmio_load[0xE0] and memory._mmio_store[0xE0]
+
+
+def test_partial_page_falls_back_to_dispatch() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    dummy = DummyMemory(0x2000, 0x10)
+    memory.registMemory(dummy)
+
+    assert memory._mmio_load[0x20] and memory._mmio_store[0x20]
+    memory.store8(0x2010, 0x99)
+    assert memory.load8(0x2010) == 0x00
+    assert memory.load8(0x2001) == 0x55
+
+
+def test_word_access_spanning_direct_and_dispatched_pages() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    memory.registMemory(MainRam(0x0000, 0x1000))
+    dummy = DummyMemory(0x1000, 0x100)
+    memory.registMemory(dummy)
+
+    memory.store16(0x0FFF, 0xBEEF)
+    assert memory.mem[0x0FFF] == 0xBE
+    assert dummy.bytes[0x1000] == 0xEF
+    assert memory.load16(0x0FFF) == 0xBEEF
+    memory.store16(0x0100, 0x1234)
+    assert memory.load16(0x0100) == 0x1234
+    assert memory.load16(0xFFFF) == 0x0000
+
+
+def test_misaligned_component_shares_page_with_neighbours() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    ram = MainRam(0x5000, 0x100)
+    memory.registMemory(ram)
+    io = DummyMemory(0x5040, 0x10)
+    memory.registMemory(io)
+
+    memory.store8(0x5000, 0x11)
+    memory.store8(0x5045, 0x22)
+    memory.store8(0x5050, 0x33)
+    assert ram.load8(0x5000) == 0x11 and ram.load8(0x5050) == 0x33
+    assert io.bytes == {0x5045: 0x22}
+    assert memory.load8(0x5041) == 0x55
+    assert memory.load8(0x5050) == 0x33
+
+    memory.registMemory(MainRam(0x5000, 0x100))
+    assert not memory._mmio_load[0x50]
+
+
+def test_debug_flags_every_page_in_place() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    memory.registMemory(MainRam(0x0000, 0x1000))
+    flags = memory.mmio_load
+
+    memory.debug = True
+    assert memory.mmio_load is flags and all(flags)
+
+    memory.debug = False
+    assert not flags[0x00] and flags[0xD0]
+
+
+class FontListener:
+    def __init__(self, font_updates: bool) -> None:
+        self.font_updates = font_updates
+        self.updates: list[tuple[int, int, int]] = []
+
+    def update_font(self, char_index: int, row: int, value: int) -> None:
+        self.updates.append((char_index, row, value))
+
+
+@pytest.mark.parametrize("font_updates", [True, False])
+def test_refresh_memory_follows_display_hooks(font_updates: bool) -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    video = VideoRam(0xC100, 0x100, None)
+    memory.registMemory(video)
+    assert memory.mmio_store[0xC1]
+
+    display = FontListener(font_updates)
+    video.set_display(display)
+    memory.refresh_memory(video)
+    memory.store8(0xC108, 0x42)
+
+    assert bool(memory.mmio_store[0xC1]) is font_updates
+    assert not memory.mmio_load[0xC1]
+    assert memory.load8(0xC108) == 0x42
+    assert display.updates == ([(0x21, 0, 0x42)] if font_updates else [])
+
+
+def test_stores_flag_dirty_pages() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    memory.registMemory(MainRam(0x0000, 0x8000))
+    dirty = memory.dirty_pages
+    assert all(dirty)
+
+    dirty[:] = bytes(0x100)
+    memory.store8(0x1234, 0x56)
+    memory.store16(0x20FF, 0xBEEF)
+    memory.store8(0xE000, 0x00)
+    assert [page for page in range(0x100) if dirty[page]] == [0x12, 0x20, 0x21, 0xE0]
+
+
+def test_rom_stores_are_dropped_without_dirtying() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    rom = ROM(0xE000, 0x2000)
+    rom.data[0x10] = 0x7E
+    memory.registMemory(rom)
+    dirty = memory.dirty_pages
+
+    dirty[:] = bytes(0x100)
+    memory.store8(0xE010, 0x00)
+    memory.store16(0xFFFE, 0x1234)
+    assert memory.load8(0xE010) == 0x7E
+    assert memory.load16(0xFFFE) == 0x0000
+    assert not any(dirty)
@@ -1,5 +1,6 @@
 import sys
 from pathlib import Path
+from types import MethodType
 
 import pytest
 
@@ -7,7 +8,11 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-from jr100_port.cpu.mb8861 import MB8861  # noqa: E402
+from jr100_port.core.memory import MemorySystem  # noqa: E402
+from jr100_port.cpu.blocks import BlockCache  # noqa: E402
+from jr100_port.cpu.instructions import AddressingMode  # noqa: E402
+from jr100_port.cpu.mb8861 import MB8861, UndefinedOpcodeError  # noqa: E402
+from jr100_port.devices.memory_blocks import MainRam  # noqa: E402
 
 
 class DummyMemory:
@@ -21,6 +26,21 @@ class DummyMemory:
         self.data[address & 0xFFFF] = value & 0xFF
 
 
+def flat_memory(data: bytes) -> MemorySystem:
+    # Plain RAM everywhere, so execute() decodes from the flat image.
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    memory.registMemory(MainRam(0x0000, 0x10000))
+    memory.mem[:] = data
+    return memory
+
+
+@pytest.fixture(autouse=True)
+def eager_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The programs here are short, so compile blocks on their first visit.
+    monkeypatch.setattr(BlockCache, "HOT_VISITS", 1)
+
+
 @pytest.fixture()
 def cpu() -> MB8861:
     memory = DummyMemory(bytes([0x00] * 0x10000))
@@ -811,6 +831,68 @@ def test_wai_resumes_on_irq(cpu: MB8861) -> None:
     assert cpu.sp == 0x1FF8
 
 
+@pytest.mark.parametrize("stack", [0x1FFE, 0x0203])
+def test_swi_frame_in_flat_ram_round_trips(stack: int) -> None:
+    data = bytearray(0x10000)
+    data[0x0100] = 0x3F
+    data[0xFFFA : 0xFFFC] = b"\x20\x00"
+    data[0x2000] = 0x3B
+    memory = flat_memory(bytes(data))
+    cpu = MB8861(memory)
+    cpu.pc = 0x0100
+    cpu.sp = stack
+    cpu.a, cpu.b, cpu.ix = 0x11, 0x22, 0x3344
+    cpu.ccr = 0xE5
+
+    cpu.step()
+
+    assert cpu.sp == stack - 7
+    assert memory.mem[stack - 6 : stack + 1] == bytes([0xE5, 0x22, 0x11, 0x33, 0x44, 0x01, 0x01])
+    assert memory.dirty_pages[(stack - 6) >> 8] and memory.dirty_pages[stack >> 8]
+
+    cpu.step()
+
+    assert (cpu.pc, cpu.sp, cpu.a, cpu.b, cpu.ix, cpu.ccr) == (
+        0x0101,
+        stack,
+        0x11,
+        0x22,
+        0x3344,
+        0xE5,
+    )
+
+
+def test_swi_frame_wrapping_the_address_space_round_trips() -> None:
+    data = bytearray(0x10000)
+    data[0x0100] = 0x3F
+    data[0xFFFA : 0xFFFC] = b"\x20\x00"
+    data[0x2000] = 0x3B
+    memory = flat_memory(bytes(data))
+    cpu = MB8861(memory)
+    cpu.pc = 0x0100
+    cpu.sp = 0x0002
+    cpu.a, cpu.b, cpu.ix = 0x11, 0x22, 0x3344
+    cpu.ccr = 0xE5
+
+    cpu.step()
+
+    assert cpu.sp == 0xFFFB
+    assert memory.mem[0xFFFC:] + memory.mem[:0x0003] == bytes(
+        [0xE5, 0x22, 0x11, 0x33, 0x44, 0x01, 0x01]
+    )
+
+    cpu.step()
+
+    assert (cpu.pc, cpu.sp, cpu.a, cpu.b, cpu.ix, cpu.ccr) == (
+        0x0101,
+        0x0002,
+        0x11,
+        0x22,
+        0x3344,
+        0xE5,
+    )
+
+
 def test_swi_pushes_registers_and_sets_vector(cpu: MB8861) -> None:
     cpu.pc = 0x0100
     cpu.sp = 0x1FFF
@@ -1384,6 +1466,25 @@ def test_adx_immediate_wraps_to_zero(cpu: MB8861) -> None:
     assert cycles == 3
 
 
+def test_register_arithmetic_wraps_at_width(cpu: MB8861) -> None:
+    # INCA, DECB, INX, DES, PSHA, ADDA #$01, then NOP at $FFFF wraps the PC.
+    program = bytes.fromhex("4C" "5A" "08" "34" "36" "8B01")
+    cpu.memory.data[0xFFF8 : 0xFFF8 + len(program)] = program
+    cpu.memory.data[0xFFFF] = 0x01
+    cpu.pc = 0xFFF8
+    cpu.a = 0xFF
+    cpu.b = 0x00
+    cpu.ix = 0xFFFF
+    cpu.sp = 0x0001
+
+    for _ in range(7):
+        cpu.step()
+
+    assert (cpu.pc, cpu.a, cpu.b, cpu.ix, cpu.sp) == (0x0000, 0x01, 0xFF, 0x0000, 0xFFFF)
+    assert cpu.memory.data[0x0000] == 0x00
+    assert cpu.cc is False
+
+
 def test_adx_extended_adds_absolute_word(cpu: MB8861) -> None:
     cpu.ix = 0x1234
     cpu.memory.data[0x0000] = 0xFC
@@ -2288,3 +2389,313 @@ def test_rti_pops_registers(cpu: MB8861) -> None:
     assert cpu.ch is True
     assert cpu.sp == 0x1FF7
     assert cycles == 10
+
+
+def test_masked_irq_is_taken_after_cli(cpu: MB8861) -> None:
+    cpu.sp = 0x1FFF
+    cpu.ci = True
+    cpu.memory.data[0x0000] = 0x01  # NOP
+    cpu.memory.data[0x0001] = 0x0E  # CLI
+    cpu.memory.data[0xFFF8] = 0x01
+    cpu.memory.data[0xFFF9] = 0x20  # IRQ -> 0x0120
+    cpu.memory.data[0x0120] = 0x01  # NOP
+
+    cpu.request_irq()
+    cpu.step()
+    cpu.step()
+
+    assert cpu.pc == 0x0002
+
+    cycles = cpu.step()
+
+    assert cpu.pc == 0x0120
+    assert cycles == 12
+
+    cpu.step()
+
+    assert cpu.pc == 0x0121
+
+
+def test_flat_ram_and_dispatched_pages_through_memory_system() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    memory.registMemory(MainRam(0x0000, 0x2000))
+    io = DummyMemory(bytes(0x10000))
+    io.getStartAddress = lambda: 0x2000  # type: ignore[attr-defined]
+    io.getEndAddress = lambda: 0x20FF  # type: ignore[attr-defined]
+    memory.registMemory(io)
+    io.data[0x2001] = 0x5A
+    program = bytes([0x86, 0x42, 0xB7, 0x20, 0x00, 0xF6, 0x20, 0x01, 0x36])
+    memory.mem[0x0100 : 0x0100 + len(program)] = program
+    cpu = MB8861(memory)
+    cpu.pc = 0x0100
+    cpu.sp = 0x01FF
+
+    for _ in range(4):
+        cpu.step()
+
+    assert io.data[0x2000] == 0x42
+    assert cpu.b == 0x5A
+    assert memory.load8(0x01FF) == 0x42
+
+
+def test_debug_toggle_reaches_a_cpu_driven_by_step(capsys: pytest.CaptureFixture[str]) -> None:
+    memory = flat_memory(bytes(0x10000))
+    memory.mem[0x0100:0x0103] = bytes([0x86, 0x42, 0x01])  # LDAA #$42; NOP
+    cpu = MB8861(memory)
+    cpu.pc = 0x0100
+
+    memory.debug = True
+    cpu.step()
+    memory.debug = False
+
+    assert cpu.a == 0x42
+    out = capsys.readouterr().out
+    assert "load8: addr=0100 val=86" in out
+    assert "load8: addr=0101 val=42" in out
+
+    cpu.step()
+    assert capsys.readouterr().out == ""
+
+
+def test_decoder_lookup_rebuilds_metadata(cpu: MB8861) -> None:
+    decoder = cpu._decoder
+
+    instruction = decoder.lookup(0xB6)
+
+    assert (instruction.name, instruction.cycles) == ("LDAA", 4)
+    assert decoder.handlers[0xB6] is instruction.handler
+    assert decoder.handlers[0x00] is None
+    with pytest.raises(KeyError):
+        decoder.lookup(0x00)
+
+
+def test_execute_matches_stepwise_reference() -> None:
+    # LDX #$2000; LDAB #$10; loop: LDAA ,X; ADDA #1; STAA ,X; INX; DECB; BNE loop;
+    # BSR sub; JMP $1000; sub: LDAA $10; INCA; STAA $10; RTS
+    program = bytes.fromhex("CE2000C610A6008B01A700085A26F68D037E100096104C971039")
+    data = bytearray(0x10000)
+    data[0x1000 : 0x1000 + len(program)] = program
+    fast = MB8861(flat_memory(data))
+    reference = MB8861(DummyMemory(bytes(data)))
+    for target in (fast, reference):
+        target.pc = 0x1000
+        target.sp = 0x01FF
+
+    assert fast.execute(2000) == reference._execute_stepwise(2000)
+    assert (fast.pc, fast.a, fast.b, fast.ix, fast.sp, fast.ccr) == (
+        reference.pc,
+        reference.a,
+        reference.b,
+        reference.ix,
+        reference.sp,
+        reference.ccr,
+    )
+    assert fast.memory.mem == reference.memory.data
+
+
+def test_only_wai_and_swi_run_outside_the_generated_loop(cpu: MB8861) -> None:
+    decoder = cpu._decoder
+    registered = {opcode for opcode, handler in enumerate(decoder.handlers) if handler}
+    templated = {opcode for opcode, source in enumerate(decoder.templates) if source is not None}
+
+    assert registered - templated == {0x3E, 0x3F}
+
+
+def test_dispatch_calls_plain_bound_methods(cpu: MB8861) -> None:
+    assert all(type(handler) is MethodType for handler in cpu._dispatch)
+    assert cpu._dispatch[0x86].__defaults__ == (AddressingMode.IMMEDIATE, 2)
+
+
+def test_execute_matches_stepwise_for_arithmetic_and_shifts() -> None:
+    program = bytes.fromhex(
+        "8699"  # LDAA #$99
+        "8927"  # ADCA #$27
+        "19"  # DAA
+        "49"  # ROLA
+        "56"  # RORB
+        "780020"  # ASL $0020
+        "6421"  # LSR $21,X
+        "700022"  # NEG $0022
+        "730023"  # COM $0023
+        "C201"  # SBCB #$01
+        "8C8000"  # CPX #$8000
+        "ECF0"  # ADX #$F0
+        "7B0F20"  # TMM #$0F,$20,X
+        "75FF21"  # XIM #$FF,$21,X
+        "07"  # TPA
+        "06"  # TAP
+        "20FE"  # BRA *
+    )
+    data = bytearray(0x10000)
+    data[0x1000 : 0x1000 + len(program)] = program
+    data[0x0020:0x0024] = bytes([0x81, 0x03, 0x80, 0x5A])
+    fast = MB8861(flat_memory(data))
+    reference = MB8861(DummyMemory(bytes(data)))
+    for target in (fast, reference):
+        target.pc = 0x1000
+        target.b = 0x01
+        target.ix = 0x0000
+
+    assert fast.execute(120) == reference._execute_stepwise(120)
+    assert (fast.pc, fast.a, fast.b, fast.ix, fast.sp, fast.ccr) == (
+        reference.pc,
+        reference.a,
+        reference.b,
+        reference.ix,
+        reference.sp,
+        reference.ccr,
+    )
+    assert fast.memory.mem == reference.memory.data
+
+
+def test_execute_decodes_instructions_across_page_ends() -> None:
+    memory = MemorySystem()
+    memory.allocateSpace(0x10000)
+    memory.registMemory(MainRam(0x0000, 0x8000))
+    # LDX #$1234 straddles $10FF/$1100; LDAA #$56; BRA *
+    memory.mem[0x10FE:0x1105] = bytes.fromhex("CE1234865620FE")
+    cpu = MB8861(memory)
+    cpu.pc = 0x10FE
+
+    cpu.execute(5)
+
+    assert cpu.ix == 0x1234
+    assert cpu.a == 0x56
+    assert cpu.pc == 0x1103
+
+
+def test_undefined_opcode_traps_in_step_and_execute(cpu: MB8861) -> None:
+    cpu.memory.data[0x0200] = 0x01
+    cpu.memory.data[0x0201] = 0x02
+    cpu.pc = 0x0200
+
+    with pytest.raises(UndefinedOpcodeError) as excinfo:
+        cpu.execute(10)
+
+    assert (excinfo.value.opcode, excinfo.value.address) == (0x02, 0x0201)
+    cpu.pc = 0x0201
+    with pytest.raises(UndefinedOpcodeError):
+        cpu.step()
+
+
+class CountingMemory(DummyMemory):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads: list[int] = []
+
+    def load8(self, address: int) -> int:
+        self.reads.append(address & 0xFFFF)
+        return super().load8(address)
+
+
+def test_undefined_opcode_trap_reports_the_fetched_byte_without_rereading() -> None:
+    memory = CountingMemory(bytes(0x10000))
+    memory.data[0x0300] = 0x02
+    cpu = MB8861(memory)
+    cpu.pc = 0x0300
+    memory.reads.clear()
+
+    with pytest.raises(UndefinedOpcodeError) as excinfo:
+        cpu.step()
+
+    assert (excinfo.value.opcode, excinfo.value.address) == (0x02, 0x0300)
+    assert memory.reads == [0x0300]
+
+
+def test_execute_keeps_n_and_z_exact_through_tap_and_inx() -> None:
+    program = bytes.fromhex(
+        "860C"  # LDAA #$0C (N and Z together)
+        "06"  # TAP
+        "2B00"  # BMI +0
+        "2700"  # BEQ +0
+        "CEFFFF"  # LDX #$FFFF
+        "08"  # INX (Z set, N kept)
+        "07"  # TPA
+        "36"  # PSHA
+        "20FE"  # BRA *
+    )
+    data = bytearray(0x10000)
+    data[0x1000 : 0x1000 + len(program)] = program
+    fast = MB8861(flat_memory(data))
+    reference = MB8861(DummyMemory(bytes(data)))
+    for target in (fast, reference):
+        target.pc = 0x1000
+        target.sp = 0x01FF
+
+    assert fast.execute(40) == reference._execute_stepwise(40)
+    assert (fast.pc, fast.a, fast.ix, fast.sp, fast.ccr) == (
+        reference.pc,
+        reference.a,
+        reference.ix,
+        reference.sp,
+        reference.ccr,
+    )
+    assert fast.memory.mem[0x01FF] == reference.memory.data[0x01FF]
+
+
+def test_execute_blocks_see_self_modified_code() -> None:
+    program = bytes.fromhex(
+        "4C"  # INCA
+        "B71005"  # STAA $1005 (rewrites the LDAB operand)
+        "C600"  # LDAB #$00
+        "20F8"  # BRA $1000
+    )
+    data = bytearray(0x10000)
+    data[0x1000 : 0x1000 + len(program)] = program
+    fast = MB8861(flat_memory(data))
+    reference = MB8861(DummyMemory(bytes(data)))
+    for target in (fast, reference):
+        target.pc = 0x1000
+
+    # Small budgets stop inside the loop body, large ones run it as a block.
+    for clocks in (7, 3, 11, 20, 5, 40, 2, 9, 100, 300):
+        assert fast.execute(clocks) == reference._execute_stepwise(clocks)
+        assert (fast.pc, fast.a, fast.b, fast.ccr) == (
+            reference.pc,
+            reference.a,
+            reference.b,
+            reference.ccr,
+        )
+    assert fast.memory.mem[0x1005] == reference.memory.data[0x1005]
+
+
+def test_execute_rechecks_blocks_after_external_writes() -> None:
+    program = bytes.fromhex(
+        "4C"  # INCA
+        "C601"  # LDAB #$01
+        "20FB"  # BRA $1000
+    )
+    data = bytearray(0x10000)
+    data[0x1000 : 0x1000 + len(program)] = program
+    memory = flat_memory(data)
+    cpu = MB8861(memory)
+    cpu.pc = 0x1000
+    cpu.execute(100)
+    assert not memory.dirty_pages[0x10]
+
+    memory.store8(0x1002, 0x7F)
+    cpu.execute(100)
+
+    assert cpu.b == 0x7F
+
+
+def test_execute_compiles_blocks_once_hot(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(BlockCache, "HOT_VISITS", 3)
+    program = bytes.fromhex(
+        "4C"  # INCA
+        "5C"  # INCB
+        "20FC"  # BRA $1000
+    )
+    data = bytearray(0x10000)
+    data[0x1000 : 0x1000 + len(program)] = program
+    cpu = MB8861(flat_memory(data))
+    cpu.pc = 0x1000
+    slot = 0x1000 & BlockCache.MASK
+
+    cpu.execute(16)
+    assert cpu._blocks.slots[slot][0] != 0x1000
+
+    cpu.execute(8)
+    assert cpu._blocks.slots[slot][0] == 0x1000
+    assert (cpu.a, cpu.b) == (3, 3)
@@ -0,0 +1,26 @@
+from jr100_port.devices import Beeper
+
+
+class RecordingBackend:
+    def __init__(self) -> None:
+        self.states: list[tuple[bool, float]] = []
+
+    def set_state(self, enabled: bool, frequency: float) -> None:
+        self.states.append((enabled, frequency))
+
+
+def test_backend_only_sees_audible_changes() -> None:
+    beeper = Beeper(None, 44_100)
+    backend = RecordingBackend()
+    beeper._backend = backend
+
+    beeper.setFrequency(0, 440.2)
+    beeper.setLineOn()
+    beeper.execute()
+    beeper.setFrequency(0, 440.4)
+    beeper.setFrequency(0, 523.3)
+    beeper.execute()
+    beeper.setLineOff()
+    beeper.setLineOff()
+
+    assert backend.states == [(True, 440.2), (True, 523.3), (False, 523.3)]
@@ -0,0 +1,81 @@
+import pytest
+
+from jr100_port.devices import ExtendedIOPort, MainRam, UserDefinedCharacterRam, VideoRam
+
+
+def test_ram_word_access_is_big_endian() -> None:
+    ram = MainRam(0x1000, 0x100)
+
+    ram.store16(0x1010, 0xBEEF)
+
+    assert ram.load8(0x1010) == 0xBE
+    assert ram.load8(0x1011) == 0xEF
+    assert ram.load16(0x1010) == 0xBEEF
+
+
+@pytest.mark.parametrize("address", [0x0FFF, 0x1100, 0x0000, 0xFFFF])
+def test_ram_rejects_addresses_outside_its_range(address: int) -> None:
+    ram = MainRam(0x1000, 0x100)
+
+    with pytest.raises(IndexError):
+        ram.load8(address)
+    with pytest.raises(IndexError):
+        ram.store8(address, 0)
+
+
+def test_ram_word_access_across_the_end_checks_the_second_byte() -> None:
+    ram = MainRam(0x1000, 0x100)
+    ram.store8(0x10FF, 0x12)
+
+    with pytest.raises(IndexError):
+        ram.load16(0x10FF)
+    with pytest.raises(IndexError):
+        ram.store16(0x10FF, 0x3456)
+
+
+class FontListener:
+    def __init__(self) -> None:
+        self.updates: list[tuple[int, int, int]] = []
+
+    def update_font(self, char_index: int, row: int, value: int) -> None:
+        self.updates.append((char_index, row, value))
+
+
+def test_user_defined_ram_reports_each_stored_byte() -> None:
+    display = FontListener()
+    ram = UserDefinedCharacterRam(0xC000, 0x100, display)
+
+    ram.store16(0xC017, 0x1234)
+    ram.store8(0xC020, 0x56)
+
+    assert display.updates == [(2, 7, 0x12), (3, 0, 0x34), (4, 0, 0x56)]
+    assert ram.load16(0xC017) == 0x1234
+
+
+def test_video_ram_reports_font_rows_past_the_user_defined_area() -> None:
+    display = FontListener()
+    ram = VideoRam(0xC100, 0x300, display)
+
+    ram.store16(0xC107, 0xABCD)
+    ram.store8(0xC100, 0x01)
+
+    assert display.updates == [(0x20, 7, 0xAB), (0x21, 0, 0xCD), (0x20, 0, 0x01)]
+
+
+class FixedGamepad:
+    def to_byte(self) -> int:
+        return 0x5A
+
+
+def test_extended_io_port_words_match_the_byte_view() -> None:
+    port = ExtendedIOPort(None, 0xCC00)
+
+    port.store16(0xCC01, 0x1234)
+
+    assert port.gamepad_status == 0x34
+    assert port.load16(0xCC01) == 0x0034
+    assert port.load16(0xCC02) == 0x3400
+
+    port.set_gamepad_state(FixedGamepad())
+
+    assert port.load16(0xCC01) == 0x005A
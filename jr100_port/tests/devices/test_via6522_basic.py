@@ -209,3 +209,78 @@ def test_jr100_timer1_sets_sound_frequency() -> None:
     via.store8(base + Via6522.VIA_REG_ACR, 0x00)
     via.store8(base + Via6522.VIA_REG_T1CH, 0x00)
     assert sound.line_state[-1] is False
+
+
+def _snapshot(via: Via6522) -> tuple[int, ...]:
+    return (
+        via.ifr,
+        via.timer1,
+        via.timer2,
+        via.inputPortB(),
+        via.ca2_out,
+        via.ca2_timer,
+        via.current_clock,
+    )
+
+
+@pytest.mark.parametrize("cls", [Via6522, JR100Via6522])
+@pytest.mark.parametrize("acr", [0x00, 0x40, 0xC0, 0x20])
+def test_one_long_execute_matches_single_cycles(cls: type[Via6522], acr: int) -> None:
+    devices = [make_device(cls) for _ in range(2)]
+    for via, _ in devices:
+        base = via.start_address
+        via.store8(base + Via6522.VIA_REG_ACR, acr)
+        via.store8(base + Via6522.VIA_REG_PCR, 0x08)
+        via.store8(base + Via6522.VIA_REG_IER, 0xFF)
+        via.store8(base + Via6522.VIA_REG_T2CL, 0x05)
+        via.store8(base + Via6522.VIA_REG_T2CH, 0x00)
+        via.store8(base + Via6522.VIA_REG_T1CL, 0x21)
+        via.store8(base + Via6522.VIA_REG_T1CH, 0x00)
+        via.load8(base + Via6522.VIA_REG_IORA)
+    (stepped, stepped_computer), (batched, batched_computer) = devices
+
+    for _ in range(3000):
+        stepped_computer.advance(1)
+        stepped.execute()
+    batched_computer.advance(3000)
+    batched.execute()
+
+    assert _snapshot(batched) == _snapshot(stepped)
+    stepped_sound = stepped_computer.getHardware().getSoundProcessor()
+    batched_sound = batched_computer.getHardware().getSoundProcessor()
+    assert batched_sound.frequency_calls == stepped_sound.frequency_calls
+    assert batched_sound.line_state[-1:] == stepped_sound.line_state[-1:]
+
+
+@pytest.mark.parametrize("pcr, active", [(0x00, 0), (0x01, 1)])
+def test_ca1_edge_follows_pcr_writes(via: Via6522, pcr: int, active: int) -> None:
+    base = via.start_address
+    via.setCA1(active ^ 1)
+    via.store8(base + Via6522.VIA_REG_PCR, pcr)
+    via.store8(base + Via6522.VIA_REG_IFR, Via6522.IFR_BIT_CA1)
+
+    via.setCA1(active)
+    assert via.ifr & Via6522.IFR_BIT_CA1
+
+    via.store8(base + Via6522.VIA_REG_IFR, Via6522.IFR_BIT_CA1)
+    via.setCA1(active ^ 1)
+    assert not via.ifr & Via6522.IFR_BIT_CA1
+
+
+@pytest.mark.parametrize("latch", [0x00, 0x01, 0x05, 0x10])
+def test_timer1_interrupt_is_seen_on_the_same_poll(latch: int) -> None:
+    via, computer = make_device(Via6522)
+    base = via.start_address
+    via.store8(base + Via6522.VIA_REG_IER, 0xC0)
+    computer.advance(1)
+    via.store8(base + Via6522.VIA_REG_T1CL, latch)
+    computer.advance(1)
+    via.store8(base + Via6522.VIA_REG_T1CH, 0x00)
+
+    polls = 0
+    while not via.load8(base + Via6522.VIA_REG_IFR) & Via6522.IFR_BIT_T1:
+        computer.advance(1)
+        polls += 1
+
+    assert polls == latch + 3
+    assert via.ifr & Via6522.IFR_BIT_IRQ
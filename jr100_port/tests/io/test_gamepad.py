@@ -0,0 +1,24 @@
+from jr100_port.io.gamepad import GamepadState
+
+
+def test_constructor_flags_pack_into_the_port_byte() -> None:
+    assert GamepadState().to_byte() == 0x00
+    assert GamepadState(right=True).to_byte() == 0x01
+    assert GamepadState(left=True, down=True).to_byte() == 0x0A
+    assert GamepadState(True, True, True, True, True).to_byte() == 0x1F
+
+
+def test_flags_round_trip_through_the_packed_state() -> None:
+    state = GamepadState(up=True)
+    state.set_direction(right=True, up=False)
+    state.set_button(True)
+
+    assert state.to_byte() == 0x11
+    assert state == GamepadState(right=True, button=True)
+    assert repr(state) == (
+        "GamepadState(right=True, left=False, up=False, down=False, button=True)"
+    )
+
+    state.clear()
+    assert state.to_byte() == 0x00
+    assert not state.right and not state.button
@@ -49,6 +49,23 @@ def test_via_mapping(machine: JR100Machine) -> None:
     assert machine.via.orb == 0x12
 
 
+def test_video_memory_is_stored_directly(machine: JR100Machine) -> None:
+    memory = machine.getHardware().getMemory()
+    assert not any(memory.mmio_store[0xC0:0xC4])
+    memory.store8(0xC100, 0x41)
+    assert memory.load8(0xC100) == 0x41
+
+
+def test_user_glyph_reads_stored_rows(machine: JR100Machine) -> None:
+    memory = machine.getHardware().getMemory()
+    for line in range(8):
+        memory.store8(0xC008 + line, 0x10 + line)
+    machine.display.setCurrentFont(machine.display.FONT_USER_DEFINED)
+    glyph, inverted, _, _ = machine.display.resolve_glyph(0x81)
+    assert glyph.rows == tuple(range(0x10, 0x18))
+    assert not inverted
+
+
 def test_devices_registered(machine: JR100Machine) -> None:
     device_types = {device.__class__.__name__ for device in machine.getDevices()}
     assert {"JR100Via6522", "JR100Keyboard", "JR100Display", "Beeper"}.issubset(device_types)
@@ -90,3 +107,16 @@ def test_gamepad_state_updates_extended_io(tmp_path: Path) -> None:
     assert memory.load8(0xCC02) & 0x01 == 0x01
     gamepad.set_direction(right=False, left=True)
     assert memory.load8(0xCC02) & 0x02 == 0x02
+
+
+def test_via_scans_the_live_key_matrix(machine: JR100Machine) -> None:
+    memory = machine.getHardware().getMemory()
+    keyboard = machine.keyboard
+
+    keyboard.set_key_state(3, 1, True)
+    keyboard.reset()
+    keyboard.loadState({"keyboard.matrix": [0x00] * 3 + [0x04]})
+    memory.store8(0xC801, 0x03)
+
+    assert machine.via.inputPortB() & 0x1F == 0x1B
+    assert len(keyboard.matrix) == 16
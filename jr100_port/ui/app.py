@@ -86,6 +86,7 @@ class JR100App:
 
         running = True
         cpu = machine.getCPU()
+        step = cpu.step
         via = machine.via
         base_width, base_height = self._base_size
         scale = max(1, self._config.scale)
@@ -103,13 +104,16 @@ class JR100App:
                     self._handle_key_event(event, False)
 
             cycle_accumulator += target_cycles
-            executed_cycles = 0
+            # The VIA catches up to the machine clock whenever the CPU touches
+            # it, so the clock still advances per instruction, but as a plain
+            # attribute update rather than a get/set call pair.
+            clock_count = machine.clockCount
             while cycle_accumulator > 0:
-                consumed = cpu.step()
+                consumed = step()
                 if consumed <= 0:
                     break
-                executed_cycles += consumed
-                machine.setClockCount(machine.getClockCount() + consumed)
+                clock_count += consumed
+                machine.clockCount = clock_count
                 cycle_accumulator -= consumed
             if cycle_accumulator < -target_cycles:
                 cycle_accumulator = -target_cycles
@@ -315,12 +319,14 @@ class JR100App:
             font_obj = self._overlay_font[1]
 
         cpu = machine.getCPU()
+        flags = " ".join(
+            f"{name}{(cpu.ccr >> bit) & 1}" for name, bit in zip("HINZVC", range(5, -1, -1))
+        )
         lines = [
             f"PC {cpu.pc:04X}",
             f"SP {cpu.sp:04X} IX {cpu.ix:04X}",
             f"A {cpu.a:02X} B {cpu.b:02X}",
-            "Flags "
-            f"H{int(cpu.ch)} I{int(cpu.ci)} N{int(cpu.cn)} Z{int(cpu.cz)} V{int(cpu.cv)} C{int(cpu.cc)}",
+            f"Flags {flags}",
         ]
 
         color = (0, 255, 0)